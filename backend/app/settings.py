@@ -51,6 +51,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'weather.metrics.metrics_middleware',
     'corsheaders.middleware.CorsMiddleware',
 
     'django.middleware.security.SecurityMiddleware',
@@ -145,6 +146,86 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 WEATHER_API_KEY = os.getenv("WEATHER_API_KEY")
 
+# Cities polled by the ingestion task (comma-separated) and fetch concurrency
+WEATHER_CITIES = [
+    city.strip()
+    for city in os.getenv("WEATHER_CITIES", os.getenv("DEFAULT_CITY", "Boryspil")).split(",")
+    if city.strip()
+]
+WEATHER_FETCH_WORKERS = int(os.getenv("WEATHER_FETCH_WORKERS", "16"))
+
+# WeatherAPI HTTP session: connection pool, split timeouts and retry/backoff on 429/5xx
+WEATHER_API_POOL_CONNECTIONS = int(os.getenv("WEATHER_API_POOL_CONNECTIONS", "4"))
+WEATHER_API_POOL_SIZE = int(os.getenv("WEATHER_API_POOL_SIZE", str(WEATHER_FETCH_WORKERS)))
+WEATHER_API_CONNECT_TIMEOUT = float(os.getenv("WEATHER_API_CONNECT_TIMEOUT", "3.05"))
+WEATHER_API_READ_TIMEOUT = float(os.getenv("WEATHER_API_READ_TIMEOUT", "5"))
+WEATHER_API_MAX_RETRIES = int(os.getenv("WEATHER_API_MAX_RETRIES", "3"))
+WEATHER_API_BACKOFF_FACTOR = float(os.getenv("WEATHER_API_BACKOFF_FACTOR", "0.5"))
+WEATHER_API_BACKOFF_JITTER = float(os.getenv("WEATHER_API_BACKOFF_JITTER", "0.25"))
+
+# Client-side WeatherAPI rate limit (0 disables) shared through Redis when configured,
+# and the monthly quota (0 means unlimited) spread over polling intervals
+WEATHER_API_RATE_LIMIT_PER_MINUTE = int(os.getenv("WEATHER_API_RATE_LIMIT_PER_MINUTE", "0"))
+WEATHER_API_RATE_LIMIT_BURST = int(os.getenv("WEATHER_API_RATE_LIMIT_BURST", "0"))
+WEATHER_API_RATE_LIMIT_REDIS_URL = os.getenv("WEATHER_API_RATE_LIMIT_REDIS_URL")
+WEATHER_API_RATE_LIMIT_WAIT = os.getenv("WEATHER_API_RATE_LIMIT_WAIT", "true").lower() == "true"
+WEATHER_API_RATE_LIMIT_TIMEOUT = float(os.getenv("WEATHER_API_RATE_LIMIT_TIMEOUT", "30"))
+WEATHER_API_MONTHLY_QUOTA = int(os.getenv("WEATHER_API_MONTHLY_QUOTA", "0"))
+
+# Rows per bulk INSERT when storing forecast/history hours
+WEATHER_HOURLY_BATCH_SIZE = int(os.getenv("WEATHER_HOURLY_BATCH_SIZE", "500"))
+
+# Monthly WeatherData partitions kept ready ahead of the current month (PostgreSQL)
+WEATHER_PARTITION_MONTHS_AHEAD = int(os.getenv("WEATHER_PARTITION_MONTHS_AHEAD", "3"))
+
+# Days raw readings are kept before being rolled into daily summaries (0 keeps them forever)
+WEATHER_RAW_RETENTION_DAYS = int(os.getenv("WEATHER_RAW_RETENTION_DAYS", "0"))
+
+# Polling interval and batch size used to spread a round's polls
+WEATHER_POLL_INTERVAL_SECONDS = int(os.getenv("WEATHER_POLL_INTERVAL_SECONDS", "900"))
+WEATHER_POLL_BATCH_SIZE = int(os.getenv("WEATHER_POLL_BATCH_SIZE", "50"))
+
+# Adaptive per-city scheduler: beat dispatches due cities every WEATHER_POLL_DISPATCH_SECONDS
+# to the Celery queues in WEATHER_POLL_SHARDS (consistent hashing; empty uses the default
+# queue). Intervals halve when pressure/temperature change faster than the swing rates
+# (per hour) and grow while stable, within the min/max bounds.
+WEATHER_POLL_SHARDS = [
+    shard.strip() for shard in os.getenv("WEATHER_POLL_SHARDS", "").split(",") if shard.strip()
+]
+WEATHER_POLL_DISPATCH_SECONDS = int(os.getenv("WEATHER_POLL_DISPATCH_SECONDS", "60"))
+WEATHER_POLL_MIN_INTERVAL_SECONDS = int(os.getenv("WEATHER_POLL_MIN_INTERVAL_SECONDS", "300"))
+WEATHER_POLL_MAX_INTERVAL_SECONDS = int(os.getenv("WEATHER_POLL_MAX_INTERVAL_SECONDS", "3600"))
+WEATHER_POLL_PRESSURE_SWING = float(os.getenv("WEATHER_POLL_PRESSURE_SWING", "1.0"))
+WEATHER_POLL_TEMPERATURE_SWING = float(os.getenv("WEATHER_POLL_TEMPERATURE_SWING", "2.0"))
+
+# WeatherAPI response cache TTLs in seconds per endpoint (0 disables caching)
+WEATHER_API_CACHE_ALIAS = os.getenv("WEATHER_API_CACHE_ALIAS", "default")
+WEATHER_API_CACHE_TTL = {
+    "current": int(os.getenv("WEATHER_API_CACHE_TTL_CURRENT", "300")),
+    "forecast": int(os.getenv("WEATHER_API_CACHE_TTL_FORECAST", "1800")),
+    "history": int(os.getenv("WEATHER_API_CACHE_TTL_HISTORY", "86400")),
+}
+
+
+# Cache: local memory by default, Redis when CACHE_REDIS_URL is set
+if os.getenv("CACHE_REDIS_URL"):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv("CACHE_REDIS_URL"),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Weather API response cache (invalidated per city when readings are stored)
+WEATHER_CACHE_ALIAS = os.getenv("WEATHER_CACHE_ALIAS", "default")
+WEATHER_CACHE_TIMEOUT = int(os.getenv("WEATHER_CACHE_TIMEOUT", "300"))
+
 
 # Settings Celery
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL")
@@ -153,9 +234,35 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers.DatabaseScheduler'
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 
+# Redis pub/sub for live reading events; defaults to the Celery broker when it is Redis
+WEATHER_EVENTS_REDIS_URL = os.getenv("WEATHER_EVENTS_REDIS_URL") or (
+    CELERY_BROKER_URL if (CELERY_BROKER_URL or "").startswith("redis") else None
+)
+WEATHER_EVENTS_CHANNEL = os.getenv("WEATHER_EVENTS_CHANNEL", "weather:readings")
+WEATHER_EVENTS_KEEPALIVE_SECONDS = int(os.getenv("WEATHER_EVENTS_KEEPALIVE_SECONDS", "15"))
+
+# Port of the Celery worker's own Prometheus endpoint (0 disables); the web app serves /metrics
+WEATHER_METRICS_WORKER_PORT = int(os.getenv("WEATHER_METRICS_WORKER_PORT", "0"))
+
 
 
 REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 100
 }
+
+# Page-size bounds for the weather API (`?page_size=`)
+WEATHER_PAGE_SIZE = int(os.getenv("WEATHER_PAGE_SIZE", str(REST_FRAMEWORK['PAGE_SIZE'])))
+WEATHER_MIN_PAGE_SIZE = int(os.getenv("WEATHER_MIN_PAGE_SIZE", "1"))
+WEATHER_MAX_PAGE_SIZE = int(os.getenv("WEATHER_MAX_PAGE_SIZE", "1000"))
+
+# Rows fetched from the server-side cursor and encoded per chunk by /api/weather/export/
+WEATHER_EXPORT_BATCH_SIZE = int(os.getenv("WEATHER_EXPORT_BATCH_SIZE", "5000"))
+
+# Admin changelist: counts above this use the planner's estimate instead of COUNT(*),
+# and filter choices that need a DISTINCT scan are cached for this many seconds
+WEATHER_ADMIN_EXACT_COUNT_LIMIT = int(os.getenv("WEATHER_ADMIN_EXACT_COUNT_LIMIT", "10000"))
+WEATHER_ADMIN_FACET_CACHE_TIMEOUT = int(os.getenv("WEATHER_ADMIN_FACET_CACHE_TIMEOUT", "3600"))
+
+# Default time range of /api/weather/aggregate/ when start is not given
+WEATHER_AGGREGATE_DEFAULT_DAYS = int(os.getenv("WEATHER_AGGREGATE_DEFAULT_DAYS", "7"))
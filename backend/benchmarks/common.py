@@ -0,0 +1,130 @@
+"""Shared helpers for the benchmark scripts.
+
+Benchmarks run against a throw-away test database created from the configured
+DATABASES settings, so they never read or modify real data.
+"""
+
+import contextlib
+import json
+import os
+import statistics
+import time
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+import django
+
+
+def setup_django():
+    """Configure Django for a standalone benchmark script."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "app.settings")
+    django.setup()
+
+
+@contextlib.contextmanager
+def benchmark_database(keepdb: bool = False):
+    """Create the test database for the duration of the block."""
+    from django.db import connection  # pylint: disable=import-outside-toplevel
+
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=keepdb)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=keepdb)
+
+
+def time_call(func, repeat: int) -> dict:
+    """Call `func` `repeat` times and return latency stats in milliseconds."""
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - started) * 1000)
+
+    durations.sort()
+    return {
+        "runs": repeat,
+        "min_ms": round(durations[0], 3),
+        "median_ms": round(statistics.median(durations), 3),
+        "p95_ms": round(durations[int(0.95 * (repeat - 1))], 3),
+        "max_ms": round(durations[-1], 3),
+    }
+
+
+SEED_START = datetime(2020, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def seed_city_name(index: int) -> str:
+    """Name of the n-th synthetic city used by seed_weather_rows()."""
+    return f"City {index}"
+
+
+def seed_hour(row: int, cities: int) -> datetime:
+    """Hour of the n-th synthetic row: cities share each hour, then time advances."""
+    return SEED_START + timedelta(hours=row // cities)
+
+
+def seed_weather_rows(rows: int, cities: int, batch_size: int = 10_000, start_row: int = 0) -> None:
+    """
+    Insert synthetic readings spread evenly over `cities` cities, one per hour.
+
+    Rows `start_row` to `rows - 1` are inserted, so a table seeded up to one
+    size can be grown to a larger one with the same data.
+    """
+    from django.db import connection  # pylint: disable=import-outside-toplevel
+    from weather.models import WeatherData  # pylint: disable=import-outside-toplevel
+
+    if connection.vendor == "postgresql":
+        _seed_postgres(connection, WeatherData._meta.db_table, rows, cities, start_row)
+        return
+
+    for start in range(start_row, rows, batch_size):
+        batch = []
+        for row in range(start, min(start + batch_size, rows)):
+            hour = seed_hour(row, cities)
+            city = seed_city_name(row % cities)
+            batch.append(WeatherData(
+                timestamp=hour, hour=hour, city=city, city_key=city.lower(), country="Country",
+                lat=50.0, lon=30.0, temperature=row % 40 - 10, feels_like=row % 40 - 12, humidity=row % 100,
+                pressure=990 + row % 40, precipitation=0.0, dew_point=1.0,
+                wind_speed=row % 60, wind_gust=row % 80, wind_direction="N", wind_degree=row % 360,
+                weather_condition="Cloudy", weather_icon=None, cloudiness=row % 100, visibility=10.0,
+                uv_index=1.0,
+            ))
+        WeatherData.objects.bulk_create(batch)
+
+
+def _seed_postgres(connection, table: str, rows: int, cities: int, start_row: int = 0) -> None:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {table} (
+                timestamp, hour, city, city_key, country, lat, lon,
+                temperature, feels_like, humidity, pressure, precipitation, dew_point,
+                wind_speed, wind_gust, wind_direction, wind_degree,
+                weather_condition, weather_icon, cloudiness, visibility, uv_index, is_forecast
+            )
+            SELECT ts, ts, 'City ' || c, 'city ' || c, 'Country', 50.0, 30.0,
+                   -10 + random() * 40, -12 + random() * 40, (random() * 100)::int,
+                   990 + random() * 40, 0.0, 1.0,
+                   random() * 60, random() * 80, 'N', (random() * 359)::int,
+                   'Cloudy', NULL, (random() * 100)::int, 10.0, 1.0, FALSE
+            FROM (
+                SELECT i %% %(cities)s AS c,
+                       %(start)s::timestamptz + (i / %(cities)s) * interval '1 hour' AS ts
+                FROM generate_series(%(start_row)s, %(rows)s - 1) AS i
+            ) AS series
+            """,
+            {"rows": rows, "cities": cities, "start": SEED_START, "start_row": start_row},
+        )
+        cursor.execute(f"ANALYZE {table}")
+
+
+def write_results(results: dict, output: str | None) -> None:
+    """Print results as JSON and optionally store them in `output`."""
+    text = json.dumps(results, indent=2, default=str)
+    print(text)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
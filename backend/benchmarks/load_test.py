@@ -0,0 +1,229 @@
+"""Load test sync WSGI against async ASGI serving of the weather read API.
+
+Seeds a throw-away database, then serves it with one gunicorn worker (WSGI,
+gthread) and with one uvicorn worker (ASGI) in turn. Each server is driven by
+the same number of concurrent keep-alive clients for a fixed time; the sync
+endpoint is requested from gunicorn and its /api/async/ twin from uvicorn.
+Reports requests/sec and latency percentiles. The response cache is disabled
+unless --cache is given, so every request reaches the database.
+
+Usage:
+    python -m benchmarks.load_test --endpoint latest --concurrency 200 --duration 20
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from benchmarks.common import SEED_START, benchmark_database, seed_weather_rows, setup_django, write_results
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+_RANGE = f"start={SEED_START:%Y-%m-%dT%H:%M:%SZ}&end=2020-03-01T00:00:00Z"
+ENDPOINTS = {
+    "list": ("/api/weather/?city=City%200&page_size=100", "/api/async/weather/?city=City%200&page_size=100"),
+    "latest": ("/api/weather/latest/", "/api/async/weather/latest/"),
+    "aggregate": (
+        f"/api/weather/aggregate/?city=City%200&bucket=day&{_RANGE}",
+        f"/api/async/weather/aggregate/?city=City%200&bucket=day&{_RANGE}",
+    ),
+}
+
+
+@dataclass
+class LoadResult:
+    """Latencies (seconds) of successful requests and the number of failed ones."""
+
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    def as_dict(self, seconds: float) -> dict:
+        """Throughput, error count and latency percentiles (ms) over a run of `seconds`."""
+        latencies = sorted(self.latencies)
+        if not latencies:
+            return {"requests": 0, "errors": self.errors}
+
+        def percentile(p: float) -> float:
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000, 2)
+
+        return {
+            "requests": len(latencies),
+            "errors": self.errors,
+            "requests_per_sec": round(len(latencies) / seconds, 1),
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "max_ms": round(latencies[-1] * 1000, 2),
+        }
+
+
+async def _read_response(reader: asyncio.StreamReader) -> tuple[int, bool]:
+    """Read one HTTP/1.1 response; return (status, keep-alive)."""
+    head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+    status = int(head[0].split()[1])
+    headers = {}
+    for line in head[1:]:
+        if line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip().lower()
+
+    if "content-length" in headers:
+        await reader.readexactly(int(headers["content-length"]))
+    elif headers.get("transfer-encoding") == "chunked":
+        while size := int((await reader.readline()).strip(), 16):
+            await reader.readexactly(size + 2)
+        await reader.readline()
+    return status, headers.get("connection") != "close"
+
+
+async def _client(port: int, path: str, deadline: float, result: LoadResult) -> None:
+    request = f"GET {path} HTTP/1.1\r\nHost: 127.0.0.1:{port}\r\nConnection: keep-alive\r\n\r\n".encode()
+    reader = writer = None
+    while time.perf_counter() < deadline:
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            started = time.perf_counter()
+            writer.write(request)
+            status, keep_alive = await _read_response(reader)
+            if status == 200:
+                result.latencies.append(time.perf_counter() - started)
+            else:
+                result.errors += 1
+        except (OSError, ValueError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            result.errors += 1
+            keep_alive = False
+        if not keep_alive and writer is not None:
+            writer.close()
+            writer = None
+    if writer is not None:
+        writer.close()
+
+
+async def drive(port: int, path: str, concurrency: int, seconds: float) -> LoadResult:
+    """Run `concurrency` keep-alive clients against one path for `seconds`."""
+    result = LoadResult()
+    deadline = time.perf_counter() + seconds
+    await asyncio.gather(*(_client(port, path, deadline, result) for _ in range(concurrency)))
+    return result
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_ready(port: int, process: subprocess.Popen, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode}")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server on port {port} did not start in {timeout}s")
+
+
+def start_server(kind: str, port: int, env: dict, threads: int) -> subprocess.Popen:
+    """Start one gunicorn (wsgi) or uvicorn (asgi) worker process serving the app."""
+    bind = ["--bind", f"127.0.0.1:{port}"]
+    if kind == "wsgi":
+        command = ["gunicorn", "app.wsgi:application", "--workers", "1", "--worker-class", "gthread",
+                   "--threads", str(threads), "--log-level", "warning", *bind]
+    else:
+        command = ["uvicorn", "app.asgi:application", "--workers", "1", "--host", "127.0.0.1",
+                   "--port", str(port), "--log-level", "warning", "--no-access-log"]
+    # The caller owns the process and terminates it once the run is over
+    process = subprocess.Popen(  # pylint: disable=consider-using-with
+        [sys.executable, "-m", *command], env=env, cwd=BACKEND_DIR
+    )
+    _wait_ready(port, process)
+    return process
+
+
+def seed_latest_weather() -> None:
+    """Fill LatestWeather from the seeded readings, one row per city."""
+    # pylint: disable=import-outside-toplevel
+    from django.db.models import Max
+    from weather.models import LatestWeather, WeatherData
+    from weather.services.weather_factory import WeatherModelFactory
+
+    newest = WeatherData.objects.values("city_key").annotate(newest=Max("hour"))
+    rows = [WeatherData.objects.get(city_key=row["city_key"], hour=row["newest"]) for row in newest]
+    LatestWeather.objects.all().delete()
+    LatestWeather.objects.bulk_create([
+        LatestWeather(
+            city_key=row.city_key, reading_id=row.pk,
+            **{name: getattr(row, name) for name in WeatherModelFactory.UPSERT_FIELDS},
+        )
+        for row in rows
+    ])
+
+
+def run(args, database_name: str) -> dict:
+    """Serve the seeded database with each server kind and measure it."""
+    env = {**os.environ, "DB_NAME": database_name}
+    if not args.cache:
+        env["WEATHER_CACHE_TIMEOUT"] = "0"
+
+    results = {}
+    for kind, path in zip(("wsgi", "asgi"), ENDPOINTS[args.endpoint]):
+        port = _free_port()
+        server = start_server(kind, port, env, args.threads)
+        try:
+            asyncio.run(drive(port, path, min(args.concurrency, 10), args.warmup))
+            load = asyncio.run(drive(port, path, args.concurrency, args.duration))
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+        results[kind] = {"path": path, **load.as_dict(args.duration)}
+
+    return {
+        "benchmark": "load_test",
+        "endpoint": args.endpoint,
+        "rows": args.rows,
+        "cities": args.cities,
+        "concurrency": args.concurrency,
+        "duration_seconds": args.duration,
+        "wsgi_threads": args.threads,
+        "response_cache": args.cache,
+        "results": results,
+    }
+
+
+def main():
+    """Seed a fresh database, then load the WSGI and ASGI servers in turn and report both."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endpoint", choices=list(ENDPOINTS), default="latest")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--cities", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=200, help="Concurrent keep-alive clients")
+    parser.add_argument("--duration", type=float, default=20, help="Seconds of load per server")
+    parser.add_argument("--warmup", type=float, default=2, help="Seconds of light load before measuring")
+    parser.add_argument("--threads", type=int, default=8, help="gthread threads of the WSGI worker")
+    parser.add_argument("--cache", action="store_true", help="Keep the response cache enabled")
+    parser.add_argument("--output", help="Write the JSON results to this file")
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database(keepdb=False) as connection:
+        seed_weather_rows(args.rows, args.cities)
+        seed_latest_weather()
+        # Let the servers open their own connections to the test database
+        database_name = connection.settings_dict["NAME"]
+        connection.close()
+        results = run(args, database_name)
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark (city, hour) and per-city lookups on a large WeatherData table.
+
+Compares the indexed city_key/hour predicates used by ingestion and the API
+against the original city/timestamp__date/timestamp__hour and city__iexact
+predicates, which cannot use an index.
+
+Usage:
+    python -m benchmarks.lookup_latency --rows 1000000 --cities 200
+"""
+
+import argparse
+import random
+
+from benchmarks.common import (benchmark_database, seed_city_name, seed_hour, seed_weather_rows, setup_django,
+                               time_call, write_results)
+
+
+def run(rows: int, cities: int, repeat: int) -> dict:
+    """Seed the benchmark database and time each lookup `repeat` times."""
+    # pylint: disable=import-outside-toplevel
+    from django.db import connection
+    from weather.models import WeatherData, normalize_city
+
+    seed_weather_rows(rows, cities)
+    rng = random.Random(42)
+
+    def random_reading():
+        row = rng.randrange(rows)
+        return seed_city_name(row % cities), seed_hour(row, cities)
+
+    def dedup_lookup_unindexed():
+        city, hour = random_reading()
+        WeatherData.objects.filter(city=city, timestamp__date=hour.date(), timestamp__hour=hour.hour).first()
+
+    def dedup_lookup():
+        city, hour = random_reading()
+        WeatherData.objects.filter(city_key=normalize_city(city), hour=hour).first()
+
+    def city_page_unindexed():
+        city, _ = random_reading()
+        list(WeatherData.objects.filter(city__iexact=city.upper()).order_by("-timestamp")[:100])
+
+    def city_page():
+        city, _ = random_reading()
+        list(WeatherData.objects.filter(city_key=normalize_city(city.upper())).order_by("-timestamp")[:100])
+
+    return {
+        "benchmark": "lookup_latency",
+        "vendor": connection.vendor,
+        "rows": rows,
+        "cities": cities,
+        "results": {
+            "dedup_lookup_unindexed": time_call(dedup_lookup_unindexed, repeat),
+            "dedup_lookup": time_call(dedup_lookup, repeat),
+            "city_page_unindexed": time_call(city_page_unindexed, repeat),
+            "city_page": time_call(city_page, repeat),
+        },
+    }
+
+
+def main():
+    """Parse the command line, run the benchmark in a throw-away database and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--cities", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--output", help="Write the JSON results to this file")
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        results = run(args.rows, args.cities, args.repeat)
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Benchmark per-row serialization cost of weather list responses.
+
+Compares WeatherDataSerializer (DRF fields over model instances) with
+WeatherDataRowSerializer (plain dicts from `.values()` rows), both rendered
+to JSON the way the list endpoint does. Rows are built in memory, so only
+serialization and rendering are measured, not the database.
+
+Usage:
+    python -m benchmarks.serializer_cost --rows 100 --repeat 200
+"""
+
+import argparse
+from datetime import timedelta
+
+from benchmarks.common import SEED_START, setup_django, time_call, write_results
+
+
+def build_rows(rows: int) -> list:
+    """Unsaved WeatherData instances with every column filled."""
+    from weather.models import WeatherData  # pylint: disable=import-outside-toplevel
+
+    instances = []
+    for i in range(rows):
+        weather = WeatherData(
+            id=i + 1, timestamp=SEED_START + timedelta(minutes=15 * i), city="Kyiv", country="Ukraine",
+            lat=50.45, lon=30.52, temperature=-5.0 + i % 30, feels_like=-9.1, humidity=80,
+            pressure=1017.0, precipitation=0.1, dew_point=-7.2, wind_speed=24.1, wind_gust=37.0,
+            wind_direction="WNW", wind_degree=288, weather_condition="Overcast",
+            weather_icon="https://cdn.weatherapi.com/weather/64x64/day/122.png",
+            cloudiness=100, visibility=10.0, uv_index=0.4,
+        )
+        weather.fill_keys()
+        instances.append(weather)
+    return instances
+
+
+def run(rows: int, repeat: int) -> dict:
+    """Time both serializers over the same rows `repeat` times."""
+    # pylint: disable=import-outside-toplevel
+    from rest_framework.renderers import JSONRenderer
+    from weather.serializers import WeatherDataRowSerializer, WeatherDataSerializer
+
+    instances = build_rows(rows)
+    values = [{field: getattr(obj, field) for field in WeatherDataRowSerializer.fields} for obj in instances]
+    renderer = JSONRenderer()
+
+    def model_serializer():
+        return renderer.render(WeatherDataSerializer(instances, many=True).data)
+
+    def row_serializer():
+        return renderer.render(WeatherDataRowSerializer(values).data)
+
+    if model_serializer() != row_serializer():
+        raise AssertionError("WeatherDataRowSerializer output differs from WeatherDataSerializer")
+
+    results = {
+        "model_serializer": time_call(model_serializer, repeat),
+        "row_serializer": time_call(row_serializer, repeat),
+    }
+    for stats in results.values():
+        stats["per_row_us"] = round(stats["median_ms"] * 1000 / rows, 2)
+
+    return {
+        "benchmark": "serializer_cost",
+        "rows": rows,
+        "speedup": round(results["model_serializer"]["median_ms"] / results["row_serializer"]["median_ms"], 1),
+        "results": results,
+    }
+
+
+def main():
+    """Run the serializer comparison from the command line (needs no database)."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--output", help="Write the JSON results to this file")
+    args = parser.parse_args()
+
+    setup_django()
+    write_results(run(args.rows, args.repeat), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""Reproducible benchmark suite for the ingestion and read paths.
+
+Ingestion: CurrentWeatherService polls a local WeatherAPI stub (serving the
+test suite's JSON fixture) for 1, 100 and 1000 cities, one city at a time and
+as a concurrent MultiCityIngestionService round; reported as readings/sec.
+
+Reads: GET /api/weather/ through the full Django stack (middleware, view,
+paginator, serializer, renderer; response cache off) on a table grown to
+10k, 1M and 10M rows; reported as latency stats in milliseconds.
+
+The JSON output records the commit and database vendor. Pass --baseline with
+the output of an earlier commit to add the change of every throughput and
+latency figure.
+
+Usage:
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --rows 10000,1000000 --baseline results.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import time
+from pathlib import Path
+
+from benchmarks.common import (SEED_START, benchmark_database, seed_city_name, seed_hour, seed_weather_rows,
+                               setup_django, time_call, write_results)
+from benchmarks.weather_api_stub import running_stub
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Figures compared against a baseline, and whether larger is better
+COMPARED = {"readings_per_sec": True, "median_ms": False, "p95_ms": False}
+
+
+def _int_list(value: str) -> list[int]:
+    return sorted(int(part.replace("_", "")) for part in value.split(",") if part.strip())
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _clear_readings() -> None:
+    # pylint: disable=import-outside-toplevel
+    from weather.models import LatestWeather, WeatherData
+
+    WeatherData.objects.all().delete()
+    LatestWeather.objects.all().delete()
+
+
+def ingestion(city_counts: list[int], rounds: int, workers: int, latency_ms: float) -> dict:
+    """Time polling rounds through CurrentWeatherService against the stub."""
+    # pylint: disable=import-outside-toplevel
+    from django.test import override_settings
+    from weather.services.current_weather_service import CurrentWeatherService
+    from weather.services.ingestion_service import MultiCityIngestionService
+    from weather.services.weather_api_client import WeatherAPIClient
+
+    def sequential(cities):
+        service = CurrentWeatherService()
+        for city in cities:
+            service.get_weather(city)
+
+    def concurrent(cities):
+        MultiCityIngestionService(max_workers=workers).poll(cities)
+
+    results = {}
+    original_urls = WeatherAPIClient.BASE_URLS
+    overrides = override_settings(
+        WEATHER_API_CACHE_TTL={}, WEATHER_API_RATE_LIMIT_PER_MINUTE=0, WEATHER_API_MONTHLY_QUOTA=0,
+        WEATHER_EVENTS_REDIS_URL=None,
+    )
+    with overrides, running_stub(latency_ms / 1000) as stub:
+        WeatherAPIClient.BASE_URLS = stub.base_urls
+        # Rebuild the process-wide session, cache and limiter under the overridden settings
+        WeatherAPIClient.reset_shared_state()
+        try:
+            for count in city_counts:
+                cities = [f"Bench {seed_city_name(i)}" for i in range(count)]
+                results[str(count)] = {
+                    mode.__name__: _time_rounds(mode, cities, rounds)
+                    for mode in (sequential, concurrent)
+                }
+        finally:
+            WeatherAPIClient.BASE_URLS = original_urls
+            WeatherAPIClient.reset_shared_state()
+            _clear_readings()
+
+    return {"stub_latency_ms": latency_ms, "workers": workers, "rounds": rounds, "results": results}
+
+
+def _time_rounds(poll, cities: list[str], rounds: int) -> dict:
+    """Run `rounds` polls into an empty table and report the median round."""
+    # pylint: disable=import-outside-toplevel
+    from weather.models import WeatherData, normalize_city
+    from weather.services.observation_ledger import ObservationLedger
+
+    durations = []
+    for _ in range(rounds):
+        _clear_readings()
+        # The stub repeats one observation; forget it so every round writes
+        ObservationLedger().forget(normalize_city(city) for city in cities)
+        started = time.perf_counter()
+        poll(cities)
+        durations.append(time.perf_counter() - started)
+        stored = WeatherData.objects.count()
+        if stored != len(cities):
+            raise RuntimeError(f"{poll.__name__} stored {stored} of {len(cities)} readings")
+
+    median = statistics.median(durations)
+    return {
+        "readings": len(cities),
+        "median_seconds": round(median, 4),
+        "readings_per_sec": round(len(cities) / median, 1),
+    }
+
+
+def reads(row_counts: list[int], cities: int, repeat: int) -> dict:
+    """Grow the table to each size and time the list endpoint's typical requests."""
+    # pylint: disable=import-outside-toplevel
+    from django.test import Client, override_settings
+    from weather.pagination import WeatherKeysetPagination
+    from weather.services.partition_service import WeatherPartitionManager
+
+    client = Client()
+    city = seed_city_name(1)
+    results = {}
+
+    def get(path):
+        response = client.get(path)
+        if response.status_code != 200:
+            raise RuntimeError(f"GET {path} returned {response.status_code}")
+    seeded = 0
+    for rows in row_counts:
+        WeatherPartitionManager().ensure_partitions(SEED_START.date(), seed_hour(rows - 1, cities).date())
+        seed_weather_rows(rows, cities, start_row=seeded)
+        seeded = rows
+
+        # Halfway down one city's history, addressed by cursor and by page number
+        middle = seed_hour(rows // 2, cities)
+        cursor = WeatherKeysetPagination.encode_cursor((middle, 2 ** 62), False)
+        middle_page = rows // cities // 2 // 100 + 1
+        paths = {
+            "list_first_page": "/api/weather/?page_size=100&pagination=keyset",
+            "city_first_page": f"/api/weather/?city={city}&page_size=100&pagination=keyset",
+            "city_cursor_middle": f"/api/weather/?city={city}&page_size=100&cursor={cursor}",
+            "city_page_number_middle": f"/api/weather/?city={city}&page_size=100&page={middle_page}",
+        }
+
+        with override_settings(WEATHER_CACHE_TIMEOUT=0):
+            results[str(rows)] = {name: time_call(lambda p=path: get(p), repeat) for name, path in paths.items()}
+
+    return {"cities": cities, "results": results}
+
+
+def compare(baseline: dict, current: dict, path: str = "") -> dict:
+    """Change of every compared figure present in both result sets, keyed by its path."""
+    changes = {}
+    for key, value in current.items():
+        if key not in baseline:
+            continue
+        name = f"{path}.{key}" if path else key
+        if isinstance(value, dict) and isinstance(baseline[key], dict):
+            changes.update(compare(baseline[key], value, name))
+        elif key in COMPARED and baseline[key]:
+            change = (value - baseline[key]) / baseline[key] * 100
+            changes[name] = {
+                "baseline": baseline[key],
+                "current": value,
+                "change_pct": round(change, 1),
+                "regression": change < 0 if COMPARED[key] else change > 0,
+            }
+    return changes
+
+
+def main():
+    """Run the ingestion and/or read halves, optionally compare with a baseline, and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", choices=("ingestion", "reads"), help="Run one half of the suite")
+    parser.add_argument("--cities", type=_int_list, default=[1, 100, 1000], help="City counts to ingest")
+    parser.add_argument("--rounds", type=int, default=3, help="Polling rounds per city count and mode")
+    parser.add_argument("--workers", type=int, default=16, help="Fetch threads of the concurrent round")
+    parser.add_argument("--stub-latency-ms", type=float, default=0, help="Delay of every stub response")
+    parser.add_argument("--rows", type=_int_list, default=[10_000, 1_000_000, 10_000_000],
+                        help="Table sizes for the read benchmark")
+    parser.add_argument("--read-cities", type=int, default=100, help="Cities the seeded rows are spread over")
+    parser.add_argument("--repeat", type=int, default=50, help="Requests per read scenario")
+    parser.add_argument("--baseline", help="Earlier results file to compare against")
+    parser.add_argument("--output", help="Write the JSON results to this file")
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database(keepdb=False) as connection:
+        results = {
+            "benchmark": "suite",
+            "commit": _commit(),
+            "vendor": connection.vendor,
+            "python": platform.python_version(),
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }
+        if args.only in (None, "ingestion"):
+            results["ingestion"] = ingestion(args.cities, args.rounds, args.workers, args.stub_latency_ms)
+        if args.only in (None, "reads"):
+            results["reads"] = reads(args.rows, args.read_cities, args.repeat)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            results["comparison"] = compare(json.load(f), results)
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark the NumPy time-series path behind /api/weather/derived/.
+
+Seeds one city with hourly readings (a year by default) into a throw-away
+test database, then times:
+
+- instances: iterating WeatherData model instances and computing a trailing
+  rolling mean/stddev in pure Python, the way it would be done without NumPy;
+- load: WeatherSeriesLoader's single values_list pass into arrays;
+- compute: DerivedMetricsService over the loaded arrays (all metrics).
+
+Usage:
+    python -m benchmarks.timeseries_cost --hours 8760 --repeat 20
+"""
+
+import argparse
+import math
+from collections import deque
+from datetime import timedelta
+
+from benchmarks.common import SEED_START, benchmark_database, seed_city_name, seed_weather_rows, setup_django
+from benchmarks.common import time_call, write_results
+
+
+def python_rolling(readings, window: float) -> list[tuple[float, float]]:
+    """Trailing-window mean/stddev of (epoch, value) pairs with running sums, in pure Python."""
+    samples, total, squares, stats = deque(), 0.0, 0.0, []
+    for epoch, value in readings:
+        samples.append((epoch, value))
+        total, squares = total + value, squares + value * value
+        while samples[0][0] <= epoch - window:
+            _, old = samples.popleft()
+            total, squares = total - old, squares - old * old
+        mean = total / len(samples)
+        stats.append((mean, math.sqrt(max(squares / len(samples) - mean * mean, 0.0))))
+    return stats
+
+
+def run(hours: int, window_hours: int, repeat: int) -> dict:
+    """Seed `hours` hourly readings of one city and time each path `repeat` times."""
+    # pylint: disable=import-outside-toplevel
+    from weather.models import WeatherData
+    from weather.services.derived_metrics import DerivedMetricsService
+    from weather.services.timeseries import WeatherSeriesLoader
+
+    seed_weather_rows(hours, cities=1)
+    city, start, end = seed_city_name(0), SEED_START, SEED_START + timedelta(hours=hours)
+    loader, service = WeatherSeriesLoader(), DerivedMetricsService()
+    series = loader.load(city, start, end)
+
+    def instances():
+        queryset = WeatherData.objects.filter(city_key=city.lower()).between(start, end).order_by("timestamp")
+        readings = list(queryset)
+        for field in service.ROLLING_FIELDS:
+            python_rolling(
+                ((weather.timestamp.timestamp(), getattr(weather, field)) for weather in readings),
+                window_hours * 3600,
+            )
+
+    results = {
+        "instances": time_call(instances, repeat),
+        "load": time_call(lambda: loader.load(city, start, end), repeat),
+        "compute": time_call(lambda: service.compute(series, window_hours), repeat),
+    }
+    numpy_ms = results["load"]["median_ms"] + results["compute"]["median_ms"]
+    return {
+        "benchmark": "timeseries_cost",
+        "rows": len(series),
+        "window_hours": window_hours,
+        "speedup": round(results["instances"]["median_ms"] / numpy_ms, 1),
+        "results": results,
+    }
+
+
+def main():
+    """Parse the command line, time both paths in a throw-away database and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hours", type=int, default=365 * 24)
+    parser.add_argument("--window-hours", type=int, default=24)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", help="Write the JSON results to this file")
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database():
+        results = run(args.hours, args.window_hours, args.repeat)
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Local stand-in for WeatherAPI used by the benchmarks.
+
+Serves `current.json` from the test suite's JSON fixture over HTTP on
+127.0.0.1, with `location.name` set to the requested `q` so every city gets
+its own readings. An optional fixed delay models the round trip to the real
+service.
+"""
+
+import contextlib
+import copy
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from tests.utils.fixtures_loader import load_fixture
+
+FIXTURES = {"current": "mock_current_weather_response.json"}
+
+
+class WeatherAPIStub(ThreadingHTTPServer):
+    """Threaded HTTP server answering /v1/<endpoint>.json from fixtures."""
+
+    daemon_threads = True
+
+    def __init__(self, latency: float = 0.0):
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.latency = latency
+        self.payloads = {endpoint: load_fixture(name) for endpoint, name in FIXTURES.items()}
+
+    @property
+    def base_urls(self) -> dict[str, str]:
+        """WeatherAPIClient.BASE_URLS pointing at this server."""
+        host, port = self.server_address[:2]
+        return {endpoint: f"http://{host}:{port}/v1/{endpoint}.json" for endpoint in FIXTURES}
+
+    def payload(self, endpoint: str, city: str) -> bytes | None:
+        """The endpoint's fixture as JSON with `city` as the location name; None for unknown endpoints."""
+        if endpoint not in self.payloads:
+            return None
+        data = copy.deepcopy(self.payloads[endpoint])
+        data["location"]["name"] = city
+        return json.dumps(data).encode()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; without this Nagle plus delayed ACK add ~40 ms each
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Answer a WeatherAPI-shaped request with the fixture, after the configured latency."""
+        url = urlsplit(self.path)
+        endpoint = url.path.rsplit("/", 1)[-1].removesuffix(".json")
+        city = parse_qs(url.query).get("q", [""])[0]
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        body = self.server.payload(endpoint, city)
+        status = 200 if body is not None else 404
+        body = body or b'{"error": {"message": "Unknown endpoint"}}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+@contextlib.contextmanager
+def running_stub(latency: float = 0.0):
+    """Serve a WeatherAPIStub in a background thread for the duration of the block."""
+    stub = WeatherAPIStub(latency)
+    thread = threading.Thread(target=stub.serve_forever, name="weather-api-stub", daemon=True)
+    thread.start()
+    try:
+        yield stub
+    finally:
+        stub.shutdown()
+        stub.server_close()
@@ -2,9 +2,16 @@
 
 
 import pytest
+from django.core.cache import cache
 from tests.utils.fixtures_loader import load_fixture
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Fixture: start every test with an empty cache."""
+    cache.clear()
+
+
 @pytest.fixture
 def mock_current_weather_response_json():
     """Fixture: returns mock data for current weather response."""
@@ -0,0 +1,90 @@
+"""Tests for the WeatherData admin changelist."""
+
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from weather.models import WeatherData
+from weather.pagination import EstimatedCountPaginator
+from weather.services.weather_factory import WeatherModelFactory
+
+CHANGELIST = "/admin/weather/weatherdata/"
+
+
+@pytest.fixture
+def readings(mock_current_weather_response_json):
+    """Kyiv readings at -5, 5 and 15 °C and one Lviv reading."""
+    payload = mock_current_weather_response_json
+    data = {**payload["location"], **payload["current"]}
+    for hour, temperature in enumerate((-5.0, 5.0, 15.0)):
+        WeatherModelFactory.create_weather("Kyiv", {**data, "time_epoch": 1741500000 + hour * 3600,
+                                                    "temp_c": temperature})
+    WeatherModelFactory.create_weather("Lviv", {**data, "time_epoch": 1741500000, "temp_c": 20.0,
+                                                "condition": {"text": "Rain"}})
+
+
+@pytest.mark.django_db
+def test_changelist_sidebar_without_distinct_scans(admin_client, readings):
+    """Test loading the changelist twice. Expect no DISTINCT over readings once facets are cached."""
+    admin_client.get(CHANGELIST)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = admin_client.get(CHANGELIST)
+
+    assert response.status_code == 200
+    assert not [q["sql"] for q in queries.captured_queries if "DISTINCT" in q["sql"].upper()]
+    cl = response.context["cl"]
+    assert [w.temperature for w in cl.result_list] == [15.0, 5.0, 20.0, -5.0]
+    assert {"Kyiv", "Lviv"} <= {label for _, label in cl.filter_specs[0].lookup_choices}
+
+
+@pytest.mark.django_db
+def test_changelist_facets_read_latest_weather(admin_client, readings):
+    """Test the first changelist load. Expect facet choices without a DISTINCT over readings."""
+    with CaptureQueriesContext(connection) as queries:
+        response = admin_client.get(CHANGELIST)
+
+    table = WeatherData._meta.db_table
+    assert not [q["sql"] for q in queries.captured_queries if "DISTINCT" in q["sql"].upper() and table in q["sql"]]
+    conditions = next(spec for spec in response.context["cl"].filter_specs if spec.title == "weather condition")
+    assert "Rain" in {label for _, label in conditions.lookup_choices}
+
+
+@pytest.mark.django_db
+def test_changelist_range_and_city_filters(admin_client, readings):
+    """Test a temperature bucket and a city choice. Expect only matching rows."""
+    response = admin_client.get(CHANGELIST, {"temperature": "0:10"})
+    assert [w.temperature for w in response.context["cl"].result_list] == [5.0]
+
+    response = admin_client.get(CHANGELIST, {"city": "lviv", "weather_condition": "Rain"})
+    assert [w.city for w in response.context["cl"].result_list] == ["Lviv"]
+
+
+@pytest.mark.django_db
+def test_changelist_invalid_bucket(admin_client, readings):
+    """Test a malformed range value. Expect the admin's invalid-lookup redirect."""
+    response = admin_client.get(CHANGELIST, {"temperature": "cold:"})
+
+    assert response.status_code == 302
+    assert "e=1" in response["Location"]
+
+
+@pytest.mark.django_db
+def test_estimated_count_falls_back_to_exact(settings, readings):
+    """Test a result below the exact-count limit. Expect the exact count."""
+    settings.WEATHER_ADMIN_EXACT_COUNT_LIMIT = 10_000
+
+    assert EstimatedCountPaginator(WeatherData.objects.order_by("-timestamp"), 100).count == 4
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="planner estimates need PostgreSQL")
+def test_estimated_count_uses_planner(settings, readings):
+    """Test a result above the exact-count limit. Expect the planner estimate and no COUNT(*)."""
+    settings.WEATHER_ADMIN_EXACT_COUNT_LIMIT = 0
+
+    with CaptureQueriesContext(connection) as queries:
+        count = EstimatedCountPaginator(WeatherData.objects.filter(city_key="kyiv").order_by("-timestamp"), 100).count
+
+    assert count >= 1
+    assert not [q["sql"] for q in queries.captured_queries if "COUNT(" in q["sql"].upper()]
@@ -0,0 +1,79 @@
+"""Tests for the backfill_weather management command.
+
+These tests check that the range is split into (city, day) units, that
+completed units are checkpointed and that a rerun resumes from them.
+"""
+
+
+from datetime import date
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from weather.models import BackfillProgress, WeatherData
+from weather.services.history_weather_service import HistoryWeatherService
+
+
+def _backfill(*args):
+    out = StringIO()
+    call_command("backfill_weather", *args, stdout=out, stderr=StringIO())
+    return out.getvalue()
+
+
+@pytest.fixture
+def history_api(mock_historical_weather_response):
+    with patch("weather.services.weather_api_client.WeatherAPIClient.fetch_data",
+               return_value=mock_historical_weather_response) as fetch:
+        yield fetch
+
+
+@pytest.mark.django_db(transaction=True)
+def test_backfill_checkpoints_units(history_api):
+    """Test a three-day backfill. Expect one call and one checkpoint per day."""
+    out = _backfill("London", "--start", "2025-03-06", "--end", "2025-03-08", "--workers", "2")
+
+    assert "3 of 3 (city, day) units" in out
+    assert "rows/s" in out
+    assert history_api.call_count == 3
+    assert BackfillProgress.objects.count() == 3
+    assert WeatherData.objects.count() == 24
+
+
+@pytest.mark.django_db(transaction=True)
+def test_backfill_resumes_from_checkpoint(history_api):
+    """Test a rerun after one day was completed. Expect only the missing days fetched."""
+    BackfillProgress.objects.create(city_key="london", day=date(2025, 3, 7), rows=24)
+
+    out = _backfill("London", "--start", "2025-03-06", "--end", "2025-03-08")
+
+    assert "2 of 3 (city, day) units" in out
+    assert sorted(call.args[1]["dt"] for call in history_api.call_args_list) == ["2025-03-06", "2025-03-08"]
+    assert "Nothing to do" in _backfill("London", "--start", "2025-03-06", "--end", "2025-03-08")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_backfill_celery_mode_dispatches_chunks(history_api):
+    """Test --celery with 10 days in chunks of 4. Expect three tasks and no local fetches."""
+    with patch("weather.management.commands.backfill_weather.backfill_weather_chunk.delay") as delay:
+        _backfill("London", "--start", "2025-03-01", "--end", "2025-03-10", "--celery", "--chunk-days", "4")
+
+    assert [len(call.args[1]) for call in delay.call_args_list] == [4, 4, 2]
+    assert history_api.call_count == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_backfill_continues_after_unexpected_error(history_api):
+    """Test a day whose storing raises a non-API error. Expect it reported as failed and the other days stored."""
+    original = HistoryWeatherService.get_history
+
+    def get_history(service, city, day, end_day=None):
+        if day == date(2025, 3, 7):
+            raise ValueError("bad payload")
+        return original(service, city, day, end_day)
+
+    with patch.object(HistoryWeatherService, "get_history", autospec=True, side_effect=get_history):
+        out = _backfill("London", "--start", "2025-03-06", "--end", "2025-03-08", "--workers", "2")
+
+    assert "1 failed" in out
+    assert sorted(BackfillProgress.objects.values_list("day", flat=True)) == [date(2025, 3, 6), date(2025, 3, 8)]
@@ -0,0 +1,42 @@
+"""Tests for migration 0012, which re-keys cities stored with inner whitespace."""
+
+
+import importlib
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+import pytest
+from django.apps import apps
+from weather.models import LatestWeather, WeatherData
+from weather.services.weather_factory import WeatherModelFactory
+
+migration = importlib.import_module("weather.migrations.0012_normalize_city_keys")
+
+START = datetime(2025, 3, 1, tzinfo=dt_timezone.utc)
+
+
+def _store(payload, city, hours, city_key):
+    data = {**payload["location"], **payload["current"]}
+    weather = WeatherModelFactory.build_weather(city, data)
+    weather.timestamp = weather.hour = START + timedelta(hours=hours)
+    weather.city_key = city_key
+    return WeatherData.objects.bulk_create([weather])[0]
+
+
+@pytest.mark.django_db
+def test_fix_city_keys_rekeys_and_drops_duplicates(mock_current_weather_response_json):
+    """Test rows keyed like the old LOWER(TRIM(city)). Expect normalized keys and duplicate hours dropped."""
+    payload = mock_current_weather_response_json
+    kept = _store(payload, "New York", 0, "new york")
+    duplicate = _store(payload, "New  York", 0, "new  york")
+    moved = _store(payload, "New  York", 1, "new  york")
+    LatestWeather.objects.create(
+        city_key="new  york", reading_id=moved.id,
+        **{field: getattr(moved, field) for field in WeatherModelFactory.UPSERT_FIELDS},
+    )
+
+    migration.fix_city_keys(apps, None)
+
+    assert not WeatherData.objects.filter(id=duplicate.id).exists()
+    assert set(WeatherData.objects.values_list("id", "city_key")) == {(kept.id, "new york"), (moved.id, "new york")}
+    assert list(LatestWeather.objects.values_list("city_key", "reading_id")) == [("new york", moved.id)]
@@ -0,0 +1,53 @@
+"""Tests for WeatherDataRowSerializer, the `.values()` fast path of WeatherDataSerializer."""
+
+
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+from weather.models import WeatherData
+from weather.serializers import WeatherDataRowSerializer, WeatherDataSerializer
+from weather.services.weather_factory import WeatherModelFactory
+
+
+@pytest.fixture
+def stored_rows(mock_current_weather_response_json):
+    """Readings with fractional timestamps and with every nullable column empty."""
+    payload = mock_current_weather_response_json
+    data = {**payload["location"], **payload["current"]}
+    start = datetime(2025, 3, 1, 12, 0, 0, 123456, tzinfo=dt_timezone.utc)
+    rows = []
+    for i in range(3):
+        weather = WeatherModelFactory.build_weather("Kyiv", {**data, "temp_c": i + 0.5})
+        weather.timestamp = start + timedelta(hours=i)
+        weather.fill_keys()
+        rows.append(weather)
+    sparse = WeatherModelFactory.build_weather("Lviv", {
+        "temp_c": -3.0, "pressure_mb": 1000.0, "wind_kph": 0.0, "wind_dir": "N", "vis_km": 10.0,
+    })
+    sparse.humidity = sparse.precipitation = None
+    rows.append(sparse)
+    WeatherData.objects.bulk_create(rows)
+
+
+@pytest.mark.django_db
+def test_row_serializer_renders_identical_json(stored_rows):
+    """Test the fast path against WeatherDataSerializer. Expect byte-identical JSON."""
+    queryset = WeatherData.objects.order_by("id")
+
+    expected = JSONRenderer().render(WeatherDataSerializer(queryset, many=True).data)
+    actual = JSONRenderer().render(
+        WeatherDataRowSerializer(queryset.values(*WeatherDataRowSerializer.fields)).data
+    )
+
+    assert actual == expected
+
+
+def test_row_serializer_fields_cover_model_serializer():
+    """Test the flat field list. Expect every nested serializer field exactly once."""
+    fields = WeatherDataRowSerializer.fields
+
+    assert len(fields) == len(set(fields))
+    assert "wind_speed" in fields and "uv_index" in fields
+    assert "wind" not in fields and "condition" not in fields
@@ -0,0 +1,36 @@
+"""Tests for WeatherDataSerializer.
+
+These tests pin the nested wind/condition output shape the frontend relies
+on, independently of how the columns are stored.
+"""
+
+
+from weather.serializers import WeatherDataSerializer
+from weather.services.weather_factory import WeatherModelFactory
+
+
+def test_serializer_keeps_nested_shape(mock_current_weather_response_json):
+    """Test WeatherDataSerializer output. Expect nested wind and condition objects."""
+    payload = mock_current_weather_response_json
+    weather = WeatherModelFactory.build_weather("Kyiv", {**payload["location"], **payload["current"]})
+    weather.id = 1
+
+    data = WeatherDataSerializer(weather).data
+
+    assert list(data) == [
+        "id", "timestamp", "city", "country", "lat", "lon", "temperature", "feels_like",
+        "humidity", "pressure", "precipitation", "dew_point", "wind", "condition",
+    ]
+    assert data["wind"] == {
+        "wind_speed": 24.1,
+        "wind_direction": "WNW",
+        "wind_gust": 37.0,
+        "wind_degree": 288,
+    }
+    assert data["condition"] == {
+        "weather_condition": "Overcast",
+        "weather_icon": "https://cdn.weatherapi.com/weather/64x64/night/122.png",
+        "cloudiness": 100,
+        "visibility": 10.0,
+        "uv_index": 0.0,
+    }
@@ -0,0 +1,138 @@
+"""Tests for AlertEngine evaluation at ingest time."""
+
+
+import random
+from datetime import datetime
+from datetime import timezone as dt_timezone
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from prometheus_client import REGISTRY
+from weather.models import AlertEvent, AlertRule, AlertRuleState, WeatherData
+from weather.services.alert_service import AlertEngine
+from weather.services.weather_factory import WeatherModelFactory
+
+START = int(datetime(2025, 3, 1, tzinfo=dt_timezone.utc).timestamp())
+HOUR = 3600
+
+
+def _rule(**fields):
+    return AlertRule.objects.create(created_at=datetime(2025, 1, 1, tzinfo=dt_timezone.utc), **fields)
+
+
+@pytest.fixture
+def store(mock_current_weather_response_json):
+    """Fixture: store one Kyiv observation `hours` after START with the given payload fields."""
+    payload = mock_current_weather_response_json
+
+    def store(hours, city="Kyiv", **fields):
+        data = {**payload["location"], **payload["current"], "last_updated_epoch": START + hours * HOUR, **fields}
+        return WeatherModelFactory.bulk_create_weather([(city, data)])
+
+    return store
+
+
+@pytest.mark.django_db
+def test_threshold_fires_once_per_breach(store):
+    """Test gusts above 70 km/h over several readings. Expect one alert per breach, at most one per cooldown."""
+    _rule(name="Gale", metric="wind_gust", condition="above", threshold=70, cooldown=4 * HOUR)
+
+    for hours, gust in enumerate([50, 75, 80, 60, 90, 40, 40, 40, 72]):
+        store(hours, gust_kph=gust)
+
+    events = list(AlertEvent.objects.order_by("observed_at"))
+    # 90 at hour 4 comes within the cooldown of the alert at hour 1
+    assert [(event.value, event.observed_at.timestamp()) for event in events] == [
+        (75.0, START + HOUR), (72.0, START + 8 * HOUR),
+    ]
+    assert events[0].city == "Kyiv" and events[0].rule.name == "Gale"
+
+
+@pytest.mark.django_db
+def test_drop_within_window(store):
+    """Test a temperature drop of more than 8 °C within 3 hours. Expect an alert against the window maximum."""
+    _rule(name="Cold front", metric="temperature", condition="drop", threshold=8, window=3 * HOUR)
+
+    for hours, temperature in enumerate([20.0, 15.0, 11.0]):
+        store(hours, temp_c=temperature)
+    # 10 °C three hours after 15 °C: 20 °C and 15 °C have left the window
+    store(4, temp_c=10.0)
+
+    event = AlertEvent.objects.get()
+    assert (event.value, event.reference) == (11.0, 20.0)
+    assert event.observed_at.timestamp() == START + 2 * HOUR
+
+
+@pytest.mark.django_db
+def test_rule_scoped_to_city(store):
+    """Test a Lviv-only rule with readings of Kyiv and Lviv. Expect an alert for Lviv only."""
+    _rule(name="Hot Lviv", city_key=" LVIV ", metric="temperature", condition="above", threshold=0)
+
+    store(0)
+    store(0, city="Lviv")
+
+    assert list(AlertEvent.objects.values_list("city_key", flat=True)) == ["lviv"]
+    assert AlertRuleState.objects.get().city_key == "lviv"
+
+
+@pytest.mark.django_db
+def test_reading_evaluated_once(store):
+    """Test evaluating an already evaluated reading again. Expect no second alert."""
+    _rule(name="Hot", metric="temperature", condition="above", threshold=0)
+    saved = store(0)
+
+    assert AlertEngine().evaluate(saved) == []
+    assert AlertEvent.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_stored_alert_not_counted_again(store):
+    """Test re-raising an alert that is already stored. Expect it left out of the result and the counter."""
+    _rule(name="Hot", metric="temperature", condition="above", threshold=0)
+    saved = store(0)
+    AlertRuleState.objects.all().delete()
+    before = REGISTRY.get_sample_value("weather_alerts_fired_total", {"metric": "temperature", "condition": "above"})
+
+    assert AlertEngine().evaluate(saved) == []
+    assert REGISTRY.get_sample_value(
+        "weather_alerts_fired_total", {"metric": "temperature", "condition": "above"}
+    ) == before
+    assert AlertEvent.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_readings_before_rule_ignored(store):
+    """Test readings observed before the rule was created. Expect no alert and no state."""
+    AlertRule.objects.create(name="Hot", metric="temperature", condition="above", threshold=0)
+
+    store(0)
+
+    assert not AlertEvent.objects.exists()
+    assert AlertRuleState.objects.get().observed_at is None
+
+
+@pytest.mark.django_db
+def test_state_bounded_without_history_reads(store):
+    """Test many readings for a rise rule. Expect a window within the readings it spans and no history query."""
+    rule = _rule(name="Warming", metric="temperature", condition="rise", threshold=100, window=3 * HOUR)
+    rng = random.Random(3)
+
+    for hours in range(100):
+        with CaptureQueriesContext(connection) as captured:
+            store(hours, temp_c=rng.uniform(-10, 30))
+        statements = [query["sql"] for query in captured.captured_queries]
+        assert not any(f'FROM "{WeatherData._meta.db_table}"' in sql for sql in statements)
+        assert len(AlertRuleState.objects.get(rule=rule).window) <= 3
+
+
+@pytest.mark.django_db
+def test_new_rule_invalidates_cache(store):
+    """Test adding a rule after the rule cache was filled. Expect the next reading to be evaluated against it."""
+    store(0)
+    assert AlertEngine().rules() == []
+
+    _rule(name="Hot", metric="temperature", condition="above", threshold=0)
+    store(1)
+
+    assert AlertEvent.objects.count() == 1
@@ -0,0 +1,63 @@
+"""Tests for the vectorized derived metrics."""
+
+
+import numpy as np
+import pytest
+from weather.services.derived_metrics import DerivedMetricsService, dew_point, heat_index, rolling, wind_chill
+from weather.services.timeseries import WeatherSeries
+
+
+def test_heat_index_uses_regression_when_hot():
+    """Test 32.2 °C (90 °F) at 70 % humidity. Expect the NWS table value of about 106 °F (41 °C)."""
+    assert heat_index(np.array([32.2]), np.array([70.0]))[0] == pytest.approx(41.1, abs=0.3)
+
+
+def test_heat_index_close_to_temperature_when_mild():
+    """Test 20 °C at 50 % humidity. Expect the simple formula, within a degree of the air temperature."""
+    assert heat_index(np.array([20.0]), np.array([50.0]))[0] == pytest.approx(20.0, abs=1.0)
+
+
+def test_wind_chill():
+    """Test -10 °C at 20 km/h and a warm or calm reading. Expect -17.9 °C, then the air temperature."""
+    result = wind_chill(np.array([-10.0, 15.0, -5.0]), np.array([20.0, 30.0, 2.0]))
+    np.testing.assert_allclose(result, [-17.87, 15.0, -5.0], atol=0.01)
+
+
+def test_dew_point_magnus():
+    """Test 25 °C at 60 % and saturated air. Expect about 16.7 °C and the temperature itself."""
+    np.testing.assert_allclose(dew_point(np.array([25.0, 10.0]), np.array([60.0, 100.0])), [16.7, 10.0], atol=0.1)
+
+
+def test_rolling_matches_naive_window():
+    """Test a gappy series with NaN. Expect the mean/std of the samples in each trailing window."""
+    rng = np.random.default_rng(7)
+    times = np.cumsum(rng.integers(1, 4, 300)) * 3600.0
+    values = rng.normal(1013, 5, 300)
+    values[rng.integers(0, 300, 20)] = np.nan
+
+    mean, std = rolling(times, values, 24 * 3600)
+
+    for i in range(300):
+        window = values[(times > times[i] - 24 * 3600) & (times <= times[i])]
+        window = window[~np.isnan(window)]
+        if len(window):
+            assert mean[i] == pytest.approx(window.mean())
+            assert std[i] == pytest.approx(window.std(), abs=1e-6)
+        else:
+            assert np.isnan(mean[i])
+
+
+def test_compute_estimates_missing_dew_point():
+    """Test a reading without dew point. Expect the spread from the Magnus estimate and every metric per reading."""
+    columns = {
+        "temperature": np.array([25.0, 26.0]),
+        "humidity": np.array([60.0, 60.0]),
+        "dew_point": np.array([np.nan, 20.0]),
+        "wind_speed": np.array([10.0, 12.0]),
+        "pressure": np.array([1010.0, 1012.0]),
+    }
+    metrics = DerivedMetricsService().compute(WeatherSeries(np.array([0.0, 3600.0]), columns), window_hours=2)
+
+    np.testing.assert_allclose(metrics["dew_point_spread"], [8.3, 6.0], atol=0.1)
+    np.testing.assert_allclose(metrics["pressure_rolling_mean"], [1010.0, 1011.0])
+    assert all(len(values) == 2 for values in metrics.values())
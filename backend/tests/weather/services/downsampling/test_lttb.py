@@ -0,0 +1,32 @@
+"""Tests for the lttb downsampling helper."""
+
+
+import math
+
+from weather.services.downsampling import lttb
+
+
+def test_lttb_keeps_short_series():
+    """Test lttb with fewer points than the threshold. Expect every index."""
+    assert lttb([0, 1, 2], [1, 2, 3], 10) == [0, 1, 2]
+
+
+def test_lttb_reduces_to_threshold():
+    """Test lttb on a long series. Expect exactly `threshold` ascending indices with both ends."""
+    xs = list(range(1000))
+    ys = [math.sin(x / 20) for x in xs]
+
+    selected = lttb(xs, ys, 50)
+
+    assert len(selected) == 50
+    assert selected[0] == 0 and selected[-1] == 999
+    assert selected == sorted(set(selected))
+
+
+def test_lttb_keeps_spike():
+    """Test lttb on a flat series with one spike. Expect the spike to survive."""
+    xs = list(range(500))
+    ys = [0.0] * 500
+    ys[237] = 100.0
+
+    assert 237 in lttb(xs, ys, 20)
@@ -0,0 +1,151 @@
+"""Tests for live reading events: publishing and the Server-Sent Events stream."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+from django.test import AsyncClient, Client
+from weather.serializers import WeatherDataRowSerializer, WeatherDataSerializer
+from weather.services.event_service import WeatherEventPublisher, channel, stream_readings
+from weather.services.weather_factory import WeatherModelFactory
+
+
+class FakePipeline:
+    def __init__(self, sent):
+        self.sent = sent
+        self.queued = []
+
+    def publish(self, name, message):
+        self.queued.append((name, message))
+
+    def execute(self):
+        self.sent.extend(self.queued)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.sent = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self.sent)
+
+
+class FakePubSub:
+    """Returns the queued messages, then None (an idle poll) forever."""
+
+    def __init__(self, messages):
+        self.messages = list(messages)
+        self.channels = []
+        self.closed = False
+
+    async def subscribe(self, *channels):
+        self.channels.extend(channels)
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=None):
+        if self.messages:
+            return {"type": "message", "data": self.messages.pop(0)}
+        await asyncio.sleep(timeout)
+        return None
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.mark.django_db
+def test_publish_sends_list_entry_per_reading(mock_current_weather_response_json):
+    """Test publishing saved readings. Expect one message per city channel in the list entry shape."""
+    payload = mock_current_weather_response_json
+    weather = WeatherModelFactory.create_weather("Kyiv", {**payload["location"], **payload["current"]})
+    client = FakeRedis()
+
+    sent = WeatherEventPublisher(client).publish([weather])
+
+    assert sent == 1
+    name, message = client.sent[0]
+    assert name == channel("kyiv")
+    assert json.loads(message) == json.loads(json.dumps(WeatherDataSerializer(weather).data))
+    assert list(json.loads(message)) == list(WeatherDataRowSerializer.top_fields) + ["wind", "condition"]
+
+
+def test_publish_without_redis_is_noop(settings):
+    """Test publishing when no events Redis is configured. Expect nothing sent."""
+    settings.WEATHER_EVENTS_REDIS_URL = None
+
+    assert WeatherEventPublisher().publish([object()]) == 0
+
+
+@pytest.mark.django_db
+def test_bulk_create_weather_publishes_after_commit(
+    mock_current_weather_response_json, django_capture_on_commit_callbacks
+):
+    """Test storing a new and an outdated reading. Expect only the new latest reading published on commit."""
+    data = {**mock_current_weather_response_json["location"], **mock_current_weather_response_json["current"]}
+    WeatherModelFactory.create_weather("Lviv", {**data, "time_epoch": 1741600000})
+
+    with patch.object(WeatherEventPublisher, "publish") as publish:
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            WeatherModelFactory.bulk_create_weather([
+                ("Kyiv", {**data, "time_epoch": 1741600000}),
+                ("Lviv", {**data, "time_epoch": 1741500000}),
+            ])
+        publish.assert_not_called()
+        for callback in callbacks:
+            callback()
+
+    (published,), _ = publish.call_args
+    assert [weather.city_key for weather in published] == ["kyiv"]
+
+
+def test_stream_readings_frames():
+    """Test the SSE generator with one message and an idle period. Expect retry, reading and keepalive frames."""
+    pubsub = FakePubSub([b'{"id":1}'])
+
+    async def collect():
+        stream = stream_readings(["kyiv"], pubsub=pubsub, keepalive=0.01)
+        frames = [await anext(stream) for _ in range(3)]
+        await stream.aclose()
+        return frames
+
+    frames = asyncio.run(collect())
+
+    assert frames == ["retry: 3000\n\n", 'event: reading\ndata: {"id":1}\n\n', ": keepalive\n\n"]
+    assert pubsub.channels == [channel("kyiv")]
+    assert pubsub.closed
+
+
+def test_stream_view_requires_city():
+    """Test the stream endpoint without a city. Expect 400."""
+    assert Client().get("/api/async/weather/stream/").status_code == 400
+
+
+def test_stream_view_unconfigured(settings):
+    """Test the stream endpoint without an events Redis. Expect 503."""
+    settings.WEATHER_EVENTS_REDIS_URL = None
+
+    assert Client().get("/api/async/weather/stream/", {"city": "Kyiv"}).status_code == 503
+
+
+def test_stream_view_needs_asgi(settings):
+    """Test the stream endpoint served over WSGI. Expect 503 instead of a stream that never flushes."""
+    settings.WEATHER_EVENTS_REDIS_URL = "redis://localhost:6379/0"
+
+    assert Client().get("/api/async/weather/stream/", {"city": "Kyiv"}).status_code == 503
+
+
+def test_stream_view_streams_under_asgi(settings):
+    """Test the stream endpoint served over ASGI. Expect an event stream response."""
+    settings.WEATHER_EVENTS_REDIS_URL = "redis://localhost:6379/0"
+
+    async def no_frames(city_keys):
+        for frame in ():
+            yield frame
+
+    async def request():
+        with patch("weather.async_views.stream_readings", side_effect=no_frames):
+            return await AsyncClient().get("/api/async/weather/stream/", {"city": "Kyiv"})
+
+    response = asyncio.run(request())
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "text/event-stream"
@@ -0,0 +1,101 @@
+"""Tests for forecast and history ingestion of hourly records.
+
+These tests check that hours are bulk-written, that already observed hours
+are skipped using one range query, that forecast hours are flagged and
+refreshed, and that hour timestamps come from time_epoch.
+"""
+
+
+import copy
+from datetime import date, datetime
+from datetime import timezone as dt_timezone
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from weather.models import WeatherData
+from weather.services.forecast_weather_service import ForecastWeatherService
+from weather.services.history_weather_service import HistoryWeatherService
+from weather.services.weather_api_client import WeatherAPIClient
+from weather.services.weather_factory import WeatherModelFactory
+
+
+@pytest.mark.django_db
+def test_forecast_stores_every_hour(mock_forecast_weather_response):
+    """Test a fresh forecast. Expect 24 hours written with one range query and one INSERT."""
+    service = ForecastWeatherService()
+    table = f'"{WeatherData._meta.db_table}"'
+
+    with patch.object(service.api_client, "fetch_data", return_value=mock_forecast_weather_response):
+        with CaptureQueriesContext(connection) as captured:
+            saved = service.get_forecast("London")
+
+    statements = [query["sql"] for query in captured.captured_queries]
+    assert sum(sql.startswith("SELECT") and f"FROM {table}" in sql for sql in statements) == 1
+    assert sum(sql.startswith(f"INSERT INTO {table}") for sql in statements) == 1
+
+    assert len(saved) == 24
+    first_hour = mock_forecast_weather_response["forecast"]["forecastday"][0]["hour"][0]
+    stored = WeatherData.objects.order_by("timestamp").first()
+    assert stored.timestamp == datetime.fromtimestamp(first_hour["time_epoch"], tz=dt_timezone.utc)
+    assert stored.temperature == first_hour["temp_c"]
+
+
+@pytest.mark.django_db
+def test_history_skips_stored_hours(mock_historical_weather_response, django_assert_num_queries):
+    """Test history for a day partly stored already. Expect only missing hours written."""
+    service = HistoryWeatherService()
+    location = mock_historical_weather_response["location"]
+    first_hour = mock_historical_weather_response["forecast"]["forecastday"][0]["hour"][0]
+    WeatherModelFactory.create_weather(location["name"], {**location, **first_hour, "temp_c": -99.0})
+
+    with patch.object(service.api_client, "fetch_data", return_value=mock_historical_weather_response) as fetch:
+        saved = service.get_history("London", date(2025, 3, 6))
+        with django_assert_num_queries(1):
+            again = service.get_history("London", date(2025, 3, 6))
+
+    assert fetch.call_args.args == ("history", {"q": "London", "dt": "2025-03-06"})
+    assert len(saved) == 23
+    assert again == []
+    assert WeatherData.objects.filter(temperature=-99.0).count() == 1
+
+
+@pytest.mark.django_db
+def test_forecast_refreshes_forecast_hours(mock_forecast_weather_response):
+    """Test a second forecast with new values. Expect forecast hours updated in place, observed hours kept."""
+    service = ForecastWeatherService()
+    location = mock_forecast_weather_response["location"]
+    hours = mock_forecast_weather_response["forecast"]["forecastday"][0]["hour"]
+    WeatherModelFactory.bulk_create_weather([(location["name"], {**location, **hours[0], "temp_c": -99.0})])
+    newer = copy.deepcopy(mock_forecast_weather_response)
+    for hour in newer["forecast"]["forecastday"][0]["hour"]:
+        hour["temp_c"] = 42.0
+
+    with patch.object(service.api_client, "fetch_data", side_effect=[mock_forecast_weather_response, newer]):
+        service.get_forecast("London")
+        refreshed = service.get_forecast("London")
+
+    assert len(refreshed) == 23
+    assert WeatherData.objects.count() == 24
+    assert WeatherData.objects.filter(is_forecast=True, temperature=42.0).count() == 23
+    assert WeatherData.objects.get(is_forecast=False).temperature == -99.0
+
+
+@pytest.mark.django_db
+def test_history_replaces_forecast_hours(mock_forecast_weather_response):
+    """Test history for hours stored as forecast. Expect the rows turned into observations."""
+    with patch.object(WeatherAPIClient, "fetch_data", return_value=mock_forecast_weather_response):
+        ForecastWeatherService().get_forecast("London")
+        saved = HistoryWeatherService().get_history("London", date(2025, 3, 6))
+
+    assert len(saved) == 24
+    assert not WeatherData.objects.filter(is_forecast=True).exists()
+
+
+def test_history_reports_malformed_response():
+    """Test a response without hourly data. Expect an error dict."""
+    service = HistoryWeatherService()
+
+    with patch.object(service.api_client, "fetch_data", return_value={"location": {}}):
+        assert service.get_history("London", date(2025, 3, 6)) == {"error": "Failed to fetch historical weather"}
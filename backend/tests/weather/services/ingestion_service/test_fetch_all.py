@@ -0,0 +1,73 @@
+"""Tests for the fetch_all method of MultiCityIngestionService.
+
+These tests check that a polling round fetches every city concurrently,
+separates failures from valid payloads and records timing stats.
+"""
+
+
+import copy
+import threading
+import time
+from unittest.mock import patch
+
+from weather.services.exceptions import WeatherAPIError
+from weather.services.ingestion_service import MultiCityIngestionService
+
+
+def test_fetch_all_collects_payloads(mock_current_weather_response_json):
+    """Test fetch_all with valid responses. Expect one payload per city."""
+    service = MultiCityIngestionService(max_workers=4)
+
+    with patch.object(service, "fetch_current", return_value=mock_current_weather_response_json):
+        ingestion_round = service.fetch_all(["Kyiv", "Lviv", "Odesa"])
+
+    assert set(ingestion_round.payloads) == {"Kyiv", "Lviv", "Odesa"}
+    assert ingestion_round.failed == {}
+    assert ingestion_round.fetch_seconds >= 0
+
+
+def test_fetch_all_records_failures(mock_current_weather_response_json):
+    """Test fetch_all when some cities fail. Expect failures reported per city."""
+    service = MultiCityIngestionService(max_workers=4)
+    broken = copy.deepcopy(mock_current_weather_response_json)
+    broken["current"]["temp_c"] = None
+
+    def fake_fetch(city):
+        if city == "Nowhere":
+            raise WeatherAPIError("No matching location found.")
+        if city == "Broken":
+            return broken
+        return mock_current_weather_response_json
+
+    with patch.object(service, "fetch_current", side_effect=fake_fetch):
+        ingestion_round = service.fetch_all(["Kyiv", "Nowhere", "Broken"])
+
+    assert list(ingestion_round.payloads) == ["Kyiv"]
+    assert ingestion_round.failed == {
+        "Nowhere": "No matching location found.",
+        "Broken": "Missing field: temp_c",
+    }
+    assert ingestion_round.as_dict()["fetched"] == 1
+
+
+def test_fetch_all_runs_concurrently(mock_current_weather_response_json):
+    """Test fetch_all with slow responses. Expect the round to overlap the calls."""
+    service = MultiCityIngestionService(max_workers=8)
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_fetch(city):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return mock_current_weather_response_json
+
+    with patch.object(service, "fetch_current", side_effect=slow_fetch):
+        service.fetch_all([f"City {i}" for i in range(8)])
+
+    assert peak > 1
@@ -0,0 +1,76 @@
+"""Tests for WeatherPartitionManager (PostgreSQL only)."""
+
+from datetime import date, datetime
+from datetime import timezone as dt_timezone
+
+import pytest
+from django.db import connection
+from weather.models import WeatherData
+from weather.services.partition_service import WeatherPartitionManager, add_months
+from weather.services.weather_factory import WeatherModelFactory
+
+pytestmark = [
+    pytest.mark.django_db,
+    pytest.mark.skipif(connection.vendor != "postgresql", reason="partitioning needs PostgreSQL"),
+]
+
+
+def _store(when: datetime, payload: dict) -> WeatherData:
+    weather = WeatherModelFactory.build_weather("Kyiv", {**payload["location"], **payload["current"]})
+    weather.timestamp = when
+    weather.save()
+    return weather
+
+
+def _partition_of(weather: WeatherData) -> str:
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT tableoid::regclass::text FROM {WeatherPartitionManager.TABLE} WHERE id = %s",
+                       [weather.id])
+        return cursor.fetchone()[0]
+
+
+def test_add_months_rolls_over_year():
+    """Test month arithmetic across December. Expect the first day of the target month."""
+    assert add_months(date(2024, 11, 15), 3) == date(2025, 2, 1)
+
+
+def test_ensure_partitions_moves_rows_out_of_default(mock_current_weather_response_json):
+    """Test creating a month that already has rows in the default partition. Expect them moved."""
+    manager = WeatherPartitionManager()
+    weather = _store(datetime(2021, 6, 10, 8, 30, tzinfo=dt_timezone.utc), mock_current_weather_response_json)
+    assert _partition_of(weather) == manager.DEFAULT
+
+    created = manager.ensure_partitions(date(2021, 5, 20), date(2021, 6, 1))
+
+    assert created == [f"{manager.TABLE}_p2021_05", f"{manager.TABLE}_p2021_06"]
+    assert _partition_of(weather) == f"{manager.TABLE}_p2021_06"
+    assert manager.ensure_partitions(date(2021, 5, 1), date(2021, 6, 1)) == []
+
+
+def test_drop_removes_partition_rows(mock_current_weather_response_json):
+    """Test dropping a partition. Expect its rows gone and other months untouched."""
+    manager = WeatherPartitionManager()
+    manager.ensure_partitions(date(2021, 1, 1), date(2021, 2, 1))
+    _store(datetime(2021, 1, 5, tzinfo=dt_timezone.utc), mock_current_weather_response_json)
+    kept = _store(datetime(2021, 2, 5, tzinfo=dt_timezone.utc), mock_current_weather_response_json)
+
+    january = next(p for p in manager.partitions() if p.start == date(2021, 1, 1))
+    manager.drop(january)
+
+    assert list(WeatherData.objects.values_list("id", flat=True)) == [kept.id]
+    assert january not in manager.partitions()
+
+
+def test_between_prunes_other_partitions():
+    """Test the plan of a range query. Expect only the matching month's partition scanned."""
+    manager = WeatherPartitionManager()
+    manager.ensure_partitions(date(2021, 1, 1), date(2021, 3, 1))
+    queryset = WeatherData.objects.between(
+        datetime(2021, 2, 3, 10, 15, tzinfo=dt_timezone.utc), datetime(2021, 2, 9, tzinfo=dt_timezone.utc)
+    )
+
+    plan = queryset.explain()
+
+    assert f"{manager.TABLE}_p2021_02" in plan
+    assert f"{manager.TABLE}_p2021_01" not in plan
+    assert f"{manager.TABLE}_p2021_03" not in plan
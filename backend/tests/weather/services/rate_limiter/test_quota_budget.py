@@ -0,0 +1,66 @@
+"""Tests for QuotaBudget, the monthly WeatherAPI quota accountant."""
+
+
+from datetime import datetime
+from datetime import timezone as dt_timezone
+
+import pytest
+from weather.services.exceptions import RateLimitExceeded
+from weather.services.rate_limiter import QuotaBudget
+
+# 10 days before the end of April
+NOW = datetime(2025, 4, 21, tzinfo=dt_timezone.utc)
+
+
+def test_consume_and_check():
+    """Test consuming the whole quota. Expect further calls to be refused."""
+    budget = QuotaBudget(5, now=lambda: NOW)
+    budget.consume(5)
+
+    assert budget.remaining() == 0
+    with pytest.raises(RateLimitExceeded):
+        budget.check()
+
+
+def test_allowance_spreads_remaining_quota():
+    """Test the per-interval allowance. Expect the remaining quota divided by intervals left."""
+    budget = QuotaBudget(10 * 24 * 1000, now=lambda: NOW)
+
+    # 240 hourly intervals left in the month
+    assert budget.allowance(3600) == 1000
+
+
+def test_plan_spreads_batches_over_interval():
+    """Test planning 100 cities in batches of 25. Expect four evenly spaced batches."""
+    budget = QuotaBudget(0, now=lambda: NOW)
+    cities = [f"City {i}" for i in range(100)]
+
+    plan = budget.plan(cities, 600, 25)
+
+    assert [delay for delay, _ in plan] == [0, 150, 300, 450]
+    assert [city for _, batch in plan for city in batch] == cities
+
+
+def test_plan_rotates_when_quota_is_short():
+    """Test planning more cities than the allowance. Expect a rotating window over the list."""
+    # 240 hourly intervals left, quota for 2 calls per interval
+    budget = QuotaBudget(480, now=lambda: NOW)
+    cities = ["A", "B", "C"]
+
+    first = [c for _, batch in budget.plan(cities, 3600, 10) for c in batch]
+    second = [c for _, batch in budget.plan(cities, 3600, 10) for c in batch]
+
+    assert first == ["A", "B"]
+    assert second == ["C", "A"]
+
+
+def test_reserve_refuses_past_quota():
+    """Test reserving beyond the quota. Expect RateLimitExceeded and the refused call not counted."""
+    budget = QuotaBudget(2, now=lambda: NOW)
+    budget.reserve()
+    budget.reserve()
+
+    with pytest.raises(RateLimitExceeded):
+        budget.reserve()
+
+    assert budget.used() == 2
@@ -0,0 +1,79 @@
+"""Tests for the token buckets used to rate-limit WeatherAPI calls."""
+
+
+from unittest.mock import Mock
+
+import pytest
+import redis
+from weather.services.exceptions import RateLimitExceeded, WeatherAPIError
+from weather.services.rate_limiter import LocalTokenBucket, RedisTokenBucket
+
+
+class FakeClock:
+    """Manual clock; sleeping advances it."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_burst_then_fail_fast():
+    """Test taking more than the burst without waiting. Expect RateLimitExceeded."""
+    clock = FakeClock()
+    bucket = LocalTokenBucket(rate=1, capacity=3, sleep=clock.sleep, clock=clock)
+
+    for _ in range(3):
+        bucket.acquire(wait=False)
+
+    with pytest.raises(RateLimitExceeded):
+        bucket.acquire(wait=False)
+
+
+def test_wait_sleeps_until_refill():
+    """Test acquiring with wait=True on an empty bucket. Expect a sleep of one token period."""
+    clock = FakeClock()
+    bucket = LocalTokenBucket(rate=2, capacity=1, sleep=clock.sleep, clock=clock)
+    bucket.acquire()
+
+    bucket.acquire(wait=True)
+
+    assert clock.now == pytest.approx(0.5)
+
+
+def test_wait_respects_timeout():
+    """Test a wait longer than the timeout. Expect RateLimitExceeded, a WeatherAPIError."""
+    clock = FakeClock()
+    bucket = LocalTokenBucket(rate=0.1, capacity=1, sleep=clock.sleep, clock=clock)
+    bucket.acquire()
+
+    with pytest.raises(WeatherAPIError):
+        bucket.acquire(wait=True, timeout=1)
+
+
+def test_redis_bucket_uses_script_delay():
+    """Test the Redis bucket. Expect the Lua script's delay to drive acquisition."""
+    script = Mock(side_effect=[b"0.25", b"0"])
+    client = Mock(register_script=Mock(return_value=script))
+    sleeps = []
+    bucket = RedisTokenBucket(client, "key", rate=4, capacity=1, sleep=sleeps.append)
+
+    bucket.acquire()
+
+    assert sleeps == [0.25]
+    assert script.call_args.kwargs["keys"] == ["key"]
+
+
+def test_redis_bucket_falls_back_when_unavailable():
+    """Test the Redis bucket while Redis is down. Expect the in-process bucket to be used."""
+    script = Mock(side_effect=redis.ConnectionError("down"))
+    client = Mock(register_script=Mock(return_value=script))
+    bucket = RedisTokenBucket(client, "key", rate=1, capacity=1)
+
+    bucket.acquire(wait=False)
+    with pytest.raises(RateLimitExceeded):
+        bucket.acquire(wait=False)
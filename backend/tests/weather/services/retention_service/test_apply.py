@@ -0,0 +1,77 @@
+"""Tests for WeatherRetentionService rollup and expiry."""
+
+from datetime import date, datetime, timedelta
+from datetime import timezone as dt_timezone
+
+import pytest
+from weather.models import WeatherDailySummary, WeatherData
+from weather.services.partition_service import WeatherPartitionManager
+from weather.services.retention_service import WeatherRetentionService
+from weather.services.weather_factory import WeatherModelFactory
+
+TODAY = date(2024, 6, 15)
+
+
+@pytest.fixture
+def store(mock_current_weather_response_json):
+    """Store hourly Kyiv readings with temperature equal to the hour of day."""
+    payload = mock_current_weather_response_json
+    data = {**payload["location"], **payload["current"]}
+
+    def _store(start: datetime, hours: int):
+        rows = []
+        for i in range(hours):
+            weather = WeatherModelFactory.build_weather("Kyiv", {**data, "temp_c": float(i % 24)})
+            weather.timestamp = start + timedelta(hours=i)
+            weather.fill_keys()
+            rows.append(weather)
+        WeatherData.objects.bulk_create(rows)
+
+    return _store
+
+
+@pytest.mark.django_db
+def test_rollup_writes_daily_summaries(store):
+    """Test rollup of two days. Expect one summary per day with min/mean/max."""
+    start = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+    store(start, 48)
+
+    written = WeatherRetentionService(30).rollup(start, start + timedelta(days=2))
+
+    assert written == 2
+    summary = WeatherDailySummary.objects.get(city_key="kyiv", day=date(2024, 1, 2))
+    assert summary.samples == 24
+    assert (summary.temperature_min, summary.temperature_mean, summary.temperature_max) == (0.0, 11.5, 23.0)
+    assert summary.city == "Kyiv"
+
+
+@pytest.mark.django_db
+def test_apply_expires_whole_months_before_cutoff(store):
+    """Test retention of 100 days on June 15. Expect January and February rolled up and removed."""
+    WeatherPartitionManager().ensure_partitions(date(2024, 1, 1), date(2024, 6, 1))
+    store(datetime(2024, 1, 31, tzinfo=dt_timezone.utc), 48)
+    store(datetime(2024, 3, 1, tzinfo=dt_timezone.utc), 24)
+
+    stats = WeatherRetentionService(100).apply(today=TODAY)
+
+    assert stats.cutoff == date(2024, 3, 1)
+    assert stats.summarized_days == 2
+    assert WeatherData.objects.filter(hour__lt=datetime(2024, 3, 1, tzinfo=dt_timezone.utc)).count() == 0
+    assert WeatherData.objects.count() == 24
+    assert set(WeatherDailySummary.objects.values_list("day", flat=True)) == {date(2024, 1, 31), date(2024, 2, 1)}
+    if WeatherPartitionManager().is_partitioned():
+        assert len(stats.dropped_partitions) == 2
+        assert stats.deleted_rows == 0
+    else:
+        assert stats.deleted_rows == 48
+
+
+@pytest.mark.django_db
+def test_apply_disabled_keeps_everything(store):
+    """Test retention of 0 days. Expect no cutoff and no rows removed."""
+    store(datetime(2020, 1, 1, tzinfo=dt_timezone.utc), 5)
+
+    stats = WeatherRetentionService(0).apply(today=TODAY)
+
+    assert stats.cutoff is None
+    assert WeatherData.objects.count() == 5
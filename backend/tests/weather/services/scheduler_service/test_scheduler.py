@@ -0,0 +1,184 @@
+"""Tests for the adaptive per-city poll scheduler and its hash ring."""
+
+
+from collections import Counter
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django_celery_beat.models import PeriodicTask
+from weather.models import TrackedCity
+from weather.services.scheduler_service import AdaptivePollScheduler, HashRing
+from weather.tasks import dispatch_city_polls
+
+NOW = datetime(2025, 3, 9, 12, 0, tzinfo=dt_timezone.utc)
+KEYS = [f"city {i}" for i in range(2000)]
+
+
+@pytest.fixture(autouse=True)
+def poll_settings(settings):
+    settings.WEATHER_POLL_INTERVAL_SECONDS = 900
+    settings.WEATHER_POLL_MIN_INTERVAL_SECONDS = 300
+    settings.WEATHER_POLL_MAX_INTERVAL_SECONDS = 3600
+    settings.WEATHER_POLL_PRESSURE_SWING = 1.0
+    settings.WEATHER_POLL_TEMPERATURE_SWING = 2.0
+    settings.WEATHER_API_MONTHLY_QUOTA = 0
+
+
+def _payload(epoch_offset_minutes: float, temperature: float, pressure: float) -> dict:
+    observed = NOW + timedelta(minutes=epoch_offset_minutes)
+    return {"current": {"last_updated_epoch": int(observed.timestamp()), "temp_c": temperature,
+                        "pressure_mb": pressure}}
+
+
+def test_hash_ring_spreads_keys_evenly():
+    """Test 2000 keys over four shards. Expect every shard to get roughly a quarter."""
+    ring = HashRing(["s0", "s1", "s2", "s3"])
+
+    counts = Counter(ring.shard_for(key) for key in KEYS)
+
+    assert set(counts) == {"s0", "s1", "s2", "s3"}
+    assert all(350 <= count <= 650 for count in counts.values())
+
+
+def test_hash_ring_adding_shard_moves_only_its_share():
+    """Test adding a fifth shard. Expect about a fifth of the keys to move, all onto the new shard."""
+    before = HashRing(["s0", "s1", "s2", "s3"])
+    after = HashRing(["s0", "s1", "s2", "s3", "s4"])
+
+    moved = [key for key in KEYS if before.shard_for(key) != after.shard_for(key)]
+
+    assert {after.shard_for(key) for key in moved} == {"s4"}
+    assert 250 <= len(moved) <= 550
+
+
+def test_hash_ring_empty():
+    """Test a ring without shards. Expect no shard (the default queue)."""
+    assert HashRing([]).shard_for("kyiv") is None
+
+
+@pytest.mark.django_db
+def test_dispatch_claims_due_cities_once():
+    """Test two dispatches at the same moment. Expect each due city sent once, grouped by shard."""
+    scheduler = AdaptivePollScheduler(shards=["a", "b"])
+    scheduler.track(["Kyiv", "Lviv", " Odesa "], now=NOW)
+    TrackedCity.objects.filter(city_key="odesa").update(next_poll_at=NOW + timedelta(minutes=5))
+
+    plan = scheduler.dispatch(now=NOW)
+
+    assert sorted(city for cities in plan.values() for city in cities) == ["Kyiv", "Lviv"]
+    assert all(scheduler.ring.shard_for(city.lower()) == shard for shard, cities in plan.items() for city in cities)
+    assert TrackedCity.objects.get(city_key="kyiv").next_poll_at == NOW + timedelta(seconds=900)
+    assert scheduler.dispatch(now=NOW) == {}
+
+
+@pytest.mark.django_db
+def test_dispatch_limited_by_quota_most_overdue_first():
+    """Test a quota that affords one call per dispatch. Expect only the most overdue city."""
+    scheduler = AdaptivePollScheduler(shards=[])
+    scheduler.track(["Kyiv", "Lviv"], now=NOW)
+    TrackedCity.objects.filter(city_key="lviv").update(next_poll_at=NOW - timedelta(minutes=10))
+
+    with patch("weather.services.scheduler_service.QuotaBudget.allowance", return_value=1):
+        plan = scheduler.dispatch(now=NOW)
+
+    assert plan == {None: ["Lviv"]}
+
+
+@pytest.mark.django_db
+def test_disabled_cities_not_dispatched():
+    """Test a disabled city. Expect it to stay out of the plan."""
+    scheduler = AdaptivePollScheduler(shards=[])
+    scheduler.track(["Kyiv"], now=NOW)
+    TrackedCity.objects.update(enabled=False)
+
+    assert scheduler.dispatch(now=NOW) == {}
+
+
+@pytest.mark.django_db
+def test_record_adapts_interval_to_swings():
+    """Test a fast pressure drop, then stable readings. Expect the interval halved, then grown."""
+    scheduler = AdaptivePollScheduler(shards=[])
+    scheduler.track(["Kyiv"], now=NOW)
+
+    assert scheduler.record({"Kyiv": _payload(0, 5.0, 1010.0)}, now=NOW) == {"kyiv": 1350}
+    # 2 mb in 30 minutes is 4 mb/h, four times the swing rate
+    assert scheduler.record({"Kyiv": _payload(30, 5.2, 1008.0)}, now=NOW) == {"kyiv": 675}
+    assert scheduler.record({"Kyiv": _payload(45, 5.3, 1007.0)}, now=NOW) == {"kyiv": 338}
+    assert scheduler.record({"Kyiv": _payload(60, 5.3, 1006.0)}, now=NOW) == {"kyiv": 300}
+    # Stable for an hour: back off
+    assert scheduler.record({"Kyiv": _payload(120, 5.4, 1006.1)}, now=NOW) == {"kyiv": 450}
+
+    city = TrackedCity.objects.get(city_key="kyiv")
+    assert city.last_pressure == 1006.1
+    assert city.next_poll_at == NOW + timedelta(seconds=450)
+
+
+@pytest.mark.django_db
+def test_record_unchanged_observation_keeps_interval():
+    """Test the same observation polled again and again. Expect the interval left as it was."""
+    scheduler = AdaptivePollScheduler(shards=[])
+    scheduler.track(["Kyiv"], now=NOW)
+
+    for _ in range(10):
+        intervals = scheduler.record({"Kyiv": _payload(0, 5.0, 1010.0)}, now=NOW)
+
+    assert intervals == {"kyiv": 1350}
+
+
+@pytest.mark.django_db
+def test_record_unchanged_observation_after_swing_keeps_halved_interval():
+    """Test a swing, then a poll before the API refreshed. Expect the interval to stay halved."""
+    scheduler = AdaptivePollScheduler(shards=[])
+    scheduler.track(["Kyiv"], now=NOW)
+    scheduler.record({"Kyiv": _payload(0, 5.0, 1010.0)}, now=NOW)
+    assert scheduler.record({"Kyiv": _payload(30, 5.2, 1008.0)}, now=NOW) == {"kyiv": 675}
+
+    later = NOW + timedelta(seconds=675)
+    assert scheduler.record({"Kyiv": _payload(30, 5.2, 1008.0)}, now=later) == {"kyiv": 675}
+
+    city = TrackedCity.objects.get(city_key="kyiv")
+    assert city.next_poll_at == later + timedelta(seconds=675)
+    # The next real observation is still compared with the one before the repeat
+    assert city.last_pressure == 1008.0
+
+
+@pytest.mark.django_db
+def test_record_ignores_untracked_cities():
+    """Test a payload for a city nobody tracks. Expect nothing recorded."""
+    assert AdaptivePollScheduler(shards=[]).record({"Kyiv": _payload(0, 5.0, 1010.0)}, now=NOW) == {}
+
+
+@pytest.mark.django_db
+def test_dispatch_task_routes_batches_to_shard_queues(settings):
+    """Test the dispatch task. Expect one poll task per shard batch, sent to the shard's queue."""
+    settings.WEATHER_POLL_SHARDS = ["weather-poll-0", "weather-poll-1"]
+    settings.WEATHER_POLL_BATCH_SIZE = 2
+    AdaptivePollScheduler().track([f"City {i}" for i in range(10)])
+
+    with patch("weather.tasks.poll_cities_weather.apply_async") as apply_async:
+        result = dispatch_city_polls()
+
+    assert sum(result.values()) == 10
+    sent = Counter()
+    for call in apply_async.call_args_list:
+        assert len(call.kwargs["args"][0]) <= 2
+        sent[call.kwargs["queue"]] += len(call.kwargs["args"][0])
+    assert dict(sent) == result
+
+
+@pytest.mark.django_db
+def test_track_cities_command_installs_beat_entry(settings):
+    """Test track_cities. Expect tracked cities and a dispatcher periodic task."""
+    settings.WEATHER_CITIES = ["Kyiv", "Lviv"]
+    settings.WEATHER_POLL_DISPATCH_SECONDS = 30
+
+    call_command("track_cities", "Odesa", "--from-settings", stdout=StringIO())
+    call_command("track_cities", "Lviv", "--disable", stdout=StringIO())
+
+    assert set(TrackedCity.objects.filter(enabled=True).values_list("name", flat=True)) == {"Kyiv", "Odesa"}
+    task = PeriodicTask.objects.get(task="weather.tasks.dispatch_city_polls")
+    assert task.interval.every == 30
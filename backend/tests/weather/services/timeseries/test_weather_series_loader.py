@@ -0,0 +1,54 @@
+"""Tests for WeatherSeriesLoader."""
+
+
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+import numpy as np
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from weather.models import WeatherData
+from weather.services.timeseries import WeatherSeriesLoader
+from weather.services.weather_factory import WeatherModelFactory
+
+START = datetime(2025, 3, 1, tzinfo=dt_timezone.utc)
+
+
+@pytest.fixture
+def readings(mock_current_weather_response_json):
+    """Six hourly Kyiv readings (temperature = hour index, the third without humidity) and one Lviv reading."""
+    payload = mock_current_weather_response_json
+    data = {**payload["location"], **payload["current"]}
+    rows = []
+    for city, hours in (("Kyiv", range(6)), ("Lviv", range(1))):
+        for i in hours:
+            reading = {**data, "temp_c": float(i), "humidity": None if i == 2 else 50}
+            weather = WeatherModelFactory.build_weather(city, reading)
+            weather.timestamp = weather.hour = START + timedelta(hours=i)
+            rows.append(weather)
+    WeatherData.objects.bulk_create(rows[::-1])
+
+
+@pytest.mark.django_db
+def test_load_returns_ordered_arrays(readings):
+    """Test loading a range. Expect ascending epoch seconds and float64 columns with NaN for None, in one query."""
+    with CaptureQueriesContext(connection) as queries:
+        series = WeatherSeriesLoader().load("KYIV", START + timedelta(hours=1), START + timedelta(hours=5))
+
+    assert len(queries) == 1
+    assert len(series) == 4
+    assert series.times.tolist() == [(START + timedelta(hours=i)).timestamp() for i in range(1, 5)]
+    assert series["temperature"].dtype == np.float64
+    np.testing.assert_array_equal(series["temperature"], [1.0, 2.0, 3.0, 4.0])
+    np.testing.assert_array_equal(series["humidity"], [50.0, np.nan, 50.0, 50.0])
+    assert series.isoformat()[0] == "2025-03-01T01:00:00Z"
+
+
+@pytest.mark.django_db
+def test_load_empty_range(readings):
+    """Test loading a range without readings. Expect empty arrays for every requested field."""
+    series = WeatherSeriesLoader().load("Kyiv", START - timedelta(days=1), START, fields=("pressure",))
+
+    assert len(series) == 0
+    assert list(series.columns) == ["pressure"]
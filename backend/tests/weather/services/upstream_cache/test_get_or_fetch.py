@@ -0,0 +1,92 @@
+"""Tests for the get_or_fetch method of UpstreamCache.
+
+These tests check TTL caching keyed on normalized params, coalescing of
+concurrent identical calls and the exposed hit/miss/coalesced counters.
+"""
+
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from weather.services.exceptions import WeatherAPIError
+from weather.services.upstream_cache import UpstreamCache
+
+
+@pytest.fixture
+def upstream_cache():
+    return UpstreamCache("default", {"current": 60, "history": 0})
+
+
+def test_second_call_is_cached(upstream_cache):
+    """Test two identical calls. Expect one upstream fetch and one hit."""
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return {"current": {"temp_c": 4.3}}
+
+    upstream_cache.get_or_fetch("current", {"key": "a", "q": "Kyiv"}, fetch)
+    result = upstream_cache.get_or_fetch("current", {"key": "a", "q": "Kyiv"}, fetch)
+
+    assert result == {"current": {"temp_c": 4.3}}
+    assert len(calls) == 1
+    assert upstream_cache.stats()["hits"] == 1
+
+
+def test_key_ignores_api_key_and_case(upstream_cache):
+    """Test keys for differently written params. Expect the same key, without the API key."""
+    key = upstream_cache.key_for("current", {"key": "secret", "q": "Kyiv", "aqi": "no"})
+
+    assert key == upstream_cache.key_for("current", {"q": " kyiv ", "aqi": "NO", "key": "other"})
+    assert "secret" not in key
+    assert key != upstream_cache.key_for("forecast", {"q": "Kyiv", "aqi": "no"})
+
+
+def test_concurrent_calls_are_coalesced(upstream_cache):
+    """Test eight simultaneous identical calls. Expect a single upstream fetch."""
+    calls = []
+    release = threading.Event()
+
+    def fetch():
+        calls.append(1)
+        release.wait(1)
+        return {"current": {}}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(upstream_cache.get_or_fetch, "current", {"q": "Kyiv"}, fetch) for _ in range(8)]
+        time.sleep(0.1)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert len(calls) == 1
+    assert all(r == {"current": {}} for r in results)
+    stats = upstream_cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] + stats["coalesced"] == 7
+
+
+def test_errors_are_not_cached(upstream_cache):
+    """Test a failing fetch followed by a good one. Expect the error to propagate once."""
+    def failing():
+        raise WeatherAPIError("Request failed: boom")
+
+    with pytest.raises(WeatherAPIError):
+        upstream_cache.get_or_fetch("current", {"q": "Kyiv"}, failing)
+
+    assert upstream_cache.get_or_fetch("current", {"q": "Kyiv"}, lambda: {"ok": 1}) == {"ok": 1}
+
+
+def test_zero_ttl_bypasses_cache(upstream_cache):
+    """Test an endpoint with TTL 0. Expect every call to go upstream."""
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return {}
+
+    upstream_cache.get_or_fetch("history", {"q": "Kyiv"}, fetch)
+    upstream_cache.get_or_fetch("history", {"q": "Kyiv"}, fetch)
+
+    assert len(calls) == 2
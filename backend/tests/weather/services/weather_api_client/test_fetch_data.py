@@ -13,7 +13,7 @@ from weather.services.exceptions import WeatherAPIError
 from weather.services.weather_api_client import WeatherAPIClient
 
 
-@patch("weather.services.weather_api_client.requests.get")
+@patch("weather.services.weather_api_client.requests.Session.get")
 def test_fetch_data_success(mock_get, mock_current_weather_response_json):
     """Test fetch_data with valid response. Expect correct weather data returned."""
     # 1. Mocking the API response
@@ -33,7 +33,7 @@ def test_fetch_data_success(mock_get, mock_current_weather_response_json):
     assert result["location"]["name"].lower() == "kyiv"
 
 
-@patch("weather.services.weather_api_client.requests.get")
+@patch("weather.services.weather_api_client.requests.Session.get")
 def test_fetch_data_http_error(mock_get):
     """Test fetch_data when a RequestException occurs. Expect WeatherAPIError."""
     # We mock RequestException itself
@@ -46,7 +46,7 @@ def test_fetch_data_http_error(mock_get):
         client.fetch_data("current", params)
 
 
-@patch("weather.services.weather_api_client.requests.get")
+@patch("weather.services.weather_api_client.requests.Session.get")
 def test_fetch_data_error_in_json(mock_get):
     """Test fetch_data when API returns an error in JSON. Expect WeatherAPIError."""
     # 1. We mock the response with the "error" field
@@ -0,0 +1,138 @@
+"""Tests for the pooled HTTP session of WeatherAPIClient.
+
+These tests check that clients share one keep-alive session, that
+timeouts are split into connect/read, and that 5xx/429 responses are
+retried before WeatherAPIError is raised.
+"""
+
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import Mock, patch
+
+import pytest
+from weather.services.exceptions import RateLimitExceeded, WeatherAPIError
+from weather.services.weather_api_client import WeatherAPIClient
+
+
+@pytest.fixture
+def flaky_server():
+    """Local HTTP server answering with the queued status codes, then 200."""
+    statuses = []
+    calls = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            calls.append(self.path)
+            status = statuses.pop(0) if statuses else 200
+            body = json.dumps({"location": {"name": "Kyiv"}, "current": {}}).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/current.json", statuses, calls
+    server.shutdown()
+
+
+@pytest.fixture
+def fast_retry_client(settings, flaky_server):
+    """Client with its own session, zero backoff and a local endpoint."""
+    settings.WEATHER_API_MAX_RETRIES = 2
+    settings.WEATHER_API_BACKOFF_FACTOR = 0
+    settings.WEATHER_API_BACKOFF_JITTER = 0
+    client = WeatherAPIClient()
+    client.sleep = lambda seconds: None
+    client.session = WeatherAPIClient._build_session()
+    client.BASE_URLS = {"current": flaky_server[0]}
+    return client
+
+
+def test_clients_share_session():
+    """Test two clients in one process. Expect the same pooled session."""
+    assert WeatherAPIClient().session is WeatherAPIClient().session
+
+
+def test_reset_shared_state_rebuilds_session():
+    """Test reset_shared_state. Expect the next client to get a new session."""
+    before = WeatherAPIClient().session
+
+    WeatherAPIClient.reset_shared_state()
+
+    assert WeatherAPIClient().session is not before
+
+
+@patch("weather.services.weather_api_client.requests.Session.get")
+def test_fetch_data_uses_split_timeouts(mock_get, settings, mock_current_weather_response_json):
+    """Test fetch_data passes a (connect, read) timeout tuple."""
+    settings.WEATHER_API_CONNECT_TIMEOUT = 1.5
+    settings.WEATHER_API_READ_TIMEOUT = 7
+    mock_response = Mock()
+    mock_response.json.return_value = mock_current_weather_response_json
+    mock_get.return_value = mock_response
+
+    WeatherAPIClient().fetch_data("current", {"q": "Kyiv"})
+
+    assert mock_get.call_args.kwargs["timeout"] == (1.5, 7)
+
+
+def test_fetch_data_retries_server_errors(fast_retry_client, flaky_server):
+    """Test fetch_data when the API answers 503 then 429. Expect a retried success."""
+    _, statuses, calls = flaky_server
+    statuses.extend([503, 429])
+
+    result = fast_retry_client.fetch_data("current", {"q": "Kyiv"})
+
+    assert result["location"]["name"] == "Kyiv"
+    assert len(calls) == 3
+
+
+def test_fetch_data_retries_exhausted(fast_retry_client, flaky_server):
+    """Test fetch_data when every attempt fails. Expect WeatherAPIError."""
+    _, statuses, calls = flaky_server
+    statuses.extend([502, 502, 502, 502])
+
+    with pytest.raises(WeatherAPIError, match="Request failed"):
+        fast_retry_client.fetch_data("current", {"q": "Kyiv"})
+
+    assert len(calls) == 3
+
+
+def test_fetch_data_reserves_quota_per_attempt(fast_retry_client, flaky_server):
+    """Test fetch_data retrying a 429. Expect one quota unit per upstream attempt."""
+    _, statuses, calls = flaky_server
+    statuses.append(429)
+    fast_retry_client.quota = Mock()
+
+    fast_retry_client.fetch_data("current", {"q": "Kyiv"})
+
+    assert len(calls) == 2
+    assert fast_retry_client.quota.reserve.call_count == 2
+
+
+def test_fetch_data_stops_retrying_at_quota(fast_retry_client, flaky_server):
+    """Test a retry when the monthly quota is spent. Expect RateLimitExceeded and no further call."""
+    _, statuses, calls = flaky_server
+    statuses.append(503)
+    fast_retry_client.quota = Mock()
+    fast_retry_client.quota.reserve.side_effect = [None, RateLimitExceeded("Monthly WeatherAPI quota exhausted")]
+
+    with pytest.raises(RateLimitExceeded):
+        fast_retry_client.fetch_data("current", {"q": "Kyiv"})
+
+    assert len(calls) == 1
+
+
+def test_backoff_honours_retry_after():
+    """Test the retry delay of a response with Retry-After. Expect the header's seconds."""
+    response = Mock(headers={"Retry-After": "7"})
+
+    assert WeatherAPIClient._backoff(0, response) == 7
@@ -0,0 +1,168 @@
+"""Tests for the bulk_create_weather method of WeatherModelFactory.
+
+These tests check that a batch of readings is written with a single INSERT
+and that wind and condition values land on the WeatherData rows.
+"""
+
+
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.db import DatabaseError, connection
+from django.test.utils import CaptureQueriesContext
+from weather.models import LatestWeather, WeatherData
+from weather.services.weather_factory import WeatherModelFactory
+
+
+def _readings(payload, count):
+    data = {**payload["location"], **payload["current"]}
+    return [(f"City {i}", data) for i in range(count)]
+
+
+@pytest.mark.django_db
+def test_bulk_create_weather_single_insert(mock_current_weather_response_json):
+    """Test bulk_create_weather with many readings. Expect one INSERT for the batch."""
+    readings = _readings(mock_current_weather_response_json, 25)
+
+    with CaptureQueriesContext(connection) as captured:
+        saved = WeatherModelFactory.bulk_create_weather(readings)
+
+    statements = [query["sql"] for query in captured.captured_queries]
+    assert sum(sql.startswith(f'INSERT INTO "{WeatherData._meta.db_table}"') for sql in statements) == 1
+    # Plus one LatestWeather read while the observation cache is cold and one AlertRule read
+    # while the rule cache is cold
+    assert len(statements) <= 7
+
+    assert [w.city for w in saved] == [city for city, _ in readings]
+    assert WeatherData.objects.count() == 25
+
+
+@pytest.mark.django_db
+def test_bulk_create_weather_rolls_back(mock_current_weather_response_json, django_capture_on_commit_callbacks):
+    """Test bulk_create_weather when the LatestWeather write fails. Expect no readings stored and no callbacks."""
+    readings = _readings(mock_current_weather_response_json, 3)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        with patch.object(WeatherModelFactory, "update_latest", side_effect=DatabaseError("boom")):
+            with pytest.raises(DatabaseError):
+                WeatherModelFactory.bulk_create_weather(readings)
+
+    assert not WeatherData.objects.exists()
+    assert not LatestWeather.objects.exists()
+    assert not callbacks
+    # The observations were not remembered as stored, so a retry writes them
+    assert len(WeatherModelFactory.bulk_create_weather(readings)) == 3
+
+
+@pytest.mark.django_db
+def test_bulk_create_weather_flat_fields(mock_current_weather_response_json):
+    """Test bulk_create_weather maps wind and condition data onto the reading."""
+    WeatherModelFactory.bulk_create_weather(_readings(mock_current_weather_response_json, 1))
+
+    weather = WeatherData.objects.get()
+    assert weather.wind_speed == 24.1
+    assert weather.wind_direction == "WNW"
+    assert weather.weather_condition == "Overcast"
+    assert weather.weather_icon == "https://cdn.weatherapi.com/weather/64x64/night/122.png"
+
+
+def test_bulk_create_weather_empty():
+    """Test bulk_create_weather with no readings. Expect no database access."""
+    assert not WeatherModelFactory.bulk_create_weather([])
+
+
+@pytest.mark.django_db
+def test_bulk_create_weather_upserts_same_hour(mock_current_weather_response_json):
+    """Test bulk_create_weather twice for one city and hour. Expect one refreshed row."""
+    payload = mock_current_weather_response_json
+    data = {**payload["location"], **payload["current"]}
+
+    first = WeatherModelFactory.bulk_create_weather([("Kyiv", data)])[0]
+    # A newer observation within the same hour
+    newer = {**data, "temp_c": 7.5, "last_updated_epoch": data["last_updated_epoch"] + 600}
+    second = WeatherModelFactory.bulk_create_weather([("KYIV ", newer)])[0]
+
+    assert WeatherData.objects.count() == 1
+    assert second.pk == first.pk
+    assert WeatherData.objects.get().temperature == 7.5
+
+
+@pytest.mark.django_db
+def test_bulk_create_weather_updates_latest(mock_current_weather_response_json):
+    """Test an older reading after a newer one. Expect LatestWeather to keep the newer reading."""
+    payload = mock_current_weather_response_json
+    data = {**payload["location"], **payload["current"]}
+    newer = WeatherModelFactory.create_weather("Kyiv", {**data, "time_epoch": 1741600000, "temp_c": 5.0})
+    WeatherModelFactory.create_weather("KYIV", {**data, "time_epoch": 1741500000, "temp_c": -5.0})
+
+    latest = LatestWeather.objects.get(city_key="kyiv")
+    assert latest.temperature == 5.0
+    assert latest.reading_id == newer.pk
+    assert latest.timestamp == newer.timestamp
+
+
+@pytest.mark.django_db
+def test_bulk_create_weather_ignores_forecast_hours(mock_current_weather_response_json):
+    """Test a reading in the future. Expect it stored but not treated as the latest observation."""
+    payload = mock_current_weather_response_json
+    data = {**payload["location"], **payload["current"]}
+
+    WeatherModelFactory.create_weather("Kyiv", {**data, "time_epoch": 4102444800})
+
+    assert WeatherData.objects.count() == 1
+    assert not LatestWeather.objects.exists()
+
+
+@pytest.mark.django_db
+def test_current_observation_stored_at_upstream_time(mock_current_weather_response_json):
+    """Test a current record. Expect its timestamp to be the upstream last_updated_epoch."""
+    payload = mock_current_weather_response_json
+    weather = WeatherModelFactory.create_weather("Kyiv", {**payload["location"], **payload["current"]})
+
+    assert weather.timestamp.timestamp() == payload["current"]["last_updated_epoch"]
+
+
+@pytest.mark.django_db
+def test_unchanged_observation_skipped(mock_current_weather_response_json, django_capture_on_commit_callbacks):
+    """Test the same observation polled twice. Expect the second poll to write nothing."""
+    payload = mock_current_weather_response_json
+    data = {**payload["location"], **payload["current"]}
+    with django_capture_on_commit_callbacks(execute=True):
+        WeatherModelFactory.bulk_create_weather([("Kyiv", data), ("Lviv", data)])
+
+    with CaptureQueriesContext(connection) as captured:
+        saved = WeatherModelFactory.bulk_create_weather([("Kyiv", {**data, "temp_c": 99.0}), ("Lviv", data)])
+
+    assert saved == []
+    assert captured.captured_queries == []
+    assert WeatherData.objects.filter(temperature=99.0).count() == 0
+
+
+@pytest.mark.django_db
+def test_unchanged_observation_skipped_from_database(mock_current_weather_response_json):
+    """Test a repeated observation with nothing cached. Expect LatestWeather to tell it is stored."""
+    payload = mock_current_weather_response_json
+    data = {**payload["location"], **payload["current"]}
+    WeatherModelFactory.bulk_create_weather([("Kyiv", data)])
+    cache.clear()
+
+    newer = {**data, "last_updated_epoch": data["last_updated_epoch"] + 900}
+    saved = WeatherModelFactory.bulk_create_weather([("Kyiv", data), ("Lviv", data), ("Kyiv", newer)])
+
+    assert [(w.city_key, w.timestamp.timestamp()) for w in saved] == [
+        ("lviv", data["last_updated_epoch"]), ("kyiv", newer["last_updated_epoch"]),
+    ]
+
+
+@pytest.mark.django_db
+def test_hourly_records_never_skipped(mock_current_weather_response_json):
+    """Test the same hourly record twice. Expect both writes (forecast hours are refreshed)."""
+    payload = mock_current_weather_response_json
+    data = {**payload["location"], **payload["current"], "time_epoch": 1741500000}
+
+    WeatherModelFactory.bulk_create_weather([("Kyiv", data)])
+    saved = WeatherModelFactory.bulk_create_weather([("Kyiv", {**data, "temp_c": 3.0})])
+
+    assert len(saved) == 1
+    assert WeatherData.objects.get().temperature == 3.0
@@ -0,0 +1,108 @@
+"""Tests for the async read views under /api/async/weather/.
+
+These tests check that each async endpoint returns the same body as its
+WeatherDataViewSet counterpart and keeps the ETag/304 behaviour.
+"""
+
+
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+import pytest
+from django.test import Client
+from weather.models import WeatherData
+from weather.services.weather_factory import WeatherModelFactory
+
+START = datetime(2025, 3, 1, tzinfo=dt_timezone.utc)
+
+
+@pytest.fixture
+def readings(mock_current_weather_response_json):
+    """Six hourly Kyiv readings and one Lviv reading, also reflected in LatestWeather."""
+    payload = mock_current_weather_response_json
+    data = {**payload["location"], **payload["current"]}
+    readings = [("Kyiv", {**data, "time_epoch": int((START + timedelta(hours=i)).timestamp()), "temp_c": float(i)})
+                for i in range(6)]
+    readings.append(("Lviv", {**data, "time_epoch": int(START.timestamp())}))
+    WeatherModelFactory.bulk_create_weather(readings)
+
+
+def _without_links(body: dict) -> dict:
+    return {key: value for key, value in body.items() if key not in ("next", "previous")}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("query", [
+    {"city": "kyiv", "page_size": 4},
+    {"page_size": 50},
+])
+def test_async_list_matches_sync(readings, query):
+    """Test the async list. Expect the sync list's results and a working next link."""
+    client = Client()
+
+    sync_body = client.get("/api/weather/", {**query, "pagination": "keyset"}).json()
+    async_response = client.get("/api/async/weather/", query)
+
+    assert async_response.status_code == 200
+    assert _without_links(async_response.json()) == _without_links(sync_body)
+    assert (async_response.json()["next"] is None) == (sync_body["next"] is None)
+
+
+@pytest.mark.django_db
+def test_async_list_follows_cursor(readings):
+    """Test following the async next link. Expect the remaining Kyiv rows."""
+    client = Client()
+
+    first = client.get("/api/async/weather/", {"city": "kyiv", "page_size": 4}).json()
+    second = client.get(first["next"]).json()
+
+    temperatures = [row["temperature"] for row in first["results"] + second["results"]]
+    assert temperatures == [5.0, 4.0, 3.0, 2.0, 1.0, 0.0]
+    assert second["next"] is None
+
+
+@pytest.mark.django_db
+def test_async_latest_matches_sync(readings):
+    """Test the async latest endpoint. Expect the sync body."""
+    client = Client()
+
+    response = client.get("/api/async/weather/latest/")
+
+    assert response.status_code == 200
+    assert response.json() == client.get("/api/weather/latest/").json()
+    assert len(response.json()["results"]) == 2
+
+
+@pytest.mark.django_db
+def test_async_aggregate_matches_sync(readings):
+    """Test the async aggregate endpoint. Expect the sync results."""
+    client = Client()
+    query = {"city": "Kyiv", "start": "2025-03-01T00:00:00Z", "end": "2025-03-02T00:00:00Z", "bucket": "hour"}
+
+    response = client.get("/api/async/weather/aggregate/", query)
+
+    assert response.status_code == 200
+    assert response.json()["results"] == client.get("/api/weather/aggregate/", query).json()["results"]
+    assert len(response.json()["results"]) == 6
+
+
+@pytest.mark.django_db
+def test_async_aggregate_requires_city():
+    """Test the async aggregate endpoint without a city. Expect 400 with the field error."""
+    response = Client().get("/api/async/weather/aggregate/")
+
+    assert response.status_code == 400
+    assert "city" in response.json()
+
+
+@pytest.mark.django_db
+def test_async_if_none_match_returns_304(readings, django_assert_num_queries):
+    """Test a conditional async request with the current ETag. Expect 304 without queries."""
+    client = Client()
+    etag = client.get("/api/async/weather/latest/")["ETag"]
+
+    with django_assert_num_queries(0):
+        response = client.get("/api/async/weather/latest/", HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+    assert WeatherData.objects.count() == 7
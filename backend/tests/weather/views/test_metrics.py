@@ -0,0 +1,106 @@
+"""Tests for the Prometheus metrics and the /metrics endpoint."""
+
+
+from unittest.mock import Mock, patch
+
+import pytest
+from app.celery_app import debug_task
+from django.db import transaction
+from prometheus_client import REGISTRY
+from rest_framework.test import APIClient
+from weather.services.weather_api_client import WeatherAPIClient
+from weather.services.weather_factory import WeatherModelFactory
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_exposes_request_latency(settings):
+    """Test GET /metrics after an API call. Expect the view's latency histogram in the text format."""
+    settings.WEATHER_CACHE_TIMEOUT = 0
+    APIClient().get("/api/weather/latest/")
+
+    response = APIClient().get("/metrics")
+
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain")
+    assert (
+        'weather_http_request_seconds_count{method="GET",status="200",view="weather-latest"}'
+        in response.content.decode()
+    )
+
+
+@pytest.mark.django_db
+def test_response_cache_hits_and_misses_counted(settings):
+    """Test two identical reads. Expect one response cache miss then one hit."""
+    settings.WEATHER_CACHE_TIMEOUT = 60
+    hits = sample("weather_response_cache_lookups_total", result="hit")
+    misses = sample("weather_response_cache_lookups_total", result="miss")
+
+    APIClient().get("/api/weather/latest/", {"city": "metrics-city"})
+    APIClient().get("/api/weather/latest/", {"city": "metrics-city"})
+
+    assert sample("weather_response_cache_lookups_total", result="miss") == misses + 1
+    assert sample("weather_response_cache_lookups_total", result="hit") == hits + 1
+
+
+@pytest.mark.django_db
+def test_ingestion_counts_rows_and_times_writes(
+    mock_current_weather_response_json, django_capture_on_commit_callbacks
+):
+    """Test a bulk upsert. Expect rows counted per city and both write phases timed."""
+    payload = mock_current_weather_response_json
+    data = {**payload["location"], **payload["current"]}
+    rows = sample("weather_rows_ingested_total", city="kyiv")
+    writes = sample("weather_db_write_seconds_count", operation="weather_upsert")
+    latest = sample("weather_db_write_seconds_count", operation="latest_upsert")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        WeatherModelFactory.bulk_create_weather([
+            ("Kyiv", {**data, "time_epoch": 1741500000}),
+            ("Kyiv", {**data, "time_epoch": 1741503600}),
+        ])
+
+    assert sample("weather_rows_ingested_total", city="kyiv") == rows + 2
+    assert sample("weather_db_write_seconds_count", operation="weather_upsert") == writes + 1
+    assert sample("weather_db_write_seconds_count", operation="latest_upsert") == latest + 1
+
+
+@pytest.mark.django_db
+def test_rolled_back_rows_not_counted(mock_current_weather_response_json, django_capture_on_commit_callbacks):
+    """Test a bulk upsert whose transaction rolls back. Expect no rows counted."""
+    payload = mock_current_weather_response_json
+    data = {**payload["location"], **payload["current"]}
+    rows = sample("weather_rows_ingested_total", city="kyiv")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        with pytest.raises(RuntimeError), transaction.atomic():
+            WeatherModelFactory.bulk_create_weather([("Kyiv", {**data, "time_epoch": 1741500000})])
+            raise RuntimeError("rolled back")
+
+    assert sample("weather_rows_ingested_total", city="kyiv") == rows
+
+
+@patch("weather.services.weather_api_client.requests.Session.get")
+def test_upstream_latency_labelled_by_endpoint_and_status(mock_get, settings):
+    """Test a WeatherAPI call. Expect one observation under its endpoint and HTTP status."""
+    settings.WEATHER_API_CACHE_TTL = {"forecast": 0}
+    WeatherAPIClient.reset_shared_state()
+    mock_get.return_value = Mock(status_code=200, json=Mock(return_value={"forecast": {}}))
+    before = sample("weather_upstream_request_seconds_count", endpoint="forecast", status="200")
+
+    WeatherAPIClient().fetch_data("forecast", {"q": "Kyiv"})
+
+    WeatherAPIClient.reset_shared_state()
+    assert sample("weather_upstream_request_seconds_count", endpoint="forecast", status="200") == before + 1
+
+
+def test_task_runtime_observed():
+    """Test running a Celery task. Expect its runtime observed with the final state."""
+    before = sample("weather_task_seconds_count", task=debug_task.name, state="SUCCESS")
+
+    debug_task.apply()
+
+    assert sample("weather_task_seconds_count", task=debug_task.name, state="SUCCESS") == before + 1
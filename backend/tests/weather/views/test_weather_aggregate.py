@@ -0,0 +1,58 @@
+"""Tests for the /api/weather/aggregate/ endpoint."""
+
+
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+import pytest
+from rest_framework.test import APIClient
+from weather.models import WeatherData
+from weather.services.weather_factory import WeatherModelFactory
+
+START = datetime(2025, 3, 1, tzinfo=dt_timezone.utc)
+
+
+@pytest.fixture
+def two_days(mock_current_weather_response_json):
+    """48 hourly Kyiv readings with temperature equal to the hour index."""
+    payload = mock_current_weather_response_json
+    data = {**payload["location"], **payload["current"]}
+    rows = []
+    for i in range(48):
+        weather = WeatherModelFactory.build_weather("Kyiv", {**data, "temp_c": float(i)})
+        weather.timestamp = weather.hour = START + timedelta(hours=i)
+        rows.append(weather)
+    WeatherData.objects.bulk_create(rows)
+
+
+@pytest.mark.django_db
+def test_aggregate_daily_buckets(two_days):
+    """Test daily buckets over two days. Expect min/mean/max per day."""
+    response = APIClient().get("/api/weather/aggregate/", {
+        "city": "KYIV", "start": "2025-03-01T00:00:00Z", "end": "2025-03-03T00:00:00Z", "bucket": "day",
+    })
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["samples"] for r in results] == [24, 24]
+    assert results[0]["temperature"] == {"min": 0.0, "mean": 11.5, "max": 23.0}
+    assert results[1]["temperature"]["max"] == 47.0
+
+
+@pytest.mark.django_db
+def test_aggregate_downsamples(two_days):
+    """Test hourly buckets with points=10. Expect ten points including both ends."""
+    response = APIClient().get("/api/weather/aggregate/", {
+        "city": "kyiv", "start": "2025-03-01T00:00:00Z", "end": "2025-03-03T00:00:00Z", "points": 10,
+    })
+
+    results = response.json()["results"]
+    assert len(results) == 10
+    assert results[0]["temperature"]["mean"] == 0.0
+    assert results[-1]["temperature"]["mean"] == 47.0
+
+
+def test_aggregate_requires_city():
+    """Test a request without city. Expect 400."""
+    response = APIClient().get("/api/weather/aggregate/")
+    assert response.status_code == 400
@@ -0,0 +1,56 @@
+"""Tests for the /api/weather/derived/ endpoint."""
+
+
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+import pytest
+from rest_framework.test import APIClient
+from weather.models import WeatherData
+from weather.services.weather_factory import WeatherModelFactory
+
+START = datetime(2025, 3, 1, tzinfo=dt_timezone.utc)
+
+
+@pytest.fixture
+def six_hours(mock_current_weather_response_json):
+    """Six hourly Kyiv readings with temperature equal to the hour index, the last without humidity."""
+    payload = mock_current_weather_response_json
+    data = {**payload["location"], **payload["current"]}
+    rows = []
+    for i in range(6):
+        reading = {**data, "temp_c": float(i), "humidity": None if i == 5 else data["humidity"]}
+        weather = WeatherModelFactory.build_weather("Kyiv", reading)
+        weather.timestamp = weather.hour = START + timedelta(hours=i)
+        rows.append(weather)
+    WeatherData.objects.bulk_create(rows)
+
+
+@pytest.mark.django_db
+def test_derived_columns(six_hours):
+    """Test a three-hour window. Expect one value per reading in every series, rolling over three hours."""
+    response = APIClient().get("/api/weather/derived/", {
+        "city": "KYIV", "start": "2025-03-01T00:00:00Z", "end": "2025-03-02T00:00:00Z", "window_hours": 3,
+    })
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["window_hours"] == 3
+    assert body["timestamps"][0] == "2025-03-01T00:00:00Z"
+    assert len(body["timestamps"]) == 6
+    assert body["series"]["temperature_rolling_mean"] == [0.0, 0.5, 1.0, 2.0, 3.0, 4.0]
+    assert body["series"]["temperature_rolling_std"][1] == 0.5
+    assert {len(values) for values in body["series"].values()} == {6}
+    assert body["series"]["heat_index"][-1] is None
+
+
+def test_derived_rejects_bad_window():
+    """Test a zero-hour window. Expect 400."""
+    response = APIClient().get("/api/weather/derived/", {"city": "Kyiv", "window_hours": 0})
+    assert response.status_code == 400
+
+
+def test_derived_requires_city():
+    """Test a request without city. Expect 400."""
+    response = APIClient().get("/api/weather/derived/")
+    assert response.status_code == 400
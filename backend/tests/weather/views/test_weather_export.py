@@ -0,0 +1,112 @@
+"""Tests for the /api/weather/export/ streaming endpoint."""
+
+import csv
+import io
+import json
+import re
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+import pytest
+from django.test import Client
+from weather.models import WeatherData
+from weather.services.export_service import EXPORT_FIELDS, WeatherExportService
+from weather.services.weather_factory import WeatherModelFactory
+
+START = datetime(2025, 3, 1, tzinfo=dt_timezone.utc)
+
+
+@pytest.fixture
+def readings(mock_current_weather_response_json):
+    """Five hourly Kyiv readings and one Lviv reading."""
+    payload = mock_current_weather_response_json
+    data = {**payload["location"], **payload["current"]}
+    rows = []
+    for i in range(5):
+        weather = WeatherModelFactory.build_weather("Kyiv", {**data, "temp_c": float(i)})
+        weather.timestamp = weather.hour = START + timedelta(hours=i)
+        rows.append(weather)
+    lviv = WeatherModelFactory.build_weather("Lviv", data)
+    lviv.timestamp = lviv.hour = START
+    rows.append(lviv)
+    WeatherData.objects.bulk_create(rows)
+
+
+def _body(response) -> bytes:
+    return b"".join(response.streaming_content)
+
+
+@pytest.mark.django_db
+def test_export_csv_streams_filtered_rows(readings, settings):
+    """Test CSV export with city and range filters. Expect a header and rows in time order."""
+    settings.WEATHER_EXPORT_BATCH_SIZE = 2
+    response = Client().get("/api/weather/export/", {
+        "city": "kyiv", "start": "2025-03-01T01:00:00Z", "end": "2025-03-01T04:00:00Z",
+    })
+
+    assert response.status_code == 200
+    assert response.streaming
+    assert response["Content-Type"].startswith("text/csv")
+    assert "attachment" in response["Content-Disposition"]
+    rows = list(csv.reader(io.StringIO(_body(response).decode())))
+    assert rows[0] == list(EXPORT_FIELDS)
+    assert [float(row[EXPORT_FIELDS.index("temperature")]) for row in rows[1:]] == [1.0, 2.0, 3.0]
+
+
+@pytest.mark.django_db
+def test_export_ndjson_one_object_per_line(readings):
+    """Test NDJSON export without filters. Expect every row as a JSON object."""
+    response = Client().get("/api/weather/export/", {"format": "ndjson"})
+
+    assert response.status_code == 200
+    lines = _body(response).decode().splitlines()
+    assert len(lines) == 6
+    first = json.loads(lines[0])
+    assert set(first) == set(EXPORT_FIELDS)
+    assert first["timestamp"] == "2025-03-01T00:00:00Z"
+
+
+@pytest.mark.django_db
+def test_export_rejects_unknown_format():
+    """Test an unsupported format. Expect 400 with the field error."""
+    response = Client().get("/api/weather/export/", {"format": "xml"})
+
+    assert response.status_code == 400
+    assert "format" in response.json()
+
+
+@pytest.mark.django_db
+def test_export_parquet(readings):
+    """Test Parquet export. Expect a readable file, or 406 when pyarrow is missing."""
+    response = Client().get("/api/weather/export/", {"format": "parquet", "city": "Lviv"})
+
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        assert response.status_code == 406
+        return
+
+    assert response.status_code == 200
+    table = pq.read_table(io.BytesIO(_body(response)))
+    assert table.num_rows == 1
+    assert table.column_names == list(EXPORT_FIELDS)
+
+
+def test_ndjson_stream_batches_rows():
+    """Test the NDJSON encoder with a small batch size. Expect one chunk per batch."""
+    row = tuple(range(len(EXPORT_FIELDS)))
+    chunks = list(WeatherExportService(batch_size=2).ndjson_stream([row] * 5))
+
+    assert len(chunks) == 3
+    assert sum(chunk.count(b"\n") for chunk in chunks) == 5
+
+
+@pytest.mark.django_db
+def test_export_filename_from_hostile_city():
+    """Test a city with quotes and a newline. Expect a slugged filename in a well-formed header."""
+    response = Client().get("/api/weather/export/", {"city": 'New  "York"\r\nX-Injected: 1'})
+
+    assert response.status_code == 200
+    header = response["Content-Disposition"]
+    assert re.fullmatch(r'attachment; filename="weather-new-york-x-injected-1-\d{14}\.csv"', header)
+    assert "X-Injected" not in response
@@ -0,0 +1,55 @@
+"""Tests for the /api/weather/latest/ endpoint."""
+
+
+import pytest
+from rest_framework.test import APIClient
+from weather.services.weather_factory import WeatherModelFactory
+
+
+@pytest.fixture
+def readings(mock_current_weather_response_json):
+    """Two Kyiv readings an hour apart and one Lviv reading."""
+    payload = mock_current_weather_response_json
+    data = {**payload["location"], **payload["current"]}
+    WeatherModelFactory.create_weather("Kyiv", {**data, "time_epoch": 1741500000, "temp_c": 1.0})
+    WeatherModelFactory.create_weather("Kyiv", {**data, "time_epoch": 1741503600, "temp_c": 2.0})
+    return WeatherModelFactory.create_weather("Lviv", {**data, "time_epoch": 1741500000, "temp_c": 3.0})
+
+
+@pytest.mark.django_db
+def test_latest_one_row_per_city(readings, django_assert_num_queries):
+    """Test the latest endpoint. Expect the newest reading per city from a single query."""
+    with django_assert_num_queries(1):
+        response = APIClient().get("/api/weather/latest/")
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [(r["city"], r["temperature"]) for r in results] == [("Kyiv", 2.0), ("Lviv", 3.0)]
+    assert results[1]["id"] == readings.pk
+    assert set(results[0]["wind"]) == {"wind_speed", "wind_direction", "wind_gust", "wind_degree"}
+
+
+@pytest.mark.django_db
+def test_latest_filtered_by_city(readings):
+    """Test ?city= on the latest endpoint. Expect only that city."""
+    response = APIClient().get("/api/weather/latest/", {"city": " LVIV "})
+
+    assert [r["city"] for r in response.json()["results"]] == ["Lviv"]
+
+
+@pytest.mark.django_db
+def test_latest_refreshed_after_new_reading(
+    readings, mock_current_weather_response_json, django_capture_on_commit_callbacks
+):
+    """Test a cached latest response followed by a new reading. Expect the new value served."""
+    payload = mock_current_weather_response_json
+    client = APIClient()
+    client.get("/api/weather/latest/")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        WeatherModelFactory.create_weather("Lviv", {
+            **payload["location"], **payload["current"], "time_epoch": 1741510000, "temp_c": 9.0,
+        })
+
+    results = client.get("/api/weather/latest/").json()["results"]
+    assert results[1]["temperature"] == 9.0
@@ -0,0 +1,107 @@
+"""Tests for pagination of the /api/weather/ list endpoint.
+
+These tests check the default page-number pagination and walk the opt-in
+keyset-paginated list forwards and backwards, including readings that share
+a timestamp.
+"""
+
+
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+import pytest
+from rest_framework.test import APIClient
+from weather.models import WeatherData
+from weather.services.weather_factory import WeatherModelFactory
+
+START = datetime(2025, 3, 1, tzinfo=dt_timezone.utc)
+
+
+@pytest.fixture
+def readings(mock_current_weather_response_json):
+    """Seven readings for Kyiv; the first three share one timestamp."""
+    payload = mock_current_weather_response_json
+    data = {**payload["location"], **payload["current"]}
+    saved = []
+    for i in range(7):
+        weather = WeatherModelFactory.build_weather("Kyiv", data)
+        weather.timestamp = START + timedelta(hours=max(i - 2, 0))
+        weather.hour = START + timedelta(hours=i)
+        saved.append(weather)
+    return WeatherData.objects.bulk_create(saved)
+
+
+def _ids(response):
+    return [row["id"] for row in response.json()["results"]]
+
+
+@pytest.mark.django_db
+def test_keyset_walks_all_pages(readings, django_assert_num_queries):
+    """Test following `next` links. Expect every row once, newest first, without COUNT."""
+    client = APIClient()
+    expected = [w.id for w in sorted(readings, key=lambda w: (w.timestamp, w.id), reverse=True)]
+
+    seen = []
+    url = "/api/weather/?city=kyiv&page_size=2&pagination=keyset"
+    while url:
+        with django_assert_num_queries(1):
+            response = client.get(url)
+        seen.extend(_ids(response))
+        url = response.json()["next"]
+
+    assert seen == expected
+
+
+@pytest.mark.django_db
+def test_keyset_previous_link(readings):
+    """Test following `next` then `previous`. Expect to land on the first page again."""
+    client = APIClient()
+    first = client.get("/api/weather/?page_size=3&pagination=keyset")
+    second = client.get(first.json()["next"])
+    back = client.get(second.json()["previous"])
+
+    assert first.json()["previous"] is None
+    assert _ids(back) == _ids(first)
+    assert back.json()["previous"] is None
+
+
+@pytest.mark.django_db
+def test_invalid_cursor_returns_404():
+    """Test a tampered cursor. Expect 404."""
+    response = APIClient().get("/api/weather/?cursor=not-a-cursor")
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_page_number_mode(readings, settings):
+    """Test ?page=N. Expect the page-number response with a total count."""
+    settings.WEATHER_MAX_PAGE_SIZE = 5
+    response = APIClient().get("/api/weather/?page=1&page_size=50")
+
+    body = response.json()
+    assert body["count"] == 7
+    assert len(body["results"]) == 5
+
+
+@pytest.mark.django_db
+def test_page_number_is_default(readings):
+    """Test the list without pagination parameters. Expect the page-number response with count and links."""
+    body = APIClient().get("/api/weather/?page_size=3").json()
+
+    assert body["count"] == 7
+    assert body["previous"] is None
+    assert "page=2" in body["next"]
+
+
+@pytest.mark.django_db
+def test_list_excludes_forecast_hours(readings, mock_current_weather_response_json):
+    """Test a stored forecast hour newer than every reading. Expect it left out of the list."""
+    payload = mock_current_weather_response_json
+    tomorrow = int((START + timedelta(days=1)).timestamp())
+    forecast = {**payload["location"], **payload["current"], "time_epoch": tomorrow}
+    WeatherModelFactory.bulk_create_weather([("Kyiv", forecast)], forecast=True)
+
+    response = APIClient().get("/api/weather/", {"page_size": 100})
+
+    assert len(_ids(response)) == len(readings)
+    assert WeatherData.objects.get(is_forecast=True).id not in _ids(response)
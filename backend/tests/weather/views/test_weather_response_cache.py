@@ -0,0 +1,123 @@
+"""Tests for response caching of the weather read API.
+
+These tests check that repeated reads are served from the cache, that
+storing a reading for a city invalidates only that city, that default time
+ranges and retention do not serve stale responses, and that If-None-Match
+polls are answered with 304 without a query.
+"""
+
+
+import itertools
+from datetime import date, datetime, timedelta
+from datetime import timezone as dt_timezone
+from unittest.mock import patch
+
+import pytest
+from rest_framework.test import APIClient
+from weather.services.retention_service import WeatherRetentionService
+from weather.services.weather_factory import WeatherModelFactory
+
+
+@pytest.fixture
+def store(mock_current_weather_response_json, django_capture_on_commit_callbacks):
+    """Persist a new observation for a city and run the post-commit invalidation."""
+    payload = mock_current_weather_response_json
+    minutes = itertools.count()
+
+    def _store(city, temp_c):
+        # Each call is a newer observation within the same hour
+        epoch = payload["current"]["last_updated_epoch"] + next(minutes) * 60
+        data = {**payload["location"], **payload["current"], "temp_c": temp_c, "last_updated_epoch": epoch}
+        with django_capture_on_commit_callbacks(execute=True):
+            WeatherModelFactory.create_weather(city, data)
+
+    return _store
+
+
+@pytest.mark.django_db
+def test_repeated_list_is_cached(store, django_assert_num_queries):
+    """Test two identical reads. Expect the second one without queries."""
+    store("Kyiv", 4.0)
+    client = APIClient()
+
+    first = client.get("/api/weather/?city=kyiv")
+    with django_assert_num_queries(0):
+        second = client.get("/api/weather/?city=kyiv")
+
+    assert second.json() == first.json()
+    assert second["ETag"] == first["ETag"]
+
+
+@pytest.mark.django_db
+def test_ingest_invalidates_city(store):
+    """Test a new reading for the city. Expect fresh data and a new ETag."""
+    store("Kyiv", 4.0)
+    client = APIClient()
+    before = client.get("/api/weather/?city=kyiv")
+
+    store("Kyiv", 9.0)
+    after = client.get("/api/weather/?city=kyiv")
+
+    assert after.json()["results"][0]["temperature"] == 9.0
+    assert after["ETag"] != before["ETag"]
+
+
+@pytest.mark.django_db
+def test_ingest_keeps_other_cities(store):
+    """Test a reading for another city. Expect this city's ETag unchanged."""
+    store("Kyiv", 4.0)
+    client = APIClient()
+    before = client.get("/api/weather/?city=kyiv")
+
+    store("Lviv", 1.0)
+    after = client.get("/api/weather/?city=kyiv")
+
+    assert after["ETag"] == before["ETag"]
+
+
+@pytest.mark.django_db
+def test_if_none_match_returns_304(store, django_assert_num_queries):
+    """Test a conditional poll with the current ETag. Expect 304 and no queries."""
+    store("Kyiv", 4.0)
+    client = APIClient()
+    etag = client.get("/api/weather/?city=kyiv")["ETag"]
+
+    with django_assert_num_queries(0):
+        response = client.get("/api/weather/?city=kyiv", HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_default_range_cached_per_minute(store):
+    """Test aggregate reads without start/end. Expect the cached window to move on every minute."""
+    store("Kyiv", 4.0)
+    client = APIClient()
+    now = datetime(2025, 3, 9, 12, 0, 10, tzinfo=dt_timezone.utc)
+
+    with patch("django.utils.timezone.now", return_value=now):
+        first = client.get("/api/weather/aggregate/?city=kyiv")
+    with patch("django.utils.timezone.now", return_value=now + timedelta(seconds=30)):
+        same_minute = client.get("/api/weather/aggregate/?city=kyiv")
+    with patch("django.utils.timezone.now", return_value=now + timedelta(minutes=1)):
+        next_minute = client.get("/api/weather/aggregate/?city=kyiv")
+
+    assert same_minute["ETag"] == first["ETag"]
+    assert next_minute["ETag"] != first["ETag"]
+    assert next_minute.json()["end"] == "2025-03-09T12:01:00Z"
+
+
+@pytest.mark.django_db
+def test_retention_invalidates_cached_responses(store, django_capture_on_commit_callbacks):
+    """Test retention removing the stored readings. Expect the cached list dropped."""
+    store("Kyiv", 4.0)
+    client = APIClient()
+    before = client.get("/api/weather/")
+    assert before.json()["results"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        WeatherRetentionService(30).apply(today=date(2030, 1, 1))
+    after = client.get("/api/weather/")
+
+    assert after["ETag"] != before["ETag"]
+    assert after.json()["results"] == []
@@ -1,11 +1,196 @@
 """Admin configuration for managing weather-related models in Django admin."""
 
+import abc
+
+from django.conf import settings
 from django.contrib import admin
-from weather.models import WeatherCondition, WeatherData, WindData
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.core.cache import caches
+from weather.models import AlertEvent, AlertRule, LatestWeather, TrackedCity, WeatherData
+from weather.pagination import EstimatedCountPaginator
+
+
+class RangeListFilter(admin.SimpleListFilter):
+    """
+    Filter a continuous column by fixed buckets.
+
+    Django's default filter for a field lists its distinct values, which is a
+    SELECT DISTINCT over the whole table on every changelist load. Buckets
+    are known up front, so building the sidebar costs no query at all.
+    """
+
+    field_name = None
+    # Ascending bucket edges: below the first, between each pair, from the last up
+    bounds = ()
+
+    def lookups(self, request, model_admin):
+        edges = [None, *self.bounds, None]
+        choices = []
+        for lower, upper in zip(edges, edges[1:]):
+            value = f"{'' if lower is None else lower}:{'' if upper is None else upper}"
+            if lower is None:
+                label = f"< {upper:g}"
+            elif upper is None:
+                label = f"≥ {lower:g}"
+            else:
+                label = f"{lower:g} to {upper:g}"
+            choices.append((value, label))
+        return choices
+
+    def queryset(self, request, queryset):
+        if not self.value():
+            return queryset
+        lower, _, upper = self.value().partition(":")
+        try:
+            if lower:
+                queryset = queryset.filter(**{f"{self.field_name}__gte": float(lower)})
+            if upper:
+                queryset = queryset.filter(**{f"{self.field_name}__lt": float(upper)})
+        except ValueError as e:
+            raise IncorrectLookupParameters(e) from e
+        return queryset
+
+
+class TemperatureFilter(RangeListFilter):
+    """Temperature in 10 °C bands."""
+
+    title = "temperature (°C)"
+    parameter_name = field_name = "temperature"
+    bounds = (-20, -10, 0, 10, 20, 30)
+
+
+class HumidityFilter(RangeListFilter):
+    """Relative humidity in 20 % bands."""
+
+    title = "humidity (%)"
+    parameter_name = field_name = "humidity"
+    bounds = (20, 40, 60, 80)
+
+
+class PressureFilter(RangeListFilter):
+    """Sea-level pressure from low to high."""
+
+    title = "pressure (mb)"
+    parameter_name = field_name = "pressure"
+    bounds = (980, 1000, 1010, 1020, 1030)
+
+
+class WindSpeedFilter(RangeListFilter):
+    """Wind speed from calm to gale."""
+
+    title = "wind speed (kph)"
+    parameter_name = field_name = "wind_speed"
+    bounds = (10, 20, 40, 60)
+
+
+class WindDegreeFilter(RangeListFilter):
+    """Wind bearing by quadrant."""
+
+    title = "wind degree"
+    parameter_name = field_name = "wind_degree"
+    bounds = (90, 180, 270)
+
+
+class CloudinessFilter(RangeListFilter):
+    """Cloud cover in quarters."""
+
+    title = "cloudiness (%)"
+    parameter_name = field_name = "cloudiness"
+    bounds = (25, 50, 75)
+
+
+class UVIndexFilter(RangeListFilter):
+    """UV index by WHO exposure category."""
+
+    title = "UV index"
+    parameter_name = field_name = "uv_index"
+    bounds = (3, 6, 8, 11)
+
+
+class WindDirectionFilter(admin.SimpleListFilter):
+    """The 16 compass points WeatherAPI reports, without querying for them."""
+
+    title = "wind direction"
+    parameter_name = "wind_direction"
+    POINTS = ("N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+              "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW")
+
+    def lookups(self, request, model_admin):
+        return [(point, point) for point in self.POINTS]
+
+    def queryset(self, request, queryset):
+        return queryset.filter(wind_direction=self.value()) if self.value() else queryset
+
+
+class CachedValuesListFilter(admin.SimpleListFilter, abc.ABC):
+    """
+    Filter by the distinct values of a column, with the choices cached.
+
+    The choices query runs at most once per WEATHER_ADMIN_FACET_CACHE_TIMEOUT
+    instead of on every changelist load.
+    """
+
+    field_name = None
+
+    def lookups(self, request, model_admin):
+        return caches[settings.WEATHER_CACHE_ALIAS].get_or_set(
+            f"weather:admin:facets:{self.parameter_name}",
+            lambda: [tuple(choice) for choice in self.values()],
+            settings.WEATHER_ADMIN_FACET_CACHE_TIMEOUT,
+        )
+
+    @abc.abstractmethod
+    def values(self):
+        """Return the (value, label) pairs to offer."""
+
+    def queryset(self, request, queryset):
+        return queryset.filter(**{self.field_name: self.value()}) if self.value() else queryset
+
+
+class CityFilter(CachedValuesListFilter):
+    """Cities from LatestWeather (one row each), filtered on the indexed city_key."""
+
+    title = "city"
+    parameter_name = "city"
+    field_name = "city_key"
+
+    def values(self):
+        return LatestWeather.objects.order_by("city").values_list("city_key", "city")
+
+
+class CountryFilter(CachedValuesListFilter):
+    """Countries currently reported (from LatestWeather)."""
+
+    title = "country"
+    parameter_name = field_name = "country"
+
+    def values(self):
+        countries = LatestWeather.objects.order_by("country").values_list("country", flat=True).distinct()
+        return [(country, country) for country in countries]
+
+
+class WeatherConditionFilter(CachedValuesListFilter):
+    """Conditions currently reported (from LatestWeather), not every one ever stored."""
+
+    title = "weather condition"
+    parameter_name = field_name = "weather_condition"
+
+    def values(self):
+        conditions = (
+            LatestWeather.objects.order_by("weather_condition")
+            .values_list("weather_condition", flat=True).distinct()
+        )
+        return [(condition, condition) for condition in conditions]
 
 
 class WeatherDataAdmin(admin.ModelAdmin):
-    """Custom admin configuration for the WeatherData model."""
+    """
+    Custom admin configuration for the WeatherData model.
+
+    Tuned for very large tables: every filter sidebar is built without a
+    scan, the page is ordered by the (timestamp, id) index, per-option facet
+    counts are off and large totals come from the planner's estimate.
+    """
 
     list_display = (
         'timestamp', 'city', 'country', 'lat', 'lon',
@@ -16,54 +201,55 @@ class WeatherDataAdmin(admin.ModelAdmin):
     )
 
     list_filter = (
-        'city', 'country', 'temperature', 'humidity', 'pressure',
-        'wind__wind_speed', 'wind__wind_direction', 'wind__wind_degree',
-        'condition__cloudiness', 'condition__uv_index', 'condition__weather_condition'
+        CityFilter, CountryFilter, TemperatureFilter, HumidityFilter, PressureFilter,
+        WindSpeedFilter, WindDirectionFilter, WindDegreeFilter,
+        CloudinessFilter, UVIndexFilter, WeatherConditionFilter, 'is_forecast',
     )
 
-    def wind_speed(self, obj):
-        """Return wind speed from related WindData, if available."""
-        return obj.wind.wind_speed if obj.wind else None
+    ordering = ('-timestamp', '-id')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    show_facets = admin.ShowFacets.NEVER
+
+
+class TrackedCityAdmin(admin.ModelAdmin):
+    """Cities of the adaptive poll schedule with their current intervals."""
+
+    list_display = ('name', 'enabled', 'poll_interval', 'next_poll_at', 'last_polled_at',
+                    'last_temperature', 'last_pressure')
+    list_editable = ('enabled',)
+    list_filter = ('enabled',)
+    ordering = ('next_poll_at',)
+    search_fields = ('name',)
 
-    def wind_gust(self, obj):
-        """Return wind gust from related WindData, if available."""
-        return obj.wind.wind_gust if obj.wind else None
 
-    def wind_direction(self, obj):
-        """Return wind direction from related WindData, if available."""
-        return obj.wind.wind_direction if obj.wind else None
+class AlertRuleAdmin(admin.ModelAdmin):
+    """Alert rules evaluated for every stored observation."""
 
-    def wind_degree(self, obj):
-        """Return wind degree from related WindData, if available."""
-        return obj.wind.wind_degree if obj.wind else None
+    list_display = ('name', 'city_key', 'metric', 'condition', 'threshold', 'window', 'cooldown', 'enabled')
+    list_editable = ('enabled',)
+    list_filter = ('enabled', 'metric', 'condition')
+    search_fields = ('name', 'city_key')
 
-    def cloudiness(self, obj):
-        """Return cloudiness from related WeatherCondition, if available."""
-        return obj.condition.cloudiness if obj.condition else None
 
-    def visibility(self, obj):
-        """Return visibility from related WeatherCondition, if available."""
-        return obj.condition.visibility if obj.condition else None
+class AlertEventAdmin(admin.ModelAdmin):
+    """Raised alerts, newest first; written by the ingest path only."""
 
-    def uv_index(self, obj):
-        """Return UV index from related WeatherCondition, if available."""
-        return obj.condition.uv_index if obj.condition else None
+    list_display = ('observed_at', 'city', 'rule', 'metric', 'value', 'reference', 'threshold')
+    list_filter = ('rule',)
+    list_select_related = ('rule',)
+    ordering = ('-observed_at',)
+    search_fields = ('city',)
 
-    def weather_condition(self, obj):
-        """Return weather condition description from related WeatherCondition, if available."""
-        return obj.condition.weather_condition if obj.condition else None
+    def has_add_permission(self, request):
+        return False
 
-    wind_speed.admin_order_field = 'wind__wind_speed'
-    wind_gust.admin_order_field = 'wind__wind_gust'
-    wind_direction.admin_order_field = 'wind__wind_direction'
-    wind_degree.admin_order_field = 'wind__wind_degree'
-    cloudiness.admin_order_field = 'condition__cloudiness'
-    visibility.admin_order_field = 'condition__visibility'
-    uv_index.admin_order_field = 'condition__uv_index'
-    weather_condition.admin_order_field = 'condition__weather_condition'
+    def has_change_permission(self, request, obj=None):
+        return False
 
 
 # Weather
 admin.site.register(WeatherData, WeatherDataAdmin)
-admin.site.register(WindData)
-admin.site.register(WeatherCondition)
+admin.site.register(TrackedCity, TrackedCityAdmin)
+admin.site.register(AlertRule, AlertRuleAdmin)
+admin.site.register(AlertEvent, AlertEventAdmin)
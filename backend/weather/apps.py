@@ -8,3 +8,9 @@ class WeatherConfig(AppConfig):
 
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'weather'
+
+    def ready(self):
+        # Connect the Celery task timing signals in web and worker processes
+        from . import metrics  # noqa: F401  pylint: disable=import-outside-toplevel,unused-import
+        # Connect the alert rule cache invalidation signals
+        from .services import alert_service  # noqa: F401  pylint: disable=import-outside-toplevel,unused-import
@@ -0,0 +1,136 @@
+"""Async read views for the weather API, served under /api/async/weather/.
+
+They return the same bodies as the WeatherDataViewSet list/latest/aggregate
+endpoints but use the async ORM and async cache calls, so under an ASGI
+server one worker process holds many concurrent dashboard clients on its
+event loop instead of tying up a thread per request. The live readings
+stream (Server-Sent Events) lives here too.
+"""
+
+import abc
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, HttpResponseNotModified, JsonResponse, StreamingHttpResponse
+from django.views import View
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from .models import normalize_city
+from .pagination import WeatherKeysetPagination
+from .serializers import WeatherAggregateQuerySerializer, WeatherDataRowSerializer
+from .services.aggregation_service import WeatherAggregationService
+from .services.event_service import stream_readings
+from .services.response_cache import WeatherResponseCache
+from .views import WeatherDataViewSet
+
+
+class AsyncWeatherView(View, abc.ABC):
+    """Base class: JSON rendering plus the response cache and ETag handling of the sync views."""
+
+    http_method_names = ["get", "head", "options"]
+
+    async def get(self, request):
+        """Serve from the response cache (or 304 on a matching ETag), building the body on a miss."""
+        # DRF's Request wrapper gives the paginator and cache key `query_params`
+        drf_request = Request(request)
+        city = drf_request.query_params.get("city")
+        response_cache = WeatherResponseCache()
+        key, etag = await response_cache.alookup(
+            drf_request, normalize_city(city) if city else None, self.cache_vary(drf_request)
+        )
+
+        if etag in request.headers.get("If-None-Match", ""):
+            response = HttpResponseNotModified()
+        else:
+            data = await response_cache.aget(key)
+            if data is None:
+                data, status = await self.build(drf_request)
+                if status != 200:
+                    return self.render(data, status)
+                await response_cache.aset(key, data)
+            response = self.render(data)
+
+        response["ETag"] = etag
+        response["Cache-Control"] = "no-cache"
+        return response
+
+    @abc.abstractmethod
+    async def build(self, request) -> tuple[dict, int]:
+        """Return the (body, status) of an uncached request."""
+
+    def cache_vary(self, request):
+        """What the response depends on besides the query string (see WeatherResponseCache.lookup)."""
+        return None
+
+    @staticmethod
+    def render(data, status: int = 200) -> HttpResponse:
+        """Render with DRF's JSONRenderer so bodies match the sync views byte for byte."""
+        renderer = JSONRenderer()
+        return HttpResponse(renderer.render(data), status=status, content_type=renderer.media_type)
+
+
+class AsyncWeatherListView(AsyncWeatherView):
+    """Async twin of GET /api/weather/ (keyset pagination only)."""
+
+    async def build(self, request):
+        paginator = WeatherKeysetPagination()
+        queryset = WeatherDataViewSet.readings(request.query_params.get("city"))
+        rows = await paginator.apaginate_queryset(queryset.values(*WeatherDataRowSerializer.fields), request)
+        return paginator.get_paginated_data(WeatherDataRowSerializer(rows).data), 200
+
+
+class AsyncWeatherLatestView(AsyncWeatherView):
+    """Async twin of GET /api/weather/latest/."""
+
+    async def build(self, request):
+        rows = [row async for row in WeatherDataViewSet.latest_rows(request.query_params.get("city"))]
+        return {"results": WeatherDataRowSerializer(rows).data}, 200
+
+
+class AsyncWeatherAggregateView(AsyncWeatherView):
+    """Async twin of GET /api/weather/aggregate/."""
+
+    def cache_vary(self, request):
+        return WeatherAggregateQuerySerializer.cache_vary(request.query_params)
+
+    async def build(self, request):
+        query = WeatherAggregateQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return query.errors, 400
+        params = query.validated_data
+
+        results = await WeatherAggregationService().aaggregate(
+            params["city"], params["start"], params["end"], params["bucket"]
+        )
+        return WeatherDataViewSet.aggregate_data(request, params, results), 200
+
+
+class WeatherStreamView(View):
+    """
+    Server-Sent Events stream of new readings for `?city=` (repeatable).
+
+    Each event carries one reading in the list endpoint's shape, pushed from
+    Redis pub/sub as soon as ingestion commits it. Needs an ASGI server: the
+    stream is an async generator that holds no thread and no database
+    connection while idle. Under WSGI Django would buffer the endless
+    generator to completion, pinning a worker and never sending an event,
+    so the view answers 503 there instead.
+    """
+
+    http_method_names = ["get"]
+
+    async def get(self, request):
+        """Stream the cities' readings as they are stored, or refuse when streaming is unavailable."""
+        city_keys = sorted({normalize_city(city) for city in request.GET.getlist("city") if city.strip()})
+        if not city_keys:
+            return JsonResponse({"city": ["This field is required."]}, status=400)
+        if not settings.WEATHER_EVENTS_REDIS_URL:
+            return JsonResponse({"detail": "Live updates are not configured."}, status=503)
+        if not isinstance(request, ASGIRequest):
+            return JsonResponse({"detail": "Live updates need the ASGI server."}, status=503)
+
+        response = StreamingHttpResponse(stream_readings(city_keys), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        # Stop nginx-style proxies from buffering the stream
+        response["X-Accel-Buffering"] = "no"
+        return response
@@ -0,0 +1,88 @@
+"""Management command to backfill hourly weather history for cities and a date range."""
+
+from datetime import date
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from weather.services.backfill_service import BackfillService
+from weather.services.partition_service import WeatherPartitionManager
+from weather.tasks import backfill_weather_chunk
+
+
+class Command(BaseCommand):
+    """Backfill history as (city, day) units with checkpoint/resume."""
+
+    help = "Backfill hourly weather history; interrupted runs resume from their checkpoint."
+
+    def add_arguments(self, parser):
+        parser.add_argument("cities", nargs="*", help="Cities to backfill (default: WEATHER_CITIES)")
+        parser.add_argument("--start", required=True, type=date.fromisoformat, help="First day (YYYY-MM-DD)")
+        parser.add_argument("--end", type=date.fromisoformat, help="Last day, inclusive (default: --start)")
+        parser.add_argument("--workers", type=int, default=settings.WEATHER_FETCH_WORKERS,
+                            help="Concurrent (city, day) units in local mode")
+        parser.add_argument("--celery", action="store_true",
+                            help="Dispatch chunked Celery tasks instead of running locally")
+        parser.add_argument("--chunk-days", type=int, default=7, help="Days per Celery task")
+        parser.add_argument("--restart", action="store_true", help="Ignore existing checkpoints for the range")
+
+    def handle(self, *args, **options):
+        """
+        Entry point for the command execution.
+
+        Splits the range into (city, day) units, skips checkpointed ones and
+        runs the rest locally on a thread pool or as chunked Celery tasks.
+        """
+        cities = options["cities"] or settings.WEATHER_CITIES
+        start = options["start"]
+        end = options["end"] or start
+        if end < start:
+            raise CommandError("--end must not be before --start")
+
+        service = BackfillService()
+        if options["restart"]:
+            self.stdout.write(f"Cleared {service.reset(cities, start, end)} checkpoints.")
+
+        # History lands in its own monthly partitions instead of the default one
+        WeatherPartitionManager().ensure_partitions(start, end)
+
+        units = service.pending_units(cities, start, end)
+        total = len(cities) * len(service.days(start, end))
+        self.stdout.write(f"{len(units)} of {total} (city, day) units to backfill.")
+        if not units:
+            self.stdout.write(self.style.SUCCESS("Nothing to do."))
+            return
+
+        if options["celery"]:
+            self._dispatch(units, options["chunk_days"])
+            return
+
+        stats = service.run(units, options["workers"], on_progress=self._report)
+        summary = stats.as_dict()
+        for unit, error in stats.failed.items():
+            self.stderr.write(f"Failed {unit}: {error}")
+        style = self.style.SUCCESS if not stats.failed else self.style.WARNING
+        self.stdout.write(style(
+            f"Backfilled {summary['done']} days, {summary['rows']} rows in {summary['seconds']}s "
+            f"({summary['days_per_sec']} days/s, {summary['rows_per_sec']} rows/s), {summary['failed']} failed."
+        ))
+
+    def _report(self, stats):
+        processed = stats.done + len(stats.failed)
+        if processed % 25 and processed != stats.total:
+            return
+        summary = stats.as_dict()
+        self.stdout.write(
+            f"[{processed}/{stats.total}] {summary['days_per_sec']} days/s, {summary['rows_per_sec']} rows/s"
+        )
+
+    def _dispatch(self, units, chunk_days):
+        by_city = {}
+        for city, day in units:
+            by_city.setdefault(city, []).append(day.isoformat())
+
+        tasks = 0
+        for city, days in by_city.items():
+            for i in range(0, len(days), chunk_days):
+                backfill_weather_chunk.delay(city, days[i:i + chunk_days])
+                tasks += 1
+        self.stdout.write(self.style.SUCCESS(f"Dispatched {tasks} Celery tasks for {len(units)} units."))
@@ -0,0 +1,41 @@
+"""Management command to maintain WeatherData partitions and apply retention."""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from weather.services.partition_service import WeatherPartitionManager
+from weather.services.retention_service import WeatherRetentionService
+
+
+class Command(BaseCommand):
+    """Create upcoming monthly partitions and expire old raw readings."""
+
+    help = "Create future WeatherData partitions and roll up/drop raw readings past retention."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--months-ahead", type=int, default=settings.WEATHER_PARTITION_MONTHS_AHEAD,
+                            help="Months of partitions to keep ready after the current one")
+        parser.add_argument("--retention-days", type=int, default=settings.WEATHER_RAW_RETENTION_DAYS,
+                            help="Keep raw readings at least this many days (0 keeps them forever)")
+
+    def handle(self, *args, **options):
+        """
+        Entry point for the command execution.
+
+        Creates missing partitions first so new readings never land in the
+        default partition, then applies the retention policy.
+        """
+        manager = WeatherPartitionManager()
+        if manager.is_partitioned():
+            created = manager.ensure_future(options["months_ahead"])
+            self.stdout.write(f"Created {len(created)} partitions: {', '.join(created) or '-'}")
+        else:
+            self.stdout.write("WeatherData is not partitioned; skipping partition creation.")
+
+        stats = WeatherRetentionService(options["retention_days"]).apply()
+        if stats.cutoff is None:
+            self.stdout.write(self.style.SUCCESS("Retention disabled; raw readings are kept."))
+            return
+        self.stdout.write(self.style.SUCCESS(
+            f"Raw readings before {stats.cutoff} expired: {stats.summarized_days} daily summaries written, "
+            f"{len(stats.dropped_partitions)} partitions dropped, {stats.deleted_rows} rows deleted."
+        ))
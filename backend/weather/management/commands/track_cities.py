@@ -0,0 +1,60 @@
+"""Management command to manage the cities polled by the adaptive scheduler."""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django_celery_beat.models import IntervalSchedule, PeriodicTask
+from weather.models import TrackedCity, normalize_city
+from weather.services.scheduler_service import AdaptivePollScheduler
+
+DISPATCH_TASK_NAME = "Dispatch due city polls"
+
+
+class Command(BaseCommand):
+    """Track or untrack cities and install the dispatcher's celery beat entry."""
+
+    help = "Add cities to (or remove them from) the adaptive poll schedule and install its beat entry."
+
+    def add_arguments(self, parser):
+        parser.add_argument("cities", nargs="*", help="City names, e.g. Kyiv Lviv")
+        parser.add_argument("--from-settings", action="store_true",
+                            help="Also track every city in settings.WEATHER_CITIES")
+        parser.add_argument("--disable", action="store_true", help="Stop polling the given cities")
+
+    def handle(self, *args, **options):
+        """
+        Entry point for the command execution.
+
+        Tracked cities are due at once; the dispatcher periodic task is created
+        (or updated to WEATHER_POLL_DISPATCH_SECONDS) on every run.
+        """
+        cities = list(options["cities"])
+        if options["from_settings"]:
+            cities += settings.WEATHER_CITIES
+        if not cities:
+            raise CommandError("Give at least one city or --from-settings.")
+
+        if options["disable"]:
+            disabled = TrackedCity.objects.filter(
+                city_key__in=[normalize_city(city) for city in cities]
+            ).update(enabled=False)
+            self.stdout.write(self.style.SUCCESS(f"Disabled {disabled} tracked cities."))
+            return
+
+        tracked = AdaptivePollScheduler().track(cities)
+        self.install_dispatch_task()
+        self.stdout.write(self.style.SUCCESS(
+            f"Tracking {tracked} cities; due cities are dispatched every "
+            f"{settings.WEATHER_POLL_DISPATCH_SECONDS}s to {settings.WEATHER_POLL_SHARDS or ['the default queue']}."
+        ))
+
+    @staticmethod
+    def install_dispatch_task() -> PeriodicTask:
+        """Create or update the celery beat entry running weather.tasks.dispatch_city_polls."""
+        schedule, _ = IntervalSchedule.objects.get_or_create(
+            every=settings.WEATHER_POLL_DISPATCH_SECONDS, period=IntervalSchedule.SECONDS
+        )
+        task, _ = PeriodicTask.objects.update_or_create(
+            name=DISPATCH_TASK_NAME,
+            defaults={"task": "weather.tasks.dispatch_city_polls", "interval": schedule, "enabled": True},
+        )
+        return task
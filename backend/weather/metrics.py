@@ -0,0 +1,154 @@
+"""Prometheus metrics of the weather hot paths, exposed on /metrics.
+
+Metrics live in the default prometheus_client registry of each process. When
+several processes serve the app (gunicorn workers, prefork Celery children),
+point PROMETHEUS_MULTIPROC_DIR at a shared, empty directory before they start
+and every scrape aggregates all of them. Observing a histogram is a lock and
+a few additions, cheap enough to leave on in production.
+
+Labels are kept to bounded sets (endpoint, status, view name, task name,
+city key) so the number of series does not grow with traffic.
+"""
+
+import os
+import time
+from collections import Counter as TallyCounter
+
+from asgiref.sync import iscoroutinefunction
+from celery.signals import task_postrun, task_prerun, worker_init
+from django.conf import settings
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+    start_http_server,
+)
+
+UPSTREAM_REQUEST_SECONDS = Histogram(
+    "weather_upstream_request_seconds",
+    "WeatherAPI call latency, retries included, by endpoint and HTTP status.",
+    ["endpoint", "status"],
+)
+UPSTREAM_CACHE_LOOKUPS = Counter(
+    "weather_upstream_cache_lookups",
+    "WeatherAPI response cache lookups by endpoint and result (hits, misses, coalesced).",
+    ["endpoint", "result"],
+)
+DB_WRITE_SECONDS = Histogram(
+    "weather_db_write_seconds",
+    "Duration of ingestion writes by operation.",
+    ["operation"],
+)
+ROWS_INGESTED = Counter(
+    "weather_rows_ingested",
+    "Weather readings upserted, by city key.",
+    ["city"],
+)
+OBSERVATIONS_SKIPPED = Counter(
+    "weather_observations_skipped",
+    "Current observations not written because the same one was already stored.",
+)
+ALERTS_FIRED = Counter(
+    "weather_alerts_fired",
+    "Alert events raised at ingest time, by rule metric and condition.",
+    ["metric", "condition"],
+)
+RESPONSE_CACHE_LOOKUPS = Counter(
+    "weather_response_cache_lookups",
+    "Read API response cache lookups by result (hit, miss).",
+    ["result"],
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "weather_http_request_seconds",
+    "Time to response headers by view name, method and status.",
+    ["view", "method", "status"],
+)
+TASK_SECONDS = Histogram(
+    "weather_task_seconds",
+    "Celery task runtime by task name and final state.",
+    ["task", "state"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, float("inf")),
+)
+
+
+def registry() -> CollectorRegistry:
+    """Return the registry to expose: all processes' samples in multiprocess mode."""
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+    collected = CollectorRegistry()
+    multiprocess.MultiProcessCollector(collected)
+    return collected
+
+
+def render() -> tuple[bytes, str]:
+    """Return the (body, content type) of a scrape."""
+    return generate_latest(registry()), CONTENT_TYPE_LATEST
+
+
+def record_ingested(city_keys) -> None:
+    """Count upserted readings per city."""
+    for city_key, count in TallyCounter(city_keys).items():
+        ROWS_INGESTED.labels(city_key).inc(count)
+
+
+def _view_name(request) -> str:
+    match = getattr(request, "resolver_match", None)
+    return match.view_name if match is not None else "unresolved"
+
+
+def metrics_middleware(get_response):
+    """
+    Observe the latency of every request, labelled by the resolved view name.
+
+    Works in front of both the sync (WSGI) and async (ASGI) views. Streaming
+    responses are timed up to their headers.
+    """
+    if iscoroutinefunction(get_response):
+        async def middleware(request):
+            started = time.perf_counter()
+            response = await get_response(request)
+            _observe_request(request, response, started)
+            return response
+    else:
+        def middleware(request):
+            started = time.perf_counter()
+            response = get_response(request)
+            _observe_request(request, response, started)
+            return response
+    return middleware
+
+
+metrics_middleware.sync_capable = True
+metrics_middleware.async_capable = True
+
+
+def _observe_request(request, response, started: float) -> None:
+    HTTP_REQUEST_SECONDS.labels(
+        _view_name(request), request.method, str(response.status_code)
+    ).observe(time.perf_counter() - started)
+
+
+_task_started: dict[str, float] = {}
+
+
+@task_prerun.connect
+def _task_prerun(task_id=None, **kwargs):
+    _task_started[task_id] = time.perf_counter()
+
+
+@task_postrun.connect
+def _task_postrun(task_id=None, task=None, state=None, **kwargs):
+    started = _task_started.pop(task_id, None)
+    if started is not None and task is not None:
+        TASK_SECONDS.labels(task.name, state or "UNKNOWN").observe(time.perf_counter() - started)
+
+
+@worker_init.connect
+def _serve_worker_metrics(**kwargs):
+    """Expose the Celery worker's metrics on WEATHER_METRICS_WORKER_PORT (0 disables)."""
+    if settings.WEATHER_METRICS_WORKER_PORT:
+        start_http_server(settings.WEATHER_METRICS_WORKER_PORT, registry=registry())
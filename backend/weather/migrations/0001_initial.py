@@ -0,0 +1,55 @@
+# Generated by Django 5.1.6 on 2026-10-18 18:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WeatherCondition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('weather_condition', models.CharField(help_text='Weather description (Clear, Rain, Fog, etc.)', max_length=100)),
+                ('weather_icon', models.URLField(blank=True, help_text='URL of the weather condition icon', null=True)),
+                ('cloudiness', models.IntegerField(blank=True, help_text='Cloud cover (%)', null=True)),
+                ('visibility', models.FloatField(help_text='Visibility (km)')),
+                ('uv_index', models.FloatField(blank=True, help_text='UV index (sun exposure risk)', null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='WindData',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('wind_speed', models.FloatField(help_text='Wind speed (km/h)')),
+                ('wind_gust', models.FloatField(blank=True, help_text='Wind gusts (km/h)', null=True)),
+                ('wind_direction', models.CharField(help_text='Wind direction (ENE, N, SW, etc.)', max_length=10)),
+                ('wind_degree', models.IntegerField(blank=True, help_text='Wind direction in degrees (0° - North, 90° - East)', null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='WeatherData',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('timestamp', models.DateTimeField(auto_now_add=True)),
+                ('city', models.CharField(max_length=100)),
+                ('country', models.CharField(max_length=100)),
+                ('lat', models.FloatField()),
+                ('lon', models.FloatField()),
+                ('temperature', models.FloatField(help_text='Temperature (°C)')),
+                ('feels_like', models.FloatField(blank=True, help_text='Feels-like temperature (°C)', null=True)),
+                ('humidity', models.IntegerField(blank=True, help_text='Relative humidity (%)', null=True)),
+                ('pressure', models.FloatField(help_text='Atmospheric pressure (mbar)')),
+                ('precipitation', models.FloatField(blank=True, default=0.0, help_text='Precipitation amount (mm)', null=True)),
+                ('dew_point', models.FloatField(blank=True, help_text='Dew point (°C)', null=True)),
+                ('condition', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='weather_data', to='weather.weathercondition')),
+                ('wind', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='weather_data', to='weather.winddata')),
+            ],
+        ),
+    ]
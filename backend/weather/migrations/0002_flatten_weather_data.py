@@ -0,0 +1,87 @@
+"""Copy wind and condition readings onto WeatherData.
+
+Step one of flattening the three-table layout: the new columns are added as
+nullable, filled from the related rows with one UPDATE, and made required in
+0003 once the OneToOne links are dropped.
+"""
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+WIND_FIELDS = ("wind_speed", "wind_gust", "wind_direction", "wind_degree")
+CONDITION_FIELDS = ("weather_condition", "weather_icon", "cloudiness", "visibility", "uv_index")
+
+
+def copy_related_fields(apps, schema_editor):
+    WeatherData = apps.get_model("weather", "WeatherData")
+    WindData = apps.get_model("weather", "WindData")
+    WeatherCondition = apps.get_model("weather", "WeatherCondition")
+
+    wind = WindData.objects.filter(pk=OuterRef("wind_id"))
+    condition = WeatherCondition.objects.filter(pk=OuterRef("condition_id"))
+
+    WeatherData.objects.update(
+        **{name: Subquery(wind.values(name)[:1]) for name in WIND_FIELDS},
+        **{name: Subquery(condition.values(name)[:1]) for name in CONDITION_FIELDS},
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='weatherdata',
+            name='humidity',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='Relative humidity (%)', null=True),
+        ),
+        migrations.AddField(
+            model_name='weatherdata',
+            name='wind_speed',
+            field=models.FloatField(help_text='Wind speed (km/h)', null=True),
+        ),
+        migrations.AddField(
+            model_name='weatherdata',
+            name='wind_gust',
+            field=models.FloatField(blank=True, help_text='Wind gusts (km/h)', null=True),
+        ),
+        migrations.AddField(
+            model_name='weatherdata',
+            name='wind_direction',
+            field=models.CharField(help_text='Wind direction (ENE, N, SW, etc.)', max_length=10, null=True),
+        ),
+        migrations.AddField(
+            model_name='weatherdata',
+            name='wind_degree',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='Wind direction in degrees (0° - North, 90° - East)', null=True),
+        ),
+        migrations.AddField(
+            model_name='weatherdata',
+            name='weather_condition',
+            field=models.CharField(help_text='Weather description (Clear, Rain, Fog, etc.)', max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='weatherdata',
+            name='weather_icon',
+            field=models.URLField(blank=True, help_text='URL of the weather condition icon', null=True),
+        ),
+        migrations.AddField(
+            model_name='weatherdata',
+            name='cloudiness',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='Cloud cover (%)', null=True),
+        ),
+        migrations.AddField(
+            model_name='weatherdata',
+            name='visibility',
+            field=models.FloatField(help_text='Visibility (km)', null=True),
+        ),
+        migrations.AddField(
+            model_name='weatherdata',
+            name='uv_index',
+            field=models.FloatField(blank=True, help_text='UV index (sun exposure risk)', null=True),
+        ),
+        migrations.RunPython(copy_related_fields, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+"""Drop the WindData/WeatherCondition tables once their data lives on WeatherData."""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0002_flatten_weather_data'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='weatherdata',
+            name='wind',
+        ),
+        migrations.RemoveField(
+            model_name='weatherdata',
+            name='condition',
+        ),
+        migrations.DeleteModel(
+            name='WindData',
+        ),
+        migrations.DeleteModel(
+            name='WeatherCondition',
+        ),
+        migrations.AlterField(
+            model_name='weatherdata',
+            name='wind_speed',
+            field=models.FloatField(help_text='Wind speed (km/h)'),
+        ),
+        migrations.AlterField(
+            model_name='weatherdata',
+            name='wind_direction',
+            field=models.CharField(help_text='Wind direction (ENE, N, SW, etc.)', max_length=10),
+        ),
+        migrations.AlterField(
+            model_name='weatherdata',
+            name='weather_condition',
+            field=models.CharField(help_text='Weather description (Clear, Rain, Fog, etc.)', max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='weatherdata',
+            name='visibility',
+            field=models.FloatField(help_text='Visibility (km)'),
+        ),
+    ]
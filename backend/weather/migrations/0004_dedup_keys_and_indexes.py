@@ -0,0 +1,71 @@
+"""Add the (city_key, hour) deduplication key and lookup indexes.
+
+Existing rows get their keys computed in the database; if a city already has
+several readings within one hour, only the latest is kept so the unique
+constraint can be created.
+"""
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import Max
+from django.db.models.functions import Lower, Trim, TruncHour
+
+
+def fill_keys(apps, schema_editor):
+    WeatherData = apps.get_model("weather", "WeatherData")
+    WeatherData.objects.update(city_key=Lower(Trim("city")), hour=TruncHour("timestamp"))
+
+    latest = (
+        WeatherData.objects.values("city_key", "hour")
+        .annotate(latest_id=Max("id"))
+        .values("latest_id")
+    )
+    WeatherData.objects.exclude(id__in=latest).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0003_remove_wind_and_condition'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='weatherdata',
+            name='timestamp',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name='weatherdata',
+            name='city_key',
+            field=models.CharField(editable=False, help_text='Normalized city name', max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='weatherdata',
+            name='hour',
+            field=models.DateTimeField(editable=False, help_text='Timestamp truncated to the hour', null=True),
+        ),
+        migrations.RunPython(fill_keys, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='weatherdata',
+            name='city_key',
+            field=models.CharField(editable=False, help_text='Normalized city name', max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='weatherdata',
+            name='hour',
+            field=models.DateTimeField(editable=False, help_text='Timestamp truncated to the hour'),
+        ),
+        migrations.AddConstraint(
+            model_name='weatherdata',
+            constraint=models.UniqueConstraint(fields=('city_key', 'hour'), name='weather_unique_city_hour'),
+        ),
+        migrations.AddIndex(
+            model_name='weatherdata',
+            index=models.Index(fields=['city_key', '-timestamp'], name='weather_city_key_ts_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='weatherdata',
+            index=models.Index(fields=['-timestamp'], name='weather_timestamp_idx'),
+        ),
+    ]
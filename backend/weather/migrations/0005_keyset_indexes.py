@@ -0,0 +1,29 @@
+# Generated by Django 5.1.6 on 2026-10-18 18:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0004_dedup_keys_and_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='weatherdata',
+            name='weather_city_key_ts_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='weatherdata',
+            name='weather_timestamp_idx',
+        ),
+        migrations.AddIndex(
+            model_name='weatherdata',
+            index=models.Index(fields=['city_key', '-timestamp', '-id'], name='weather_city_key_ts_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='weatherdata',
+            index=models.Index(fields=['-timestamp', '-id'], name='weather_timestamp_id_idx'),
+        ),
+    ]
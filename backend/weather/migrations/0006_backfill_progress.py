@@ -0,0 +1,26 @@
+# Generated by Django 5.1.6 on 2026-10-18 18:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0005_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BackfillProgress',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('city_key', models.CharField(help_text='Normalized city name', max_length=100)),
+                ('day', models.DateField()),
+                ('rows', models.PositiveIntegerField(default=0, help_text='Hours written for the day')),
+                ('completed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('city_key', 'day'), name='backfill_unique_city_day')],
+            },
+        ),
+    ]
@@ -0,0 +1,105 @@
+# Generated by Django 5.1.6 on 2026-10-18 18:24
+
+from datetime import date
+
+from django.db import migrations, models
+from django.utils import timezone
+
+TABLE = "weather_weatherdata"
+MONTHS_AHEAD = 3
+
+
+def _add_months(day, months):
+    month = day.month - 1 + months
+    return date(day.year + month // 12, month % 12 + 1, 1)
+
+
+def partition_weather_data(apps, schema_editor):
+    """
+    Rebuild weather_weatherdata as a table range-partitioned by month on `hour`.
+
+    PostgreSQL requires every unique constraint to include the partition key,
+    so the key is `hour` (part of the (city_key, hour) dedup constraint) and
+    the primary key becomes (id, hour). `hour` is `timestamp` truncated to the
+    hour, so monthly ranges on either column hold the same rows. Monthly
+    partitions cover the existing rows up to MONTHS_AHEAD months from now; a
+    default partition catches anything outside them.
+
+    Other databases keep the plain table.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"SELECT MIN(hour), MAX(id) FROM {TABLE}")
+        first_hour, max_id = cursor.fetchone()
+
+        cursor.execute(f"""
+            ALTER TABLE {TABLE} RENAME TO {TABLE}_old;
+            ALTER TABLE {TABLE}_old DROP CONSTRAINT {TABLE}_pkey;
+            ALTER TABLE {TABLE}_old DROP CONSTRAINT weather_unique_city_hour;
+            DROP INDEX weather_city_key_ts_id_idx;
+            DROP INDEX weather_timestamp_id_idx;
+            ALTER TABLE {TABLE}_old ALTER COLUMN id DROP IDENTITY IF EXISTS;
+
+            CREATE TABLE {TABLE} (LIKE {TABLE}_old INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+                PARTITION BY RANGE (hour);
+            CREATE SEQUENCE {TABLE}_id_seq OWNED BY {TABLE}.id;
+            ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{TABLE}_id_seq');
+            ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey PRIMARY KEY (id, hour);
+            ALTER TABLE {TABLE} ADD CONSTRAINT weather_unique_city_hour UNIQUE (city_key, hour);
+            CREATE INDEX weather_city_key_ts_id_idx ON {TABLE} (city_key, timestamp DESC, id DESC);
+            CREATE INDEX weather_timestamp_id_idx ON {TABLE} (timestamp DESC, id DESC);
+            CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT;
+        """)
+
+        month = (first_hour or timezone.now()).date().replace(day=1)
+        last = _add_months(timezone.now().date(), MONTHS_AHEAD)
+        while month <= last:
+            following = _add_months(month, 1)
+            cursor.execute(
+                f"CREATE TABLE {TABLE}_p{month:%Y_%m} PARTITION OF {TABLE} "
+                f"FOR VALUES FROM ('{month} 00:00+00') TO ('{following} 00:00+00')"
+            )
+            month = following
+
+        cursor.execute(f"INSERT INTO {TABLE} SELECT * FROM {TABLE}_old")
+        cursor.execute(f"DROP TABLE {TABLE}_old")
+        if max_id is not None:
+            cursor.execute(f"SELECT setval('{TABLE}_id_seq', %s)", [max_id])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0006_backfill_progress'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WeatherDailySummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('city_key', models.CharField(help_text='Normalized city name', max_length=100)),
+                ('city', models.CharField(max_length=100)),
+                ('country', models.CharField(max_length=100)),
+                ('day', models.DateField(help_text='UTC day')),
+                ('samples', models.PositiveIntegerField(help_text='Raw readings rolled up into this day')),
+                ('temperature_min', models.FloatField(help_text='Temperature (°C)')),
+                ('temperature_mean', models.FloatField(help_text='Temperature (°C)')),
+                ('temperature_max', models.FloatField(help_text='Temperature (°C)')),
+                ('humidity_mean', models.FloatField(blank=True, help_text='Relative humidity (%)', null=True)),
+                ('pressure_mean', models.FloatField(help_text='Atmospheric pressure (mbar)')),
+                ('precipitation_sum', models.FloatField(blank=True, help_text='Precipitation amount (mm)', null=True)),
+                ('wind_speed_mean', models.FloatField(help_text='Wind speed (km/h)')),
+                ('wind_speed_max', models.FloatField(help_text='Wind speed (km/h)')),
+                ('wind_gust_max', models.FloatField(blank=True, help_text='Wind gusts (km/h)', null=True)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('city_key', 'day'), name='summary_unique_city_day')],
+            },
+        ),
+        # The partitioned table behaves like the plain one for Django, so
+        # unapplying leaves it in place.
+        migrations.RunPython(partition_weather_data, migrations.RunPython.noop, elidable=False),
+    ]
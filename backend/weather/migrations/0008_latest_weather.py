@@ -0,0 +1,68 @@
+# Generated by Django 5.1.6 on 2026-10-18 18:27
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.utils import timezone
+
+READING_FIELDS = [
+    "timestamp", "city", "country", "lat", "lon",
+    "temperature", "feels_like", "humidity", "pressure", "precipitation", "dew_point",
+    "wind_speed", "wind_gust", "wind_direction", "wind_degree",
+    "weather_condition", "weather_icon", "cloudiness", "visibility", "uv_index",
+]
+
+
+def fill_latest_weather(apps, schema_editor):
+    """Copy the newest observed (not forecast) reading of every city."""
+    WeatherData = apps.get_model("weather", "WeatherData")
+    LatestWeather = apps.get_model("weather", "LatestWeather")
+
+    observed = WeatherData.objects.filter(timestamp__lte=timezone.now())
+    latest = []
+    for city_key in observed.values_list("city_key", flat=True).distinct().order_by():
+        row = observed.filter(city_key=city_key).order_by("-timestamp", "-id").values("id", *READING_FIELDS).first()
+        latest.append(LatestWeather(city_key=city_key, reading_id=row.pop("id"), **row))
+    LatestWeather.objects.bulk_create(latest, batch_size=500)
+
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0007_partition_weather_data'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LatestWeather',
+            fields=[
+                ('timestamp', models.DateTimeField(default=django.utils.timezone.now)),
+                ('city', models.CharField(max_length=100)),
+                ('country', models.CharField(max_length=100)),
+                ('lat', models.FloatField()),
+                ('lon', models.FloatField()),
+                ('temperature', models.FloatField(help_text='Temperature (°C)')),
+                ('feels_like', models.FloatField(blank=True, help_text='Feels-like temperature (°C)', null=True)),
+                ('humidity', models.PositiveSmallIntegerField(blank=True, help_text='Relative humidity (%)', null=True)),
+                ('pressure', models.FloatField(help_text='Atmospheric pressure (mbar)')),
+                ('precipitation', models.FloatField(blank=True, default=0.0, help_text='Precipitation amount (mm)', null=True)),
+                ('dew_point', models.FloatField(blank=True, help_text='Dew point (°C)', null=True)),
+                ('wind_speed', models.FloatField(help_text='Wind speed (km/h)')),
+                ('wind_gust', models.FloatField(blank=True, help_text='Wind gusts (km/h)', null=True)),
+                ('wind_direction', models.CharField(help_text='Wind direction (ENE, N, SW, etc.)', max_length=10)),
+                ('wind_degree', models.PositiveSmallIntegerField(blank=True, help_text='Wind direction in degrees (0° - North, 90° - East)', null=True)),
+                ('weather_condition', models.CharField(help_text='Weather description (Clear, Rain, Fog, etc.)', max_length=100)),
+                ('weather_icon', models.URLField(blank=True, help_text='URL of the weather condition icon', null=True)),
+                ('cloudiness', models.PositiveSmallIntegerField(blank=True, help_text='Cloud cover (%)', null=True)),
+                ('visibility', models.FloatField(help_text='Visibility (km)')),
+                ('uv_index', models.FloatField(blank=True, help_text='UV index (sun exposure risk)', null=True)),
+                ('city_key', models.CharField(help_text='Normalized city name', max_length=100, primary_key=True, serialize=False)),
+                ('reading_id', models.BigIntegerField(blank=True, help_text='Id of the WeatherData row', null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.RunPython(fill_latest_weather, migrations.RunPython.noop),
+    ]
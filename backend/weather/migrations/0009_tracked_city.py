@@ -0,0 +1,30 @@
+# Generated by Django 5.1.6 on 2026-10-18 18:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0008_latest_weather'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrackedCity',
+            fields=[
+                ('city_key', models.CharField(help_text='Normalized city name', max_length=100, primary_key=True, serialize=False)),
+                ('name', models.CharField(help_text='City name sent to WeatherAPI', max_length=100)),
+                ('enabled', models.BooleanField(default=True)),
+                ('poll_interval', models.PositiveIntegerField(help_text='Current poll interval (seconds)')),
+                ('next_poll_at', models.DateTimeField(help_text='When the city is due for its next poll')),
+                ('last_polled_at', models.DateTimeField(blank=True, null=True)),
+                ('last_observed_at', models.DateTimeField(blank=True, help_text='Upstream observation time', null=True)),
+                ('last_temperature', models.FloatField(blank=True, help_text='Temperature (°C)', null=True)),
+                ('last_pressure', models.FloatField(blank=True, help_text='Atmospheric pressure (mbar)', null=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['enabled', 'next_poll_at'], name='tracked_city_due_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.1.6 on 2026-10-18 18:52
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0009_tracked_city'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AlertRule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('city_key', models.CharField(blank=True, default='', help_text='Normalized city name; empty for every city', max_length=100)),
+                ('metric', models.CharField(choices=[('temperature', 'temperature'), ('feels_like', 'feels like'), ('humidity', 'humidity'), ('pressure', 'pressure'), ('precipitation', 'precipitation'), ('wind_speed', 'wind speed'), ('wind_gust', 'wind gust'), ('cloudiness', 'cloudiness'), ('visibility', 'visibility'), ('uv_index', 'uv index')], max_length=20)),
+                ('condition', models.CharField(choices=[('above', 'Above threshold'), ('below', 'Below threshold'), ('rise', 'Rises by more than threshold within window'), ('drop', 'Drops by more than threshold within window')], max_length=10)),
+                ('threshold', models.FloatField()),
+                ('window', models.PositiveIntegerField(default=0, help_text='Look-back of rise/drop rules (seconds)')),
+                ('cooldown', models.PositiveIntegerField(default=3600, help_text='Minimum time between two alerts of the rule for a city (seconds)')),
+                ('enabled', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now, help_text='Readings observed earlier are not evaluated')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='AlertEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('city', models.CharField(max_length=100)),
+                ('city_key', models.CharField(help_text='Normalized city name', max_length=100)),
+                ('metric', models.CharField(max_length=20)),
+                ('value', models.FloatField(help_text='Reading that triggered the alert')),
+                ('reference', models.FloatField(blank=True, help_text='Lowest/highest reading of the window for rise/drop rules', null=True)),
+                ('threshold', models.FloatField()),
+                ('observed_at', models.DateTimeField(help_text='Observation time of the reading')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('rule', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='events', to='weather.alertrule')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['city_key', '-observed_at'], name='alert_event_city_idx')],
+                'constraints': [models.UniqueConstraint(fields=('rule', 'city_key', 'observed_at'), name='alert_event_unique_reading')],
+            },
+        ),
+        migrations.CreateModel(
+            name='AlertRuleState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('city_key', models.CharField(help_text='Normalized city name', max_length=100)),
+                ('observed_at', models.DateTimeField(blank=True, help_text='Newest evaluated observation', null=True)),
+                ('window', models.JSONField(blank=True, default=list)),
+                ('firing', models.BooleanField(default=False, help_text='Whether the newest reading met the condition')),
+                ('last_fired_at', models.DateTimeField(blank=True, null=True)),
+                ('rule', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='states', to='weather.alertrule')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('rule', 'city_key'), name='alert_state_unique_rule_city')],
+            },
+        ),
+    ]
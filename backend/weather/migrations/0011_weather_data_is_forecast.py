@@ -0,0 +1,27 @@
+# Generated by Django 5.1.6 on 2026-10-18 19:03
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def flag_future_hours(apps, schema_editor):
+    # Rows ahead of now can only be forecast hours; past forecast hours stored
+    # before this migration cannot be told apart and stay flagged as observations
+    WeatherData = apps.get_model('weather', 'WeatherData')
+    WeatherData.objects.filter(timestamp__gt=timezone.now()).update(is_forecast=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0010_alerts'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='weatherdata',
+            name='is_forecast',
+            field=models.BooleanField(default=False, help_text='Hourly forecast rather than an observation'),
+        ),
+        migrations.RunPython(flag_future_hours, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,61 @@
+"""Recompute city keys that migration 0004 derived without collapsing inner whitespace.
+
+0004 computes city_key in the database as LOWER(TRIM(city)), so a city
+stored as "New  York" got the key "new  york" while lookups and upserts use
+normalize_city() ("new york"). Such rows are re-keyed here; 0004 itself is
+left as shipped so that migration history stays the same everywhere.
+
+DATA LOSS: a re-keyed reading whose (city_key, hour) is already taken by a
+correctly keyed reading is a duplicate of it and is DELETED; the correctly
+keyed one is kept. Likewise only the newer of two LatestWeather rows that
+end up with one key is kept. Counts are printed; unapplying the migration
+does not bring the rows back.
+"""
+
+from django.db import migrations
+
+
+def normalize_city(city: str) -> str:
+    # Frozen copy of weather.models.normalize_city
+    return " ".join(city.split()).lower()
+
+
+def fix_city_keys(apps, schema_editor):
+    WeatherData = apps.get_model("weather", "WeatherData")
+    LatestWeather = apps.get_model("weather", "LatestWeather")
+
+    deleted = 0
+    for city, city_key in WeatherData.objects.values_list("city", "city_key").distinct().order_by():
+        key = normalize_city(city)
+        if key == city_key:
+            continue
+        rows = WeatherData.objects.filter(city=city, city_key=city_key)
+        taken = WeatherData.objects.filter(city_key=key).values("hour")
+        deleted += rows.filter(hour__in=taken).delete()[0]
+        rows.update(city_key=key)
+
+    for latest in list(LatestWeather.objects.order_by("timestamp")):
+        key = normalize_city(latest.city)
+        if key == latest.city_key:
+            continue
+        current = LatestWeather.objects.filter(city_key=key).first()
+        if current is not None and current.timestamp > latest.timestamp:
+            deleted += LatestWeather.objects.filter(city_key=latest.city_key).delete()[0]
+        else:
+            deleted += LatestWeather.objects.filter(city_key=key).delete()[0]
+            LatestWeather.objects.filter(city_key=latest.city_key).update(city_key=key)
+
+    if deleted:
+        print(f"\n  Deleted {deleted} rows that duplicated correctly keyed ones")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0011_weather_data_is_forecast'),
+    ]
+
+    operations = [
+        # Deleted duplicates are not restored when unapplying
+        migrations.RunPython(fix_city_keys, migrations.RunPython.noop),
+    ]
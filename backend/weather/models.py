@@ -1,12 +1,53 @@
-"""Django models for storing weather data, wind information, and weather conditions."""
+"""Django models for storing weather observations."""
+
+from datetime import datetime
 
 from django.db import models
+from django.utils import timezone
+
+
+def normalize_city(city: str) -> str:
+    """Return the case- and whitespace-insensitive key used to look up a city."""
+    return " ".join(city.split()).lower()
+
+
+def truncate_hour(value: datetime) -> datetime:
+    """Return the start of the hour `value` falls in."""
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+class WeatherDataQuerySet(models.QuerySet):
+    """QuerySet helpers for WeatherData."""
+
+    def between(self, start: datetime | None = None, end: datetime | None = None):
+        """
+        Readings with start <= timestamp < end; either bound may be omitted.
+
+        The table is range-partitioned by `hour` (see migration 0007), so the
+        range is also applied to `hour` to let PostgreSQL skip partitions
+        outside it. `hour` never exceeds `timestamp` and is at most one hour
+        earlier, so the extra predicates never drop a matching row.
+        """
+        queryset = self
+        if start is not None:
+            queryset = queryset.filter(timestamp__gte=start, hour__gte=truncate_hour(start))
+        if end is not None:
+            queryset = queryset.filter(timestamp__lt=end, hour__lt=end)
+        return queryset
+
+    def observations(self):
+        """Observed readings only, without stored forecast hours."""
+        return self.filter(is_forecast=False)
+
 
+class WeatherReading(models.Model):
+    """Columns of one weather observation, shared by WeatherData and LatestWeather.
 
-class WeatherData(models.Model):
-    """Model representing overall weather data for a specific location and time."""
+    Wind and condition readings are stored inline so an observation is a single
+    narrow row: reads need no joins and writes need a single INSERT.
+    """
 
-    timestamp = models.DateTimeField(auto_now_add=True)
+    timestamp = models.DateTimeField(default=timezone.now)
     city = models.CharField(max_length=100, null=False, blank=False)
     country = models.CharField(max_length=100, null=False, blank=False)
     lat = models.FloatField(null=False, blank=False)
@@ -14,33 +55,12 @@ class WeatherData(models.Model):
 
     temperature = models.FloatField(help_text="Temperature (°C)", null=False, blank=False)
     feels_like = models.FloatField(help_text="Feels-like temperature (°C)", null=True, blank=True)
-    humidity = models.IntegerField(help_text="Relative humidity (%)", null=True, blank=True)
+    humidity = models.PositiveSmallIntegerField(help_text="Relative humidity (%)", null=True, blank=True)
     pressure = models.FloatField(help_text="Atmospheric pressure (mbar)", null=False, blank=False)
     precipitation = models.FloatField(help_text="Precipitation amount (mm)", null=True, blank=True, default=0.0)
     dew_point = models.FloatField(help_text="Dew point (°C)", null=True, blank=True)
 
-    wind = models.OneToOneField(
-        'WindData',
-        on_delete=models.CASCADE,
-        related_name='weather_data',
-        null=False,
-        blank=False
-    )
-    condition = models.OneToOneField(
-        'WeatherCondition',
-        on_delete=models.CASCADE,
-        related_name='weather_data',
-        null=False,
-        blank=False
-    )
-
-    def __str__(self):
-        return f"{self.timestamp} - {self.city}: {self.temperature}°C"
-
-
-class WindData(models.Model):
-    """Model representing wind-related data."""
-
+    # Wind
     wind_speed = models.FloatField(help_text="Wind speed (km/h)", null=False, blank=False)
     wind_gust = models.FloatField(help_text="Wind gusts (km/h)", null=True, blank=True)
     wind_direction = models.CharField(
@@ -49,19 +69,13 @@ class WindData(models.Model):
         null=False,
         blank=False
     )
-    wind_degree = models.IntegerField(
+    wind_degree = models.PositiveSmallIntegerField(
         help_text="Wind direction in degrees (0° - North, 90° - East)",
         null=True,
         blank=True
     )
 
-    def __str__(self):
-        return f"Wind: {self.wind_speed} km/h, {self.wind_direction}"
-
-
-class WeatherCondition(models.Model):
-    """Model representing weather conditions such as visibility, clouds, and UV index."""
-
+    # Condition
     weather_condition = models.CharField(
         max_length=100,
         help_text="Weather description (Clear, Rain, Fog, etc.)",
@@ -69,9 +83,231 @@ class WeatherCondition(models.Model):
         blank=False
     )
     weather_icon = models.URLField(help_text="URL of the weather condition icon", null=True, blank=True)
-    cloudiness = models.IntegerField(help_text="Cloud cover (%)", null=True, blank=True)
+    cloudiness = models.PositiveSmallIntegerField(help_text="Cloud cover (%)", null=True, blank=True)
     visibility = models.FloatField(help_text="Visibility (km)", null=False, blank=False)
     uv_index = models.FloatField(help_text="UV index (sun exposure risk)", null=True, blank=True)
 
+    class Meta:
+        abstract = True
+
+    def __str__(self):
+        return f"{self.timestamp} - {self.city}: {self.temperature}°C"
+
+
+class WeatherData(WeatherReading):
+    """Model representing a weather observation for a specific location and time."""
+
+    # Deduplication keys, derived from city and timestamp by fill_keys()
+    city_key = models.CharField(max_length=100, editable=False, help_text="Normalized city name")
+    hour = models.DateTimeField(editable=False, help_text="Timestamp truncated to the hour")
+    # Forecast hours share the table so an observation of the hour replaces them in place
+    is_forecast = models.BooleanField(default=False, help_text="Hourly forecast rather than an observation")
+
+    objects = WeatherDataQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["city_key", "hour"], name="weather_unique_city_hour"),
+        ]
+        indexes = [
+            models.Index(fields=["city_key", "-timestamp", "-id"], name="weather_city_key_ts_id_idx"),
+            models.Index(fields=["-timestamp", "-id"], name="weather_timestamp_id_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.fill_keys()
+        super().save(*args, **kwargs)
+
+    def fill_keys(self):
+        """Populate city_key and hour from city and timestamp."""
+        self.city_key = normalize_city(self.city)
+        self.hour = truncate_hour(self.timestamp)
+
+
+class LatestWeather(WeatherReading):
+    """
+    The newest observed reading of each city, one row per city.
+
+    Kept up to date by WeatherModelFactory.bulk_create_weather in the same
+    transaction that stores the reading, so "now" views read one small table
+    instead of picking the newest row per city out of WeatherData.
+    """
+
+    city_key = models.CharField(max_length=100, primary_key=True, help_text="Normalized city name")
+    # Plain id rather than a ForeignKey: WeatherData's primary key is (id, hour) on partitioned tables
+    reading_id = models.BigIntegerField(null=True, blank=True, help_text="Id of the WeatherData row")
+    updated_at = models.DateTimeField(auto_now=True)
+
+
+class BackfillProgress(models.Model):
+    """Checkpoint of a completed (city, day) unit of a historical backfill."""
+
+    city_key = models.CharField(max_length=100, help_text="Normalized city name")
+    day = models.DateField()
+    rows = models.PositiveIntegerField(default=0, help_text="Hours written for the day")
+    completed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["city_key", "day"], name="backfill_unique_city_day"),
+        ]
+
+    def __str__(self):
+        return f"Backfill {self.city_key} {self.day}: {self.rows} rows"
+
+
+class TrackedCity(models.Model):
+    """
+    A city polled by the adaptive scheduler, with its own poll interval.
+
+    The interval shrinks while pressure or temperature change quickly and
+    grows while they are stable; the last observation it was adapted to is
+    kept so the next poll can measure the rate of change.
+    """
+
+    city_key = models.CharField(max_length=100, primary_key=True, help_text="Normalized city name")
+    name = models.CharField(max_length=100, help_text="City name sent to WeatherAPI")
+    enabled = models.BooleanField(default=True)
+    poll_interval = models.PositiveIntegerField(help_text="Current poll interval (seconds)")
+    next_poll_at = models.DateTimeField(help_text="When the city is due for its next poll")
+    last_polled_at = models.DateTimeField(null=True, blank=True)
+
+    last_observed_at = models.DateTimeField(null=True, blank=True, help_text="Upstream observation time")
+    last_temperature = models.FloatField(null=True, blank=True, help_text="Temperature (°C)")
+    last_pressure = models.FloatField(null=True, blank=True, help_text="Atmospheric pressure (mbar)")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["enabled", "next_poll_at"], name="tracked_city_due_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} every {self.poll_interval}s"
+
+
+class WeatherDailySummary(models.Model):
+    """Per-city daily rollup of readings, kept after raw rows expire."""
+
+    city_key = models.CharField(max_length=100, help_text="Normalized city name")
+    city = models.CharField(max_length=100)
+    country = models.CharField(max_length=100)
+    day = models.DateField(help_text="UTC day")
+    samples = models.PositiveIntegerField(help_text="Raw readings rolled up into this day")
+
+    temperature_min = models.FloatField(help_text="Temperature (°C)")
+    temperature_mean = models.FloatField(help_text="Temperature (°C)")
+    temperature_max = models.FloatField(help_text="Temperature (°C)")
+    humidity_mean = models.FloatField(help_text="Relative humidity (%)", null=True, blank=True)
+    pressure_mean = models.FloatField(help_text="Atmospheric pressure (mbar)")
+    precipitation_sum = models.FloatField(help_text="Precipitation amount (mm)", null=True, blank=True)
+    wind_speed_mean = models.FloatField(help_text="Wind speed (km/h)")
+    wind_speed_max = models.FloatField(help_text="Wind speed (km/h)")
+    wind_gust_max = models.FloatField(help_text="Wind gusts (km/h)", null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["city_key", "day"], name="summary_unique_city_day"),
+        ]
+
+    def __str__(self):
+        return f"{self.day} - {self.city}: {self.temperature_min}..{self.temperature_max}°C"
+
+
+class AlertRule(models.Model):
+    """
+    A condition on one reading column, checked for every stored observation.
+
+    `above`/`below` compare the reading with the threshold; `rise`/`drop`
+    compare it with the lowest/highest reading of the same city within the
+    preceding `window` seconds, e.g. "temperature drop > 8 within 3 h".
+    """
+
+    ABOVE, BELOW, RISE, DROP = "above", "below", "rise", "drop"
+    CONDITIONS = [
+        (ABOVE, "Above threshold"),
+        (BELOW, "Below threshold"),
+        (RISE, "Rises by more than threshold within window"),
+        (DROP, "Drops by more than threshold within window"),
+    ]
+    METRICS = [
+        (field, field.replace("_", " "))
+        for field in (
+            "temperature", "feels_like", "humidity", "pressure", "precipitation",
+            "wind_speed", "wind_gust", "cloudiness", "visibility", "uv_index",
+        )
+    ]
+
+    name = models.CharField(max_length=100)
+    city_key = models.CharField(
+        max_length=100, blank=True, default="", help_text="Normalized city name; empty for every city"
+    )
+    metric = models.CharField(max_length=20, choices=METRICS)
+    condition = models.CharField(max_length=10, choices=CONDITIONS)
+    threshold = models.FloatField()
+    window = models.PositiveIntegerField(default=0, help_text="Look-back of rise/drop rules (seconds)")
+    cooldown = models.PositiveIntegerField(
+        default=3600, help_text="Minimum time between two alerts of the rule for a city (seconds)"
+    )
+    enabled = models.BooleanField(default=True)
+    created_at = models.DateTimeField(
+        default=timezone.now, help_text="Readings observed earlier are not evaluated"
+    )
+
+    def save(self, *args, **kwargs):
+        self.city_key = normalize_city(self.city_key)
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return self.name
+
+
+class AlertRuleState(models.Model):
+    """
+    Rolling state of one rule for one city, updated by every evaluated reading.
+
+    `window` holds only the [epoch, value] pairs that can still become the
+    extreme of a rise/drop window (a monotonic queue), so its size is bounded
+    by the readings per window, not by the length of the history.
+    """
+
+    rule = models.ForeignKey(AlertRule, on_delete=models.CASCADE, related_name="states")
+    city_key = models.CharField(max_length=100, help_text="Normalized city name")
+    observed_at = models.DateTimeField(null=True, blank=True, help_text="Newest evaluated observation")
+    window = models.JSONField(default=list, blank=True)
+    firing = models.BooleanField(default=False, help_text="Whether the newest reading met the condition")
+    last_fired_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["rule", "city_key"], name="alert_state_unique_rule_city"),
+        ]
+
+    def __str__(self):
+        return f"{self.rule} - {self.city_key}"
+
+
+class AlertEvent(models.Model):
+    """An alert raised when a reading started to meet a rule's condition."""
+
+    rule = models.ForeignKey(AlertRule, on_delete=models.CASCADE, related_name="events")
+    city = models.CharField(max_length=100)
+    city_key = models.CharField(max_length=100, help_text="Normalized city name")
+    metric = models.CharField(max_length=20)
+    value = models.FloatField(help_text="Reading that triggered the alert")
+    reference = models.FloatField(
+        null=True, blank=True, help_text="Lowest/highest reading of the window for rise/drop rules"
+    )
+    threshold = models.FloatField()
+    observed_at = models.DateTimeField(help_text="Observation time of the reading")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["rule", "city_key", "observed_at"], name="alert_event_unique_reading"),
+        ]
+        indexes = [
+            models.Index(fields=["city_key", "-observed_at"], name="alert_event_city_idx"),
+        ]
+
     def __str__(self):
-        return f"Condition: {self.weather_condition}, Cloudiness: {self.cloudiness}%"
+        return f"{self.observed_at} - {self.city}: {self.rule}"
@@ -0,0 +1,209 @@
+"""Pagination classes for the weather API."""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def _page_size(request, query_param: str) -> int:
+    """Read the requested page size, clamped to the configured bounds."""
+    default = settings.WEATHER_PAGE_SIZE
+    try:
+        size = int(request.query_params.get(query_param, default))
+    except (TypeError, ValueError):
+        size = default
+    return max(settings.WEATHER_MIN_PAGE_SIZE, min(size, settings.WEATHER_MAX_PAGE_SIZE))
+
+
+class WeatherPageNumberPagination(PageNumberPagination):
+    """Classic ?page=N pagination, kept for clients that need page numbers and a total count."""
+
+    page_size_query_param = "page_size"
+
+    def get_page_size(self, request):
+        return _page_size(request, self.page_size_query_param)
+
+
+class WeatherKeysetPagination(BasePagination):
+    """
+    Keyset pagination over (timestamp, id), newest first.
+
+    Each page is fetched with an indexed range predicate on the last row seen
+    instead of OFFSET, and no COUNT query is run, so deep pages cost the same
+    as the first one.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    ordering = ("-timestamp", "-id")
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self):
+        self.base_url = None
+        self.next_key = None
+        self.previous_key = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset, page_size, key, reverse = self._page_queryset(queryset, request)
+        # One extra row tells us whether there is a page beyond this one
+        rows = list(queryset[:page_size + 1])
+        return self._page_rows(rows, page_size, key, reverse)
+
+    async def apaginate_queryset(self, queryset, request):
+        """Async twin of paginate_queryset() for async views."""
+        queryset, page_size, key, reverse = self._page_queryset(queryset, request)
+        rows = [row async for row in queryset[:page_size + 1]]
+        return self._page_rows(rows, page_size, key, reverse)
+
+    def _page_queryset(self, queryset, request):
+        """Apply the cursor's range predicate and ordering; return (queryset, page_size, key, reverse)."""
+        page_size = _page_size(request, self.page_size_query_param)
+        self.base_url = request.build_absolute_uri()
+
+        key, reverse = self.decode_cursor(request)
+        if key is None:
+            queryset = queryset.order_by(*self.ordering)
+        elif reverse:
+            timestamp, pk = key
+            queryset = queryset.filter(
+                Q(timestamp__gt=timestamp) | Q(timestamp=timestamp, id__gt=pk)
+            ).order_by("timestamp", "id")
+        else:
+            timestamp, pk = key
+            queryset = queryset.filter(
+                Q(timestamp__lt=timestamp) | Q(timestamp=timestamp, id__lt=pk)
+            ).order_by(*self.ordering)
+        return queryset, page_size, key, reverse
+
+    def _page_rows(self, rows, page_size, key, reverse):
+        """Trim the fetched rows to the page and remember the next/previous keys."""
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+
+        if not rows:
+            return rows
+
+        first, last = self.row_key(rows[0]), self.row_key(rows[-1])
+        if reverse:
+            self.next_key = last
+            self.previous_key = first if has_more else None
+        else:
+            self.next_key = last if has_more else None
+            self.previous_key = first if key is not None else None
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_data(self, data) -> dict:
+        """The paginated body; shared by the sync response and the async views."""
+        return {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_next_link(self):
+        """URL of the next (older) page, or None on the last page."""
+        if self.next_key is None:
+            return None
+        return self._link(self.next_key, reverse=False)
+
+    def get_previous_link(self):
+        """URL of the previous (newer) page, or None on the first page."""
+        if self.previous_key is None:
+            return None
+        return self._link(self.previous_key, reverse=True)
+
+    def to_html(self):
+        """No page controls in the browsable API; the `next`/`previous` links are the navigation."""
+        return ""
+
+    def _link(self, key, reverse: bool) -> str:
+        url = remove_query_param(self.base_url, "page")
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(key, reverse))
+
+    @staticmethod
+    def row_key(row) -> tuple[datetime, int]:
+        """(timestamp, id) of a model instance or a `.values()` row."""
+        if isinstance(row, dict):
+            return row["timestamp"], row["id"]
+        return row.timestamp, row.pk
+
+    @staticmethod
+    def encode_cursor(key: tuple[datetime, int], reverse: bool) -> str:
+        """Encode a (timestamp, id) position and direction as an opaque token."""
+        timestamp, pk = key
+        payload = {"t": timestamp.isoformat(), "i": pk}
+        if reverse:
+            payload["r"] = 1
+        return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode()
+
+    def decode_cursor(self, request) -> tuple[tuple[datetime, int] | None, bool]:
+        """Decode the request cursor into ((timestamp, id), reverse), or (None, False) for page one."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            key = (datetime.fromisoformat(payload["t"]), int(payload["i"]))
+            return key, bool(payload.get("r"))
+        except (binascii.Error, ValueError, TypeError, KeyError) as e:
+            raise NotFound(self.invalid_cursor_message) from e
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Django paginator that takes large counts from the PostgreSQL planner.
+
+    The planner's row estimate for the (filtered) query comes from table
+    statistics without reading any rows. An exact COUNT(*) is only run when
+    the estimate is below settings.WEATHER_ADMIN_EXACT_COUNT_LIMIT, where it is
+    cheap and the estimate is least reliable. Other databases always count.
+    """
+
+    @cached_property
+    def count(self):
+        estimate = self.estimated_count()
+        if estimate is None or estimate < settings.WEATHER_ADMIN_EXACT_COUNT_LIMIT:
+            return super().count
+        return estimate
+
+    def estimated_count(self) -> int | None:
+        """Return the planner's row estimate, or None when it is not available."""
+        queryset = self.object_list
+        if not isinstance(queryset, QuerySet) or connections[queryset.db].vendor != "postgresql":
+            return None
+
+        sql, params = queryset.order_by().values("pk").query.sql_with_params()
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
@@ -1,10 +1,16 @@
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.utils import timezone
 from rest_framework import serializers
-from .models import WeatherData, WindData, WeatherCondition
+from .models import WeatherData
+from .services.aggregation_service import WeatherAggregationService
+from .services.export_service import WeatherExportService
 
 
 class WindDataSerializer(serializers.ModelSerializer):
     class Meta:
-        model = WindData
+        model = WeatherData
         fields = [
             "wind_speed",
             "wind_direction",
@@ -15,7 +21,7 @@ class WindDataSerializer(serializers.ModelSerializer):
 
 class WeatherConditionSerializer(serializers.ModelSerializer):
     class Meta:
-        model = WeatherCondition
+        model = WeatherData
         fields = [
             "weather_condition",
             "weather_icon",
@@ -26,8 +32,9 @@ class WeatherConditionSerializer(serializers.ModelSerializer):
 
 
 class WeatherDataSerializer(serializers.ModelSerializer):
-    wind = WindDataSerializer(read_only=True)
-    condition = WeatherConditionSerializer(read_only=True)
+    # Wind and condition columns live on WeatherData; keep the nested output shape.
+    wind = WindDataSerializer(source="*", read_only=True)
+    condition = WeatherConditionSerializer(source="*", read_only=True)
 
     class Meta:
         model = WeatherData
@@ -47,3 +54,99 @@ class WeatherDataSerializer(serializers.ModelSerializer):
             "wind",
             "condition"
         ]
+
+
+class WeatherDataRowSerializer:
+    """
+    Read-only fast path of WeatherDataSerializer for list responses.
+
+    Works on `.values(*WeatherDataRowSerializer.fields)` rows and builds the
+    nested dicts directly instead of running DRF's per-field machinery. The
+    output renders to exactly the same JSON as WeatherDataSerializer: column
+    values already have the Python types DRF would return, and the timestamp
+    goes through the same DateTimeField so timezone and format handling match.
+    """
+
+    top_fields = tuple(f for f in WeatherDataSerializer.Meta.fields if f not in ("wind", "condition"))
+    wind_fields = tuple(WindDataSerializer.Meta.fields)
+    condition_fields = tuple(WeatherConditionSerializer.Meta.fields)
+    fields = top_fields + wind_fields + condition_fields
+
+    _timestamp = serializers.DateTimeField()
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    @property
+    def data(self) -> list[dict]:
+        """The rows rendered like WeatherDataSerializer(many=True).data."""
+        return [self.to_representation(row) for row in self.rows]
+
+    @classmethod
+    def to_representation(cls, row: dict) -> dict:
+        """Render one `.values()` row with nested wind and condition dicts."""
+        data = {field: row[field] for field in cls.top_fields}
+        if data["timestamp"] is not None:
+            data["timestamp"] = cls._timestamp.to_representation(data["timestamp"])
+        data["wind"] = {field: row[field] for field in cls.wind_fields}
+        data["condition"] = {field: row[field] for field in cls.condition_fields}
+        return data
+
+
+class QuerySerializer(serializers.Serializer):
+    """Base for serializers that validate request query parameters; save() just returns them."""
+
+    def create(self, validated_data):
+        return validated_data
+
+    def update(self, instance, validated_data):
+        return {**instance, **validated_data}
+
+
+class WeatherRangeQuerySerializer(QuerySerializer):
+    """A city and a time range; start/end default to the last WEATHER_AGGREGATE_DEFAULT_DAYS days."""
+
+    city = serializers.CharField(max_length=100)
+    start = serializers.DateTimeField(required=False)
+    end = serializers.DateTimeField(required=False)
+
+    @staticmethod
+    def default_end() -> datetime:
+        """The `end` of a request without one: now, truncated to the minute so responses can be cached."""
+        return timezone.now().replace(second=0, microsecond=0)
+
+    @classmethod
+    def cache_vary(cls, query_params) -> datetime | None:
+        """What a cached response depends on beyond the query string: the default end, if one is used."""
+        return None if "end" in query_params else cls.default_end()
+
+    def validate(self, attrs):
+        end = attrs.get("end") or self.default_end()
+        start = attrs.get("start") or end - timedelta(days=settings.WEATHER_AGGREGATE_DEFAULT_DAYS)
+        if start >= end:
+            raise serializers.ValidationError("start must be before end")
+        attrs.update(start=start, end=end)
+        return attrs
+
+
+class WeatherAggregateQuerySerializer(WeatherRangeQuerySerializer):
+    """Query parameters of the aggregate endpoint."""
+
+    bucket = serializers.ChoiceField(choices=list(WeatherAggregationService.BUCKETS), default="hour")
+    points = serializers.IntegerField(required=False, min_value=3, max_value=10000)
+    metric = serializers.ChoiceField(choices=WeatherAggregationService.METRICS, default="temperature")
+
+
+class WeatherDerivedQuerySerializer(WeatherRangeQuerySerializer):
+    """Query parameters of the derived-metrics endpoint; window_hours sizes the rolling window."""
+
+    window_hours = serializers.IntegerField(default=24, min_value=1, max_value=720)
+
+
+class WeatherExportQuerySerializer(QuerySerializer):
+    """Query parameters of the export endpoint; every filter is optional."""
+
+    city = serializers.CharField(max_length=100, required=False)
+    start = serializers.DateTimeField(required=False)
+    end = serializers.DateTimeField(required=False)
+    format = serializers.ChoiceField(choices=list(WeatherExportService.FORMATS), default="csv")
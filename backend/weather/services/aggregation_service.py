@@ -0,0 +1,75 @@
+"""Time-bucketed aggregation of weather readings for charts."""
+
+from datetime import datetime
+
+from django.db.models import Avg, Count, Max, Min
+from django.db.models.functions import TruncDay, TruncHour, TruncWeek
+from weather.models import WeatherData, normalize_city
+from weather.services.downsampling import lttb
+
+
+class WeatherAggregationService:
+    """Compute min/mean/max per metric per time bucket in the database."""
+
+    BUCKETS = {
+        "hour": TruncHour,
+        "day": TruncDay,
+        "week": TruncWeek,
+    }
+
+    # Numeric WeatherData columns
+    METRICS = (
+        "temperature", "feels_like", "humidity", "pressure", "precipitation", "dew_point", "wind_speed", "wind_gust",
+    )
+
+    def aggregate(self, city: str, start: datetime, end: datetime, bucket: str) -> list[dict]:
+        """
+        Aggregate a city's readings in [start, end) into buckets.
+
+        Args:
+            city (str): City name (case-insensitive).
+            start (datetime): Inclusive range start.
+            end (datetime): Exclusive range end.
+            bucket (str): One of BUCKETS.
+
+        Returns:
+            list[dict]: One entry per non-empty bucket, oldest first.
+        """
+        return [self._to_entry(row) for row in self._queryset(city, start, end, bucket)]
+
+    async def aaggregate(self, city: str, start: datetime, end: datetime, bucket: str) -> list[dict]:
+        """Async twin of aggregate() using the async ORM."""
+        return [self._to_entry(row) async for row in self._queryset(city, start, end, bucket)]
+
+    def _queryset(self, city: str, start: datetime, end: datetime, bucket: str):
+        aggregates = {"samples": Count("id")}
+        for metric in self.METRICS:
+            aggregates[f"{metric}__min"] = Min(metric)
+            aggregates[f"{metric}__mean"] = Avg(metric)
+            aggregates[f"{metric}__max"] = Max(metric)
+
+        return (
+            WeatherData.objects.observations()
+            .filter(city_key=normalize_city(city))
+            .between(start, end)
+            .annotate(bucket=self.BUCKETS[bucket]("timestamp"))
+            .values("bucket")
+            .annotate(**aggregates)
+            .order_by("bucket")
+        )
+
+    def downsample(self, entries: list[dict], points: int, metric: str) -> list[dict]:
+        """Reduce entries to `points` with LTTB on the mean of `metric`."""
+        xs = [entry["bucket"].timestamp() for entry in entries]
+        ys = [entry[metric]["mean"] for entry in entries]
+        return [entries[i] for i in lttb(xs, ys, points)]
+
+    def _to_entry(self, row: dict) -> dict:
+        entry = {"bucket": row["bucket"], "samples": row["samples"]}
+        for metric in self.METRICS:
+            entry[metric] = {
+                "min": row[f"{metric}__min"],
+                "mean": row[f"{metric}__mean"],
+                "max": row[f"{metric}__max"],
+            }
+        return entry
@@ -0,0 +1,185 @@
+"""Incremental evaluation of alert rules against freshly stored readings."""
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from weather.metrics import ALERTS_FIRED
+from weather.models import AlertEvent, AlertRule, AlertRuleState, WeatherData
+
+
+class AlertEngine:
+    """
+    Evaluate every enabled AlertRule for the cities of a stored batch.
+
+    Each (rule, city) pair keeps an AlertRuleState with the newest evaluated
+    observation and, for rise/drop rules, a monotonic queue of the readings
+    that can still be the window's extreme. A reading is checked against that
+    state alone, so evaluation costs the same however long the history is:
+    per batch one read of the rules (cached), one locked read of the states
+    and one upsert of the states, plus, when alerts fire, one read of the
+    already stored alerts and one insert of the new ones.
+
+    Alerts fire when a condition starts to hold, not on every reading while
+    it keeps holding, and at most once per rule cooldown for a city; readings
+    already evaluated (retries, duplicates) are ignored.
+    """
+
+    RULES_KEY = "weather:alerts:rules"
+    RULES_TIMEOUT = 300
+
+    def __init__(self):
+        self.cache = caches[settings.WEATHER_CACHE_ALIAS]
+
+    def rules(self) -> list[AlertRule]:
+        """Enabled rules, cached until a rule is saved or deleted."""
+        rules = self.cache.get(self.RULES_KEY)
+        if rules is None:
+            rules = list(AlertRule.objects.filter(enabled=True).order_by("pk"))
+            self.cache.set(self.RULES_KEY, rules, self.RULES_TIMEOUT)
+        return rules
+
+    def invalidate(self) -> None:
+        """Drop the cached rules."""
+        self.cache.delete(self.RULES_KEY)
+
+    def evaluate(self, weathers: list[WeatherData]) -> list[AlertEvent]:
+        """
+        Evaluate the rules for saved readings; call inside the transaction that stored them.
+
+        Forecast hours and readings in the future are not observations and are
+        ignored, as are readings observed before a rule was created.
+
+        Args:
+            weathers (list[WeatherData]): Saved readings.
+
+        Returns:
+            list[AlertEvent]: The alerts raised, leaving out ones already stored.
+        """
+        rules = self.rules()
+        if not rules:
+            return []
+
+        now = timezone.now()
+        readings = {}
+        for weather in sorted(weathers, key=lambda weather: weather.timestamp):
+            if not weather.is_forecast and weather.timestamp <= now:
+                readings.setdefault(weather.city_key, []).append(weather)
+        pairs = [
+            (rule, city_key) for city_key in readings for rule in rules
+            if rule.city_key in ("", city_key)
+        ]
+        if not pairs:
+            return []
+
+        stored = {
+            (state.rule_id, state.city_key): state
+            for state in AlertRuleState.objects.select_for_update()
+            .filter(rule_id__in={rule.pk for rule, _ in pairs}, city_key__in=readings)
+        }
+        states, events = [], []
+        for rule, city_key in pairs:
+            state = stored.get((rule.pk, city_key)) or AlertRuleState(rule=rule, city_key=city_key)
+            states.append(state)
+            for weather in readings[city_key]:
+                event = self.step(rule, state, weather)
+                if event is not None:
+                    events.append(event)
+
+        AlertRuleState.objects.bulk_create(
+            states,
+            update_conflicts=True,
+            unique_fields=["rule", "city_key"],
+            update_fields=["observed_at", "window", "firing", "last_fired_at"],
+        )
+        events = self._unstored(events)
+        if events:
+            AlertEvent.objects.bulk_create(events, ignore_conflicts=True)
+            for event in events:
+                ALERTS_FIRED.labels(event.metric, event.rule.condition).inc()
+        return events
+
+    @staticmethod
+    def _unstored(events: list[AlertEvent]) -> list[AlertEvent]:
+        """Drop events whose (rule, city, reading) is already stored, e.g. when a reading is re-evaluated."""
+        if not events:
+            return []
+        seen = set(
+            AlertEvent.objects.filter(
+                rule_id__in={event.rule_id for event in events},
+                city_key__in={event.city_key for event in events},
+                observed_at__in={event.observed_at for event in events},
+            ).values_list("rule_id", "city_key", "observed_at")
+        )
+        unstored = []
+        for event in events:
+            key = (event.rule_id, event.city_key, event.observed_at)
+            if key not in seen:
+                seen.add(key)
+                unstored.append(event)
+        return unstored
+
+    @classmethod
+    def step(cls, rule: AlertRule, state: AlertRuleState, weather: WeatherData) -> AlertEvent | None:
+        """
+        Advance a rule's state by one reading of its city.
+
+        Returns:
+            AlertEvent | None: An unsaved alert when the condition started to hold.
+        """
+        if weather.timestamp < rule.created_at:
+            return None
+        if state.observed_at is not None and weather.timestamp <= state.observed_at:
+            return None
+        state.observed_at = weather.timestamp
+
+        value = getattr(weather, rule.metric)
+        if value is None:
+            return None
+        holds, reference = cls.check(rule, state, weather.timestamp.timestamp(), value)
+
+        event = None
+        cooled_down = (
+            state.last_fired_at is None
+            or (weather.timestamp - state.last_fired_at).total_seconds() >= rule.cooldown
+        )
+        if holds and not state.firing and cooled_down:
+            state.last_fired_at = weather.timestamp
+            event = AlertEvent(
+                rule=rule, city=weather.city, city_key=weather.city_key, metric=rule.metric,
+                value=value, reference=reference, threshold=rule.threshold, observed_at=weather.timestamp,
+            )
+        state.firing = holds
+        return event
+
+    @staticmethod
+    def check(rule: AlertRule, state: AlertRuleState, epoch: float, value: float) -> tuple[bool, float | None]:
+        """
+        Whether a reading meets the rule, and the window extreme it was compared with.
+
+        For rise/drop rules the reading is also pushed onto the state's window:
+        entries older than the window are dropped from the front and entries
+        that can no longer be the extreme (not lower than the reading for rise,
+        not higher for drop) from the back, so the front is always the extreme.
+        """
+        if rule.condition == AlertRule.ABOVE:
+            return value > rule.threshold, None
+        if rule.condition == AlertRule.BELOW:
+            return value < rule.threshold, None
+
+        rise = rule.condition == AlertRule.RISE
+        window = [entry for entry in state.window if entry[0] > epoch - rule.window]
+        reference = window[0][1] if window else None
+        holds = reference is not None and (value - reference if rise else reference - value) > rule.threshold
+
+        while window and (window[-1][1] >= value if rise else window[-1][1] <= value):
+            window.pop()
+        window.append([epoch, value])
+        state.window = window
+        return holds, reference
+
+
+@receiver([post_save, post_delete], sender=AlertRule)
+def _invalidate_rules(**kwargs):
+    AlertEngine().invalidate()
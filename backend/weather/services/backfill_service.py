@@ -0,0 +1,120 @@
+"""Parallel, resumable backfill of historical weather."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from django.db import connections
+from weather.models import BackfillProgress, normalize_city
+from weather.services.exceptions import WeatherAPIError
+from weather.services.history_weather_service import HistoryWeatherService
+
+
+@dataclass
+class BackfillStats:
+    """Progress and throughput of a backfill run."""
+
+    total: int
+    done: int = 0
+    rows: int = 0
+    failed: dict[str, str] = field(default_factory=dict)
+    started: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the run started."""
+        return time.perf_counter() - self.started
+
+    def as_dict(self) -> dict:
+        """JSON-serializable summary with throughput, for logs and task results."""
+        elapsed = max(self.elapsed, 1e-9)
+        return {
+            "units": self.total,
+            "done": self.done,
+            "failed": len(self.failed),
+            "rows": self.rows,
+            "seconds": round(self.elapsed, 2),
+            "days_per_sec": round(self.done / elapsed, 2),
+            "rows_per_sec": round(self.rows / elapsed, 1),
+        }
+
+
+class BackfillService:
+    """
+    Backfill hourly history as independent (city, day) units.
+
+    A unit is checkpointed in BackfillProgress once its hours are stored, so an
+    interrupted run resumes with the units that are still missing. Re-running a
+    unit is harmless because already stored hours are skipped.
+    """
+
+    def __init__(self):
+        self.history = HistoryWeatherService()
+
+    @staticmethod
+    def days(start: date, end: date) -> list[date]:
+        """Every day from start to end, inclusive."""
+        return [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+    def pending_units(self, cities: list[str], start: date, end: date) -> list[tuple[str, date]]:
+        """Return the (city, day) units in range without a checkpoint, in one query."""
+        keys = {normalize_city(city): city for city in cities}
+        completed = set(
+            BackfillProgress.objects
+            .filter(city_key__in=keys, day__gte=start, day__lte=end)
+            .values_list("city_key", "day")
+        )
+        return [
+            (city, day)
+            for city_key, city in keys.items()
+            for day in self.days(start, end)
+            if (city_key, day) not in completed
+        ]
+
+    def reset(self, cities: list[str], start: date, end: date) -> int:
+        """Drop the checkpoints of a range so it is fetched again."""
+        deleted, _ = BackfillProgress.objects.filter(
+            city_key__in={normalize_city(city) for city in cities}, day__gte=start, day__lte=end
+        ).delete()
+        return deleted
+
+    def run_unit(self, city: str, day: date) -> int:
+        """Fetch and store one city-day, checkpoint it and return the rows written."""
+        saved = self.history.get_history(city, day)
+        if isinstance(saved, dict):
+            raise WeatherAPIError(saved["error"])
+
+        BackfillProgress.objects.update_or_create(
+            city_key=normalize_city(city), day=day, defaults={"rows": len(saved)}
+        )
+        return len(saved)
+
+    def run(self, units: list[tuple[str, date]], workers: int, on_progress=None) -> BackfillStats:
+        """
+        Run units on a thread pool, calling `on_progress(stats)` after each one.
+
+        A unit that raises is recorded in `stats.failed` and left without a
+        checkpoint, so the next run retries it; the other units carry on.
+        """
+        stats = BackfillStats(total=len(units))
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="backfill") as pool:
+            futures = {pool.submit(self._run_in_thread, city, day): (city, day) for city, day in units}
+            for future in as_completed(futures):
+                city, day = futures[future]
+                try:
+                    stats.rows += future.result()
+                    stats.done += 1
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    # One failing unit (API, database, bad payload) must not stop the run
+                    stats.failed[f"{city} {day}"] = str(e) or type(e).__name__
+                if on_progress:
+                    on_progress(stats)
+        return stats
+
+    def _run_in_thread(self, city: str, day: date) -> int:
+        try:
+            return self.run_unit(city, day)
+        finally:
+            # Each pool thread has its own DB connection; don't leak it
+            connections.close_all()
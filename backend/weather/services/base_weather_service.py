@@ -1,11 +1,17 @@
 import logging
+from datetime import date as date_type
+from datetime import datetime, time
+from datetime import timezone as dt_timezone
 
-from weather.models import WeatherData
+from weather.models import WeatherData, normalize_city
 from weather.services.weather_api_client import WeatherAPIClient
 from weather.services.weather_factory import WeatherModelFactory
 
 
 class BaseWeatherService:
+    # Fields without which a current or hourly record cannot be stored
+    CRITICAL_FIELDS = ("temp_c", "pressure_mb", "wind_kph", "vis_km")
+
     def __init__(self):
         self.api_client = WeatherAPIClient()
         self.logger = logging.getLogger(__name__)
@@ -14,9 +20,25 @@ class BaseWeatherService:
         return int(time_str[-5:-3])
 
     def _already_exists(self, city: str, date: str, hour: int):
-        return WeatherData.objects.filter(city=city, timestamp__date=date, timestamp__hour=hour).first()
+        hour_start = datetime.combine(date_type.fromisoformat(str(date)), time(hour), tzinfo=dt_timezone.utc)
+        return WeatherData.objects.filter(city_key=normalize_city(city), hour=hour_start).first()
+
+    def _existing_hours(self, city: str, start: datetime, end: datetime) -> set[datetime]:
+        """Return the observed (non-forecast) hours of a city in [start, end] with one indexed range query."""
+        return set(
+            WeatherData.objects.observations()
+            .filter(city_key=normalize_city(city), hour__gte=start, hour__lte=end)
+            .values_list("hour", flat=True)
+        )
+
+    def _missing_critical_field(self, record: dict) -> str | None:
+        for field in self.CRITICAL_FIELDS:
+            if field not in record or record[field] is None:
+                return field
+        return None
+
+    def _save_weather(self, city: str, data: dict) -> WeatherData | None:
+        return WeatherModelFactory.create_weather(city, data)
 
-    def _save_weather(self, city: str, data: dict) -> WeatherData:
-        wind = WeatherModelFactory.create_wind(data)
-        condition = WeatherModelFactory.create_condition(data)
-        return WeatherModelFactory.create_weather(city, data, wind, condition)
+    def _save_weather_batch(self, readings: list[tuple[str, dict]]) -> list[WeatherData]:
+        return WeatherModelFactory.bulk_create_weather(readings)
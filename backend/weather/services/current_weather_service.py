@@ -1,35 +1,34 @@
 from weather.services.base_weather_service import BaseWeatherService
-from weather.services.weather_factory import WeatherModelFactory
 
 
 class CurrentWeatherService(BaseWeatherService):
     """Service for getting current weather."""
 
     def get_weather(self, city: str):
+        data = self.fetch_current(city)
+
+        error = self.validate_current(city, data)
+        if error:
+            return {"error": error}
+
+        location = data["location"]
+        return self._save_weather(location.get("name", "Unknown"), {**location, **data["current"]})
+
+    def fetch_current(self, city: str) -> dict:
+        """Fetch the raw `current.json` payload for a city."""
         params = {"key": self.api_client.api_key, "q": city, "aqi": "no"}
-        data = self.api_client.fetch_data("current", params)
+        return self.api_client.fetch_data("current", params)
 
+    def validate_current(self, city: str, data: dict) -> str | None:
+        """Return an error message if the payload cannot be stored, otherwise None."""
         if "current" not in data or "location" not in data:
             self.logger.error(f"Missing 'current' or 'location' in API response for city: {city}")
-            return {"error": "Failed to fetch current weather"}
-
-        current = data["current"]
-        location = data["location"]
+            return "Failed to fetch current weather"
 
         # Валідація критичних полів
-        for field in ["temp_c", "pressure_mb", "wind_kph", "vis_km"]:
-            if field not in current or current[field] is None:
-                self.logger.error(f"Missing critical field '{field}' for city: {city}")
-                return {"error": f"Missing field: {field}"}
-
-        wind = WeatherModelFactory.create_wind(current)
-        condition = WeatherModelFactory.create_condition(current)
-
-        weather = WeatherModelFactory.create_weather(
-            city=location.get("name", "Unknown"),
-            data={**location, **current},
-            wind=wind,
-            condition=condition
-        )
-
-        return weather
+        field = self._missing_critical_field(data["current"])
+        if field:
+            self.logger.error(f"Missing critical field '{field}' for city: {city}")
+            return f"Missing field: {field}"
+
+        return None
@@ -0,0 +1,50 @@
+"""Downsampling helpers for chart series."""
+
+
+def lttb(xs: list[float], ys: list[float | None], threshold: int) -> list[int]:
+    """
+    Pick `threshold` points of a series with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept; in between, each bucket keeps
+    the point forming the largest triangle with the previously kept point and
+    the average of the next bucket, which preserves peaks and troughs.
+
+    Args:
+        xs (list[float]): Ascending x values (e.g. epoch seconds).
+        ys (list[float | None]): Y values; missing values count as 0 for selection.
+        threshold (int): Number of points to keep.
+
+    Returns:
+        list[int]: Ascending indices of the selected points.
+    """
+    length = len(xs)
+    if threshold >= length or threshold < 3:
+        return list(range(length))
+
+    ys = [y if y is not None else 0.0 for y in ys]
+    selected = [0]
+    bucket_size = (length - 2) / (threshold - 2)
+    previous = 0
+
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+
+        next_start = end
+        next_end = min(int((i + 2) * bucket_size) + 1, length)
+        next_count = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / next_count
+        avg_y = sum(ys[next_start:next_end]) / next_count
+
+        px, py = xs[previous], ys[previous]
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((px - avg_x) * (ys[j] - py) - (px - xs[j]) * (avg_y - py))
+            if area > best_area:
+                best, best_area = j, area
+
+        selected.append(best)
+        previous = best
+
+    selected.append(length - 1)
+    return selected
@@ -0,0 +1,111 @@
+"""Live reading events: Redis pub/sub publishing and a Server-Sent Events stream."""
+
+import logging
+import threading
+import time
+from collections.abc import AsyncIterator
+
+import redis
+import redis.asyncio
+from django.conf import settings
+from rest_framework.renderers import JSONRenderer
+from weather.serializers import WeatherDataRowSerializer
+
+logger = logging.getLogger(__name__)
+
+# How long EventSource clients wait before reconnecting after a dropped stream
+RECONNECT_MILLISECONDS = 3000
+
+
+def channel(city_key: str) -> str:
+    """Redis channel carrying the new readings of one city."""
+    return f"{settings.WEATHER_EVENTS_CHANNEL}:{city_key}"
+
+
+class WeatherEventPublisher:
+    """
+    Publish new readings on their city's Redis channel.
+
+    A message is the reading in the list endpoint's JSON shape. Publishing
+    is best effort: without WEATHER_EVENTS_REDIS_URL it is a no-op, and a
+    Redis failure is logged instead of failing ingestion.
+    """
+
+    _client = None
+    _client_lock = threading.Lock()
+
+    def __init__(self, client=None):
+        self.client = client if client is not None else self.get_client()
+
+    @classmethod
+    def get_client(cls):
+        """Return the process-wide Redis client, or None when events are not configured."""
+        if not settings.WEATHER_EVENTS_REDIS_URL:
+            return None
+        if cls._client is None:
+            with cls._client_lock:
+                if cls._client is None:
+                    cls._client = redis.Redis.from_url(settings.WEATHER_EVENTS_REDIS_URL)
+        return cls._client
+
+    @staticmethod
+    def payload(weather) -> bytes:
+        """JSON of a saved WeatherData instance, identical to its list entry."""
+        row = {field: getattr(weather, field) for field in WeatherDataRowSerializer.fields}
+        return JSONRenderer().render(WeatherDataRowSerializer.to_representation(row))
+
+    def publish(self, weathers) -> int:
+        """Publish every reading in one pipeline round trip; return how many were sent."""
+        if self.client is None or not weathers:
+            return 0
+
+        pipeline = self.client.pipeline(transaction=False)
+        for weather in weathers:
+            pipeline.publish(channel(weather.city_key), self.payload(weather))
+        try:
+            pipeline.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Publishing {len(weathers)} reading events failed: {e}")
+            return 0
+        return len(weathers)
+
+
+async def stream_readings(city_keys: list[str], pubsub=None, keepalive: float | None = None) -> AsyncIterator[str]:
+    """
+    Yield Server-Sent Events frames with the new readings of the given cities.
+
+    Subscribes to the cities' channels and forwards each message as a
+    `reading` event; a comment frame is sent after `keepalive` idle seconds
+    so proxies keep the connection open and dropped clients are noticed.
+    Runs until the client disconnects. No database queries are made.
+
+    Args:
+        city_keys (list[str]): Normalized city names.
+        pubsub: An asyncio Redis PubSub; a new connection is opened when omitted.
+        keepalive (float | None): Idle seconds between keep-alive comments.
+            Defaults to settings.WEATHER_EVENTS_KEEPALIVE_SECONDS.
+    """
+    keepalive = keepalive or settings.WEATHER_EVENTS_KEEPALIVE_SECONDS
+    client = None
+    if pubsub is None:
+        client = redis.asyncio.Redis.from_url(settings.WEATHER_EVENTS_REDIS_URL)
+        pubsub = client.pubsub()
+
+    await pubsub.subscribe(*(channel(city_key) for city_key in city_keys))
+    try:
+        yield f"retry: {RECONNECT_MILLISECONDS}\n\n"
+        last_sent = time.monotonic()
+        while True:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=keepalive)
+            if message is not None:
+                data = message["data"]
+                yield f"event: reading\ndata: {data.decode() if isinstance(data, bytes) else data}\n\n"
+                last_sent = time.monotonic()
+            elif time.monotonic() - last_sent >= keepalive:
+                # Subscribe confirmations also return None, so only an idle period counts
+                yield ": keepalive\n\n"
+                last_sent = time.monotonic()
+    finally:
+        await pubsub.aclose()
+        if client is not None:
+            await client.aclose()
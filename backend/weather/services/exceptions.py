@@ -1,2 +1,6 @@
 class WeatherAPIError(Exception):
     """Raised when WeatherAPI returns an error or request fails."""
+
+
+class RateLimitExceeded(WeatherAPIError):
+    """Raised when a WeatherAPI call would exceed the client-side rate limit or quota."""
@@ -0,0 +1,151 @@
+"""Streaming export of weather history as CSV, NDJSON or Parquet."""
+
+import csv
+import io
+from collections.abc import Iterable, Iterator
+from itertools import islice
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+EXPORT_FIELDS = (
+    "id", "timestamp", "city", "country", "lat", "lon",
+    "temperature", "feels_like", "humidity", "pressure", "precipitation", "dew_point",
+    "wind_speed", "wind_gust", "wind_direction", "wind_degree",
+    "weather_condition", "weather_icon", "cloudiness", "visibility", "uv_index",
+)
+
+
+class ExportFormatUnavailable(Exception):
+    """Raised when an export format needs an optional dependency that is not installed."""
+
+
+class _ChunkSink:
+    """Write-only file object collecting bytes until they are drained into the response."""
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        """Collect `data`; return its length like a file would."""
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        """Bytes written so far (the writer needs the position for Parquet offsets)."""
+        return self.position
+
+    def flush(self) -> None:
+        """Nothing to flush: chunks are kept until drain()."""
+
+    def close(self) -> None:
+        """Mark the sink closed; collected chunks can still be drained."""
+        self.closed = True
+
+    def drain(self) -> bytes:
+        """Return and forget everything written since the last drain."""
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+class WeatherExportService:
+    """
+    Stream WeatherData rows without building model instances.
+
+    Rows are read as tuples through a server-side cursor (`iterator()` on
+    PostgreSQL) and encoded in fixed-size batches, so memory stays flat
+    regardless of how many rows are exported.
+    """
+
+    FORMATS = {
+        "csv": ("text/csv; charset=utf-8", "csv"),
+        "ndjson": ("application/x-ndjson", "ndjson"),
+        "parquet": ("application/vnd.apache.parquet", "parquet"),
+    }
+
+    def __init__(self, batch_size: int | None = None):
+        self.batch_size = batch_size or settings.WEATHER_EXPORT_BATCH_SIZE
+
+    def rows(self, queryset) -> Iterator[tuple]:
+        """Iterate the export columns of a queryset as tuples, batch_size rows per fetch."""
+        return queryset.values_list(*EXPORT_FIELDS).iterator(chunk_size=self.batch_size)
+
+    def stream(self, queryset, export_format: str) -> Iterator[bytes]:
+        """Return an iterator of encoded chunks; raises ExportFormatUnavailable early."""
+        rows = self.rows(queryset)
+        if export_format == "csv":
+            return self.csv_stream(rows)
+        if export_format == "ndjson":
+            return self.ndjson_stream(rows)
+        self._require_pyarrow()
+        return self.parquet_stream(rows)
+
+    def csv_stream(self, rows: Iterable[tuple]) -> Iterator[bytes]:
+        """Encode rows as CSV with a header line, one chunk per batch."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_FIELDS)
+        for batch in self._batches(rows):
+            writer.writerows((row[0], row[1].isoformat(), *row[2:]) for row in batch)
+            yield self._take(buffer)
+        yield self._take(buffer)
+
+    def ndjson_stream(self, rows: Iterable[tuple]) -> Iterator[bytes]:
+        """Encode rows as one JSON object per line, one chunk per batch."""
+        encoder = DjangoJSONEncoder(separators=(",", ":"))
+        for batch in self._batches(rows):
+            lines = (encoder.encode(dict(zip(EXPORT_FIELDS, row))) for row in batch)
+            yield ("\n".join(lines) + "\n").encode()
+
+    def parquet_stream(self, rows: Iterable[tuple]) -> Iterator[bytes]:
+        """Encode rows as a zstd-compressed Parquet file, one row group per batch."""
+        pa, pq = self._require_pyarrow()
+        schema = self._parquet_schema(pa)
+        sink = _ChunkSink()
+        with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+            for batch in self._batches(rows):
+                columns = list(zip(*batch))
+                arrays = [pa.array(column, type=field.type) for column, field in zip(columns, schema)]
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+                yield sink.drain()
+        yield sink.drain()
+
+    def _batches(self, rows: Iterable[tuple]) -> Iterator[list[tuple]]:
+        rows = iter(rows)
+        while batch := list(islice(rows, self.batch_size)):
+            yield batch
+
+    @staticmethod
+    def _take(buffer: io.StringIO) -> bytes:
+        data = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    @staticmethod
+    def _require_pyarrow():
+        try:
+            import pyarrow  # pylint: disable=import-outside-toplevel
+            import pyarrow.parquet  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ExportFormatUnavailable("Parquet export requires the 'pyarrow' package") from e
+        return pyarrow, pyarrow.parquet
+
+    @staticmethod
+    def _parquet_schema(pa):
+        types = {
+            "id": pa.int64(),
+            "timestamp": pa.timestamp("us", tz="UTC"),
+            "humidity": pa.int16(),
+            "wind_degree": pa.int16(),
+            "cloudiness": pa.int16(),
+        }
+        strings = {"city", "country", "wind_direction", "weather_condition", "weather_icon"}
+        return pa.schema([
+            (name, types.get(name, pa.string() if name in strings else pa.float64()))
+            for name in EXPORT_FIELDS
+        ])
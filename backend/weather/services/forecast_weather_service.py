@@ -0,0 +1,25 @@
+"""Fetch and store WeatherAPI hourly forecasts."""
+
+from weather.services.hourly_weather_service import HourlyWeatherService
+
+
+class ForecastWeatherService(HourlyWeatherService):
+    """Service for storing hourly forecast weather.
+
+    Forecast hours are stored flagged as forecasts and refreshed by every new
+    forecast, except where the hour is already observed; a later current or
+    history reading for the hour replaces the forecast values.
+    """
+
+    FORECAST = True
+
+    def get_forecast(self, city: str, days: int = 3):
+        """Store the hourly forecast of the next `days` days, or return an error dict."""
+        params = {"q": city, "days": days, "aqi": "no", "alerts": "no"}
+        data = self.api_client.fetch_data("forecast", params)
+
+        if "forecast" not in data or "location" not in data:
+            self.logger.error(f"Missing 'forecast' or 'location' in API response for city: {city}")
+            return {"error": "Failed to fetch forecast weather"}
+
+        return self._store_hours(data)
@@ -0,0 +1,27 @@
+"""Fetch and store WeatherAPI hourly history."""
+
+from datetime import date
+
+from weather.services.hourly_weather_service import HourlyWeatherService
+
+
+class HistoryWeatherService(HourlyWeatherService):
+    """Service for storing hourly historical weather."""
+
+    def get_history(self, city: str, day: date, end_day: date | None = None):
+        """
+        Store the hourly history of `day`, or of `day`..`end_day` when given.
+
+        A date range is fetched in one call (WeatherAPI's `end_dt`, up to 30 days
+        on paid plans), which is the fastest way to backfill.
+        """
+        params = {"q": city, "dt": day.isoformat()}
+        if end_day and end_day != day:
+            params["end_dt"] = end_day.isoformat()
+        data = self.api_client.fetch_data("history", params)
+
+        if "forecast" not in data or "location" not in data:
+            self.logger.error(f"Missing 'forecast' or 'location' in history response for city: {city}")
+            return {"error": "Failed to fetch historical weather"}
+
+        return self._store_hours(data)
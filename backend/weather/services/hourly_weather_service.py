@@ -0,0 +1,67 @@
+"""Shared ingestion of the hourly arrays returned by forecast.json and history.json."""
+
+from collections.abc import Iterator
+from datetime import datetime
+from itertools import islice
+
+from django.conf import settings
+from weather.models import WeatherData, normalize_city
+from weather.services.base_weather_service import BaseWeatherService
+from weather.services.weather_factory import WeatherModelFactory
+
+
+class HourlyWeatherService(BaseWeatherService):
+    """
+    Base for services that store hourly records.
+
+    Hours already observed for the city are looked up with a single range
+    query per response and skipped; the remaining hours are bulk-upserted in
+    chunks, so stored forecast hours are refreshed or replaced by history.
+    """
+
+    # Whether the stored hours are forecasts rather than observations
+    FORECAST = False
+
+    def _store_hours(self, data: dict) -> list[WeatherData]:
+        location = data.get("location", {})
+        city = location.get("name", "Unknown")
+
+        hours = list(self._iter_hours(data))
+        if not hours:
+            return []
+
+        observed = [self._hour_of(WeatherModelFactory.observed_at(record)) for record in hours]
+        existing = self._existing_hours(city, min(observed), max(observed))
+        city_key = normalize_city(city)
+
+        new_readings = (
+            (city, {**location, **record})
+            for record, hour in zip(hours, observed)
+            if hour not in existing and self._is_valid_hour(city_key, record)
+        )
+
+        saved = []
+        while chunk := list(islice(new_readings, settings.WEATHER_HOURLY_BATCH_SIZE)):
+            saved.extend(self._save_weather_batch(chunk))
+
+        self.logger.info(f"Stored {len(saved)} of {len(hours)} hours for {city} ({len(existing)} already observed)")
+        return saved
+
+    def _save_weather_batch(self, readings: list[tuple[str, dict]]) -> list[WeatherData]:
+        return WeatherModelFactory.bulk_create_weather(readings, forecast=self.FORECAST)
+
+    def _iter_hours(self, data: dict) -> Iterator[dict]:
+        """Yield the hourly records of every forecast day in the response."""
+        for day in data.get("forecast", {}).get("forecastday", []):
+            yield from day.get("hour", [])
+
+    def _is_valid_hour(self, city_key: str, record: dict) -> bool:
+        field = self._missing_critical_field(record)
+        if field:
+            self.logger.warning(f"Skipping hour {record.get('time')} for {city_key}: missing '{field}'")
+            return False
+        return True
+
+    @staticmethod
+    def _hour_of(value: datetime) -> datetime:
+        return value.replace(minute=0, second=0, microsecond=0)
@@ -0,0 +1,92 @@
+"""Concurrent multi-city ingestion of current weather."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from weather.services.current_weather_service import CurrentWeatherService
+from weather.services.exceptions import WeatherAPIError
+
+
+@dataclass
+class IngestionRound:
+    """Outcome and timing of one polling round over a list of cities."""
+
+    cities: list[str]
+    payloads: dict[str, dict] = field(default_factory=dict)
+    failed: dict[str, str] = field(default_factory=dict)
+    saved: list = field(default_factory=list)
+    fetch_seconds: float = 0.0
+    persist_seconds: float = 0.0
+
+    @property
+    def total_seconds(self) -> float:
+        """Time spent fetching plus time spent persisting."""
+        return self.fetch_seconds + self.persist_seconds
+
+    def as_dict(self) -> dict:
+        """JSON-serializable summary, suitable for logs and task results."""
+        return {
+            "cities": len(self.cities),
+            "fetched": len(self.payloads),
+            "saved": len(self.saved),
+            "failed": self.failed,
+            "fetch_seconds": round(self.fetch_seconds, 3),
+            "persist_seconds": round(self.persist_seconds, 3),
+            "total_seconds": round(self.total_seconds, 3),
+        }
+
+
+class MultiCityIngestionService(CurrentWeatherService):
+    """Fetch current weather for many cities concurrently and persist the round at once."""
+
+    def __init__(self, max_workers: int | None = None):
+        super().__init__()
+        self.max_workers = max_workers or settings.WEATHER_FETCH_WORKERS
+
+    def poll(self, cities: list[str]) -> IngestionRound:
+        """Run a full round: concurrent fetch, then a single persistence step."""
+        ingestion_round = self.fetch_all(cities)
+        self.persist(ingestion_round)
+        self.logger.info(f"Weather polling round finished: {ingestion_round.as_dict()}")
+        return ingestion_round
+
+    def fetch_all(self, cities: list[str]) -> IngestionRound:
+        """Fetch and validate payloads for all cities using a bounded thread pool."""
+        ingestion_round = IngestionRound(cities=list(cities))
+        if not cities:
+            return ingestion_round
+
+        started = time.perf_counter()
+        workers = max(1, min(self.max_workers, len(cities)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="weather-fetch") as pool:
+            results = pool.map(self._fetch_one, cities)
+            for city, data, error in results:
+                if error:
+                    ingestion_round.failed[city] = error
+                else:
+                    ingestion_round.payloads[city] = data
+        ingestion_round.fetch_seconds = time.perf_counter() - started
+        return ingestion_round
+
+    def persist(self, ingestion_round: IngestionRound) -> None:
+        """Write every fetched payload of the round with one bulk INSERT per table."""
+        started = time.perf_counter()
+        readings = [
+            (data["location"].get("name", "Unknown"), {**data["location"], **data["current"]})
+            for data in ingestion_round.payloads.values()
+        ]
+        ingestion_round.saved = self._save_weather_batch(readings)
+        ingestion_round.persist_seconds = time.perf_counter() - started
+
+    def _fetch_one(self, city: str) -> tuple[str, dict | None, str | None]:
+        try:
+            data = self.fetch_current(city)
+        except WeatherAPIError as e:
+            return city, None, str(e)
+
+        error = self.validate_current(city, data)
+        if error:
+            return city, None, error
+        return city, data, None
@@ -0,0 +1,89 @@
+"""Per-city record of the newest persisted upstream observation."""
+
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.cache import caches
+from weather.models import LatestWeather, normalize_city
+
+
+class ObservationLedger:
+    """
+    Tell new current observations from ones that are already stored.
+
+    WeatherAPI refreshes a city's `current` block about every 15 minutes, so
+    polling more often returns the same observation (same
+    `last_updated_epoch`) again. The newest persisted observation time of each
+    city is kept in the WeatherAPI cache (Redis when configured, so all
+    workers share it); on a miss it is read from LatestWeather, which holds
+    the newest stored reading of every city.
+    """
+
+    PREFIX = "weather:observed"
+    TIMEOUT = 24 * 60 * 60
+
+    def __init__(self):
+        self.cache = caches[settings.WEATHER_API_CACHE_ALIAS]
+
+    @staticmethod
+    def is_current(data: dict) -> bool:
+        """Whether a record is a current observation rather than an hourly history/forecast record."""
+        return data.get("time_epoch") is None and data.get("last_updated_epoch") is not None
+
+    def filter_new(self, readings: list[tuple[str, dict]]) -> tuple[list[tuple[str, dict]], int]:
+        """
+        Drop current observations that are not newer than the city's stored one.
+
+        Hourly records and records without `last_updated_epoch` are always kept.
+
+        Args:
+            readings (list[tuple[str, dict]]): (city, data) pairs as passed to bulk_create_weather.
+
+        Returns:
+            tuple[list[tuple[str, dict]], int]: The readings to write and the number skipped.
+        """
+        city_keys = {normalize_city(city) for city, data in readings if self.is_current(data)}
+        if not city_keys:
+            return readings, 0
+
+        known = self.known(city_keys)
+        new = [
+            (city, data) for city, data in readings
+            if not self.is_current(data) or data["last_updated_epoch"] > known.get(normalize_city(city), -1)
+        ]
+        return new, len(readings) - len(new)
+
+    def known(self, city_keys) -> dict[str, int]:
+        """Return the newest stored observation epoch of each city that has one."""
+        keys = {self._key(city_key): city_key for city_key in city_keys}
+        known = {keys[key]: epoch for key, epoch in self.cache.get_many(keys).items()}
+
+        missing = set(city_keys) - set(known)
+        if missing:
+            stored = {
+                city_key: int(timestamp.timestamp())
+                for city_key, timestamp in LatestWeather.objects
+                .filter(city_key__in=missing)
+                .values_list("city_key", "timestamp")
+            }
+            if stored:
+                self.cache.set_many({self._key(key): epoch for key, epoch in stored.items()}, self.TIMEOUT)
+            known.update(stored)
+        return known
+
+    def remember(self, weathers) -> None:
+        """Record the observation times of freshly persisted current observations."""
+        epochs = {}
+        for weather in weathers:
+            key = self._key(weather.city_key)
+            epochs[key] = max(int(weather.timestamp.timestamp()), epochs.get(key, 0))
+        if epochs:
+            self.cache.set_many(epochs, self.TIMEOUT)
+
+    def forget(self, city_keys) -> None:
+        """Drop the cached observation times of the given cities."""
+        self.cache.delete_many([self._key(city_key) for city_key in city_keys])
+
+    def _key(self, city_key: str) -> str:
+        # City keys may contain spaces, which some cache backends reject
+        return f"{self.PREFIX}:{quote(city_key, safe='')}"
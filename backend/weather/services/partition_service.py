@@ -0,0 +1,146 @@
+"""Monthly partitions of the WeatherData table on PostgreSQL."""
+
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from datetime import timezone as dt_timezone
+
+from django.db import connection, transaction
+from django.utils import timezone
+from weather.models import WeatherData
+from weather.services.response_cache import WeatherResponseCache
+
+logger = logging.getLogger(__name__)
+
+
+def month_start(day: date) -> date:
+    """First day of the month containing `day`."""
+    return day.replace(day=1)
+
+
+def add_months(day: date, months: int) -> date:
+    """First day of the month `months` after the month containing `day`."""
+    month = day.month - 1 + months
+    return date(day.year + month // 12, month % 12 + 1, 1)
+
+
+@dataclass(frozen=True)
+class Partition:
+    """A monthly partition holding rows with start <= hour < end."""
+
+    name: str
+    start: date
+
+    @property
+    def end(self) -> date:
+        """First day of the following month (exclusive bound)."""
+        return add_months(self.start, 1)
+
+    @property
+    def start_at(self) -> datetime:
+        """`start` as midnight UTC."""
+        return datetime.combine(self.start, datetime.min.time(), tzinfo=dt_timezone.utc)
+
+    @property
+    def end_at(self) -> datetime:
+        """`end` as midnight UTC."""
+        return datetime.combine(self.end, datetime.min.time(), tzinfo=dt_timezone.utc)
+
+
+class WeatherPartitionManager:
+    """
+    Create and drop the monthly partitions of WeatherData.
+
+    Migration 0007 turns the table into one range-partitioned by `hour` with a
+    `<table>_pYYYY_MM` partition per month and a `<table>_default` partition
+    for rows outside them. Creating a month whose rows already sit in the
+    default partition moves them into the new partition first, so ranges can
+    be added at any time. On other databases every method is a no-op.
+    """
+
+    TABLE = WeatherData._meta.db_table
+    DEFAULT = f"{TABLE}_default"
+    NAME_PATTERN = re.compile(rf"^{TABLE}_p(\d{{4}})_(\d{{2}})$")
+
+    def is_partitioned(self) -> bool:
+        """Whether the WeatherData table is a partitioned PostgreSQL table."""
+        if connection.vendor != "postgresql":
+            return False
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass", [self.TABLE])
+            return cursor.fetchone() is not None
+
+    def partitions(self) -> list[Partition]:
+        """The monthly partitions, oldest first."""
+        if not self.is_partitioned():
+            return []
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = %s::regclass",
+                [self.TABLE],
+            )
+            names = [row[0] for row in cursor.fetchall()]
+
+        partitions = []
+        for name in names:
+            match = self.NAME_PATTERN.match(name)
+            if match:
+                partitions.append(Partition(name, date(int(match[1]), int(match[2]), 1)))
+        return sorted(partitions, key=lambda partition: partition.start)
+
+    def ensure_partitions(self, start: date, end: date) -> list[str]:
+        """
+        Create the missing monthly partitions for every month from start to end.
+
+        Returns:
+            list[str]: Names of the partitions created.
+        """
+        if not self.is_partitioned():
+            return []
+
+        existing = {partition.start for partition in self.partitions()}
+        created = []
+        month = month_start(start)
+        while month <= end:
+            if month not in existing:
+                created.append(self._create(Partition(self._name(month), month)))
+            month = add_months(month, 1)
+        return created
+
+    def ensure_future(self, months_ahead: int, today: date | None = None) -> list[str]:
+        """Create partitions from the current month to `months_ahead` months ahead."""
+        today = today or timezone.now().date()
+        return self.ensure_partitions(today, add_months(today, months_ahead))
+
+    def drop(self, partition: Partition) -> None:
+        """Detach and drop a monthly partition together with its rows; cached responses are invalidated."""
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f'ALTER TABLE {self.TABLE} DETACH PARTITION "{partition.name}"')
+            cursor.execute(f'DROP TABLE "{partition.name}"')
+            transaction.on_commit(WeatherResponseCache().invalidate_all)
+        logger.info(f"Dropped partition {partition.name}")
+
+    def _name(self, month: date) -> str:
+        return f"{self.TABLE}_p{month:%Y_%m}"
+
+    def _create(self, partition: Partition) -> str:
+        """Create a partition, moving rows of its range out of the default partition."""
+        bounds = [partition.start_at, partition.end_at]
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE TABLE "{partition.name}" '
+                f"(LIKE {self.TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+            cursor.execute(
+                f'WITH moved AS (DELETE FROM "{self.DEFAULT}" WHERE hour >= %s AND hour < %s RETURNING *) '
+                f'INSERT INTO "{partition.name}" SELECT * FROM moved',
+                bounds,
+            )
+            cursor.execute(
+                f'ALTER TABLE {self.TABLE} ATTACH PARTITION "{partition.name}" FOR VALUES FROM (%s) TO (%s)',
+                bounds,
+            )
+        logger.info(f"Created partition {partition.name}")
+        return partition.name
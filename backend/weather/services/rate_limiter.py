@@ -0,0 +1,235 @@
+"""Client-side rate limiting and quota accounting for WeatherAPI calls."""
+
+import abc
+import logging
+import math
+import threading
+import time
+from datetime import datetime
+from datetime import timezone as dt_timezone
+
+import redis
+from django.conf import settings
+from django.core.cache import caches
+from weather.services.exceptions import RateLimitExceeded
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket(abc.ABC):
+    """Token bucket refilled at `rate` tokens per second up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: int, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity
+        self.sleep = sleep
+
+    def acquire(self, tokens: int = 1, wait: bool = True, timeout: float | None = None) -> None:
+        """
+        Take `tokens` from the bucket.
+
+        Args:
+            tokens (int): Number of tokens to take.
+            wait (bool): Sleep until tokens are available instead of failing fast.
+            timeout (float | None): Maximum seconds to wait; None waits indefinitely.
+
+        Raises:
+            RateLimitExceeded: If tokens are unavailable and waiting is not allowed.
+        """
+        waited = 0.0
+        while True:
+            delay = self.try_acquire(tokens)
+            if delay <= 0:
+                return
+            if not wait or (timeout is not None and waited + delay > timeout):
+                raise RateLimitExceeded(f"Rate limit exceeded, retry in {delay:.2f}s")
+            self.sleep(delay)
+            waited += delay
+
+    @abc.abstractmethod
+    def try_acquire(self, tokens: int = 1) -> float:
+        """Take tokens if available and return 0, otherwise return seconds until they are."""
+
+
+class LocalTokenBucket(TokenBucket):
+    """In-process token bucket, used when Redis is not configured or unavailable."""
+
+    def __init__(self, rate: float, capacity: int, sleep=time.sleep, clock=time.monotonic):
+        super().__init__(rate, capacity, sleep)
+        self.clock = clock
+        self.tokens = float(capacity)
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    def try_acquire(self, tokens: int = 1) -> float:
+        with self._lock:
+            now = self.clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return 0.0
+            return (tokens - self.tokens) / self.rate
+
+
+class RedisTokenBucket(TokenBucket):
+    """Token bucket shared by all workers through one Redis key, updated atomically in Lua."""
+
+    SCRIPT = """
+    local rate = tonumber(ARGV[1])
+    local capacity = tonumber(ARGV[2])
+    local requested = tonumber(ARGV[3])
+    local clock = redis.call('TIME')
+    local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+    local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+    local delay = 0
+    if tokens >= requested then
+        tokens = tokens - requested
+    else
+        delay = (requested - tokens) / rate
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+    return tostring(delay)
+    """
+
+    def __init__(self, client, key: str, rate: float, capacity: int, *, sleep=time.sleep):
+        super().__init__(rate, capacity, sleep)
+        self.key = key
+        self.script = client.register_script(self.SCRIPT)
+        self.fallback = LocalTokenBucket(rate, capacity, sleep)
+
+    def try_acquire(self, tokens: int = 1) -> float:
+        try:
+            return float(self.script(keys=[self.key], args=[self.rate, self.capacity, tokens]))
+        except redis.RedisError as e:
+            logger.warning(f"Redis rate limiter unavailable, using in-process bucket: {e}")
+            return self.fallback.try_acquire(tokens)
+
+
+def build_rate_limiter() -> TokenBucket | None:
+    """Build the WeatherAPI rate limiter from settings; None when limiting is disabled."""
+    per_minute = settings.WEATHER_API_RATE_LIMIT_PER_MINUTE
+    if per_minute <= 0:
+        return None
+
+    rate = per_minute / 60
+    capacity = settings.WEATHER_API_RATE_LIMIT_BURST or max(1, math.ceil(rate))
+    if settings.WEATHER_API_RATE_LIMIT_REDIS_URL:
+        client = redis.Redis.from_url(settings.WEATHER_API_RATE_LIMIT_REDIS_URL)
+        return RedisTokenBucket(client, "weatherapi:rate_limit", rate, capacity)
+    return LocalTokenBucket(rate, capacity)
+
+
+class QuotaBudget:
+    """
+    Monthly WeatherAPI quota accountant.
+
+    Usage is counted in the Django cache (shared through Redis in production).
+    The remaining quota is spread evenly over the polling intervals left in the
+    month, and a round's polls are spread evenly over the interval.
+    """
+
+    # Usage counters outlive their month by a few days
+    TIMEOUT = 32 * 24 * 3600
+
+    def __init__(self, monthly_quota: int, alias: str = "default", now=None):
+        self.monthly_quota = monthly_quota
+        self.cache = caches[alias]
+        self.now = now or (lambda: datetime.now(dt_timezone.utc))
+
+    def used(self) -> int:
+        """Calls counted against this month's quota so far."""
+        return self.cache.get(self._month_key(), 0)
+
+    def remaining(self) -> int | float:
+        """Calls left this month; infinite when no quota is configured."""
+        if self.monthly_quota <= 0:
+            return math.inf
+        return max(0, self.monthly_quota - self.used())
+
+    def consume(self, calls: int = 1) -> int:
+        """Record `calls` upstream calls against this month's quota and return the month's usage."""
+        key = self._month_key()
+        if self.cache.add(key, calls, timeout=self.TIMEOUT):
+            return calls
+        return self.cache.incr(key, calls)
+
+    def reserve(self, calls: int = 1) -> None:
+        """
+        Count `calls` against the quota, refusing them if that would exceed it.
+
+        The usage is incremented first and the new total compared, so
+        concurrent workers can never reserve the same last calls twice.
+
+        Raises:
+            RateLimitExceeded: If the monthly quota has no room for the calls.
+        """
+        used = self.consume(calls)
+        if 0 < self.monthly_quota < used:
+            self.release(calls)
+            raise RateLimitExceeded("Monthly WeatherAPI quota exhausted")
+
+    def release(self, calls: int = 1) -> None:
+        """Give back reserved calls that were not made."""
+        try:
+            self.cache.decr(self._month_key(), calls)
+        except ValueError:
+            # The month's counter expired or rolled over; nothing to give back
+            pass
+
+    def check(self, calls: int = 1) -> None:
+        """Raise RateLimitExceeded if `calls` more calls would exceed the monthly quota."""
+        if self.remaining() < calls:
+            raise RateLimitExceeded("Monthly WeatherAPI quota exhausted")
+
+    def allowance(self, interval_seconds: int) -> int | float:
+        """Number of calls affordable in one interval so the quota lasts until month end."""
+        remaining = self.remaining()
+        if remaining == math.inf:
+            return remaining
+        intervals_left = max(1, math.ceil(self._seconds_to_month_end() / interval_seconds))
+        return remaining // intervals_left
+
+    def plan(self, cities: list[str], interval_seconds: int, batch_size: int) -> list[tuple[float, list[str]]]:
+        """
+        Spread a city list's polls evenly over an interval within the quota allowance.
+
+        When the allowance is smaller than the list, a rotating window of cities
+        is polled so every city is still visited over successive intervals.
+
+        Returns:
+            list[tuple[float, list[str]]]: (delay in seconds, batch of cities) pairs.
+        """
+        allowance = min(len(cities), self.allowance(interval_seconds))
+        if allowance <= 0:
+            logger.warning("WeatherAPI quota allowance exhausted for this interval")
+            return []
+
+        if allowance < len(cities):
+            start = self._next_rotation(len(cities), allowance)
+            cities = [cities[(start + i) % len(cities)] for i in range(allowance)]
+
+        batches = [cities[i:i + batch_size] for i in range(0, len(cities), batch_size)]
+        step = interval_seconds / len(batches)
+        return [(round(i * step, 3), batch) for i, batch in enumerate(batches)]
+
+    def _next_rotation(self, total: int, taken: int) -> int:
+        key = "weatherapi:quota:rotation"
+        start = self.cache.get(key, 0) % total
+        self.cache.set(key, (start + taken) % total, timeout=None)
+        return start
+
+    def _month_key(self) -> str:
+        return f"weatherapi:quota:{self.now():%Y-%m}"
+
+    def _seconds_to_month_end(self) -> float:
+        now = self.now()
+        if now.month == 12:
+            month_end = now.replace(year=now.year + 1, month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
+        else:
+            month_end = now.replace(month=now.month + 1, day=1, hour=0, minute=0, second=0, microsecond=0)
+        return (month_end - now).total_seconds()
@@ -0,0 +1,117 @@
+"""Cache for weather API read responses, invalidated per city on ingest and wholesale on retention."""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from weather.metrics import RESPONSE_CACHE_LOOKUPS
+
+ALL_CITIES = "*"
+GENERATION = "generation"
+
+
+class WeatherResponseCache:
+    """
+    Versioned response cache keyed by city, path and query string.
+
+    Every city has a version counter that is bumped whenever a reading for it
+    is persisted; the version is part of each response key and ETag, so a
+    write makes all cached responses for that city (and the unfiltered list)
+    unreachable without scanning or deleting keys. A global generation counter
+    is part of every version too, so removing rows of many cities at once
+    (retention) can drop every cached response with a single increment.
+    """
+
+    PREFIX = "weather"
+
+    def __init__(self):
+        self.cache = caches[settings.WEATHER_CACHE_ALIAS]
+        self.timeout = settings.WEATHER_CACHE_TIMEOUT
+
+    def version(self, city_key: str) -> str:
+        """Return the current version of a city's responses."""
+        return f"{self._counter(GENERATION)}.{self._counter(city_key)}"
+
+    def invalidate(self, city_keys) -> None:
+        """Bump the versions of the given cities and of the unfiltered list."""
+        for city_key in {*city_keys, ALL_CITIES}:
+            self._bump(city_key)
+
+    def invalidate_all(self) -> None:
+        """Make every cached response unreachable, e.g. after old readings were removed."""
+        self._bump(GENERATION)
+
+    def lookup(self, request, city_key: str | None, vary=None) -> tuple[str, str]:
+        """
+        Return the (cache key, ETag) of a request's response.
+
+        `vary` is anything else the response depends on besides the query
+        string, such as the default end of a time range.
+        """
+        city_key = city_key or ALL_CITIES
+        return self._key_and_etag(request, city_key, self.version(city_key), vary)
+
+    async def aversion(self, city_key: str) -> str:
+        """Async twin of version()."""
+        return f"{await self._acounter(GENERATION)}.{await self._acounter(city_key)}"
+
+    async def alookup(self, request, city_key: str | None, vary=None) -> tuple[str, str]:
+        """Async twin of lookup()."""
+        city_key = city_key or ALL_CITIES
+        return self._key_and_etag(request, city_key, await self.aversion(city_key), vary)
+
+    def get(self, key: str):
+        """Return the cached response data under `key`, or None, counting the hit or miss."""
+        return self._count(self.cache.get(key))
+
+    def set(self, key: str, data) -> None:
+        """Cache response data for WEATHER_CACHE_TIMEOUT seconds."""
+        self.cache.set(key, data, timeout=self.timeout)
+
+    async def aget(self, key: str):
+        """Async twin of get()."""
+        return self._count(await self.cache.aget(key))
+
+    async def aset(self, key: str, data) -> None:
+        """Async twin of set()."""
+        await self.cache.aset(key, data, timeout=self.timeout)
+
+    def _counter(self, name: str) -> int:
+        key = self._version_key(name)
+        version = self.cache.get(key)
+        if version is None:
+            self.cache.add(key, 1, timeout=None)
+            version = self.cache.get(key, 1)
+        return version
+
+    async def _acounter(self, name: str) -> int:
+        key = self._version_key(name)
+        version = await self.cache.aget(key)
+        if version is None:
+            await self.cache.aadd(key, 1, timeout=None)
+            version = await self.cache.aget(key, 1)
+        return version
+
+    def _bump(self, name: str) -> None:
+        key = self._version_key(name)
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            # Nothing cached under this counter yet
+            self.cache.add(key, 2, timeout=None)
+
+    def _key_and_etag(self, request, city_key: str, version: str, vary=None) -> tuple[str, str]:
+        query = sorted(request.query_params.lists())
+        fingerprint = hashlib.sha1(
+            repr((request.get_host(), request.path, query, vary)).encode(), usedforsecurity=False
+        ).hexdigest()
+        key = f"{self.PREFIX}:response:{city_key}:{version}:{fingerprint}"
+        return key, f'"{fingerprint[:16]}-{version}"'
+
+    @staticmethod
+    def _count(data):
+        RESPONSE_CACHE_LOOKUPS.labels("miss" if data is None else "hit").inc()
+        return data
+
+    def _version_key(self, city_key: str) -> str:
+        return f"{self.PREFIX}:version:{city_key}"
@@ -0,0 +1,148 @@
+"""Retention of raw weather readings with rollup into daily summaries."""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from datetime import timezone as dt_timezone
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Avg, Count, Max, Min, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from weather.models import WeatherDailySummary, WeatherData
+from weather.services.partition_service import WeatherPartitionManager, add_months, month_start
+from weather.services.response_cache import WeatherResponseCache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RetentionStats:
+    """What one retention run summarized and removed."""
+
+    cutoff: date | None = None
+    summarized_days: int = 0
+    dropped_partitions: list[str] = field(default_factory=list)
+    deleted_rows: int = 0
+
+    def as_dict(self) -> dict:
+        """JSON-serializable form, for logs and task results."""
+        return {
+            "cutoff": self.cutoff.isoformat() if self.cutoff else None,
+            "summarized_days": self.summarized_days,
+            "dropped_partitions": self.dropped_partitions,
+            "deleted_rows": self.deleted_rows,
+        }
+
+
+class WeatherRetentionService:
+    """
+    Roll expired raw readings into WeatherDailySummary and remove them.
+
+    Raw readings are already one row per city and hour, so they are the hourly
+    tier; daily summaries are kept for good. Expiry works on whole months: a
+    month is removed once all of it is older than `retain_days`. On a
+    partitioned table the month's partition is rolled up and then dropped,
+    which costs the same regardless of its size; rows in the default partition
+    or on an unpartitioned table are deleted one month per statement.
+    """
+
+    SUMMARY_FIELDS = [
+        "city", "country", "samples",
+        "temperature_min", "temperature_mean", "temperature_max",
+        "humidity_mean", "pressure_mean", "precipitation_sum",
+        "wind_speed_mean", "wind_speed_max", "wind_gust_max",
+    ]
+
+    def __init__(self, retain_days: int | None = None):
+        """
+        Args:
+            retain_days (int | None): Keep raw readings for at least this many
+                days. Defaults to settings.WEATHER_RAW_RETENTION_DAYS; 0 keeps them forever.
+        """
+        if retain_days is None:
+            retain_days = settings.WEATHER_RAW_RETENTION_DAYS
+        self.retain_days = retain_days
+        self.partitions = WeatherPartitionManager()
+
+    def cutoff(self, today: date | None = None) -> date | None:
+        """First day of the oldest month that is kept, or None when retention is off."""
+        if self.retain_days <= 0:
+            return None
+        today = today or timezone.now().date()
+        return month_start(today - timedelta(days=self.retain_days))
+
+    def apply(self, today: date | None = None) -> RetentionStats:
+        """Summarize and remove every month of raw readings before the cutoff."""
+        stats = RetentionStats(cutoff=self.cutoff(today))
+        if stats.cutoff is None:
+            return stats
+
+        for partition in self.partitions.partitions():
+            if partition.end > stats.cutoff:
+                break
+            with transaction.atomic():
+                stats.summarized_days += self.rollup(partition.start_at, partition.end_at)
+                self.partitions.drop(partition)
+            stats.dropped_partitions.append(partition.name)
+
+        cutoff_at = self._at(stats.cutoff)
+        oldest = WeatherData.objects.filter(hour__lt=cutoff_at).aggregate(oldest=Min("hour"))["oldest"]
+        month = month_start(oldest.date()) if oldest else stats.cutoff
+        while month < stats.cutoff:
+            following = add_months(month, 1)
+            start, end = self._at(month), self._at(following)
+            with transaction.atomic():
+                stats.summarized_days += self.rollup(start, end)
+                deleted, _ = WeatherData.objects.filter(hour__gte=start, hour__lt=end).delete()
+            stats.deleted_rows += deleted
+            month = following
+
+        if stats.deleted_rows:
+            # Cached responses may still list the deleted rows; dropped partitions invalidate in drop()
+            WeatherResponseCache().invalidate_all()
+        logger.info(f"Weather retention: {stats.as_dict()}")
+        return stats
+
+    def rollup(self, start: datetime, end: datetime) -> int:
+        """
+        Upsert daily summaries for the readings with start <= hour < end.
+
+        Returns:
+            int: Number of (city, day) summaries written.
+        """
+        rows = (
+            WeatherData.objects.observations()
+            .filter(hour__gte=start, hour__lt=end)
+            .annotate(day=TruncDate("hour", tzinfo=dt_timezone.utc))
+            .values("city_key", "day")
+            .annotate(
+                city=Max("city"),
+                country=Max("country"),
+                samples=Count("id"),
+                temperature_min=Min("temperature"),
+                temperature_mean=Avg("temperature"),
+                temperature_max=Max("temperature"),
+                humidity_mean=Avg("humidity"),
+                pressure_mean=Avg("pressure"),
+                precipitation_sum=Sum("precipitation"),
+                wind_speed_mean=Avg("wind_speed"),
+                wind_speed_max=Max("wind_speed"),
+                wind_gust_max=Max("wind_gust"),
+            )
+            .order_by()
+        )
+        summaries = [WeatherDailySummary(**row) for row in rows]
+        WeatherDailySummary.objects.bulk_create(
+            summaries,
+            batch_size=settings.WEATHER_HOURLY_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["city_key", "day"],
+            update_fields=self.SUMMARY_FIELDS,
+        )
+        return len(summaries)
+
+    @staticmethod
+    def _at(day: date) -> datetime:
+        return datetime.combine(day, datetime.min.time(), tzinfo=dt_timezone.utc)
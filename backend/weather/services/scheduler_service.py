@@ -0,0 +1,175 @@
+"""Adaptive per-city poll scheduling with consistent-hash sharding."""
+
+import bisect
+import hashlib
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from weather.models import TrackedCity, normalize_city
+from weather.services.rate_limiter import QuotaBudget
+from weather.services.weather_factory import WeatherModelFactory
+
+# Shortest gap between two observations used to measure a rate of change, in hours;
+# keeps a small change over a few minutes from reading as a violent swing
+MIN_OBSERVATION_GAP_HOURS = 0.25
+
+
+class HashRing:
+    """
+    Consistent-hash ring assigning keys to shards.
+
+    Every shard owns `replicas` pseudo-random points on the ring and a key
+    belongs to the first point at or after its own hash. Adding a shard only
+    moves the keys that land on its new points (about 1/n of them), spread
+    evenly over the existing shards.
+    """
+
+    REPLICAS = 128
+
+    def __init__(self, shards, replicas: int = REPLICAS):
+        self.shards = list(shards)
+        points = sorted((self._hash(f"{shard}#{i}"), shard) for shard in self.shards for i in range(replicas))
+        self._hashes = [point for point, _ in points]
+        self._owners = [shard for _, shard in points]
+
+    @staticmethod
+    def _hash(value: str) -> int:
+        return int.from_bytes(hashlib.md5(value.encode(), usedforsecurity=False).digest()[:8], "big")
+
+    def shard_for(self, key: str) -> str | None:
+        """Return the shard owning `key`, or None when the ring is empty."""
+        if not self._hashes:
+            return None
+        index = bisect.bisect(self._hashes, self._hash(key)) % len(self._hashes)
+        return self._owners[index]
+
+
+class AdaptivePollScheduler:
+    """
+    Decide when each TrackedCity is polled and which worker shard polls it.
+
+    dispatch() claims the cities that are due, pushing their next poll one
+    interval out so overlapping dispatches never send a city twice, and groups
+    them by shard. record() adapts each polled city's interval to how fast
+    pressure and temperature moved since its previous observation: halved
+    during fast swings, grown by half while stable, and left alone while the
+    API still serves the observation it already had.
+    """
+
+    def __init__(self, shards: list[str] | None = None):
+        self.ring = HashRing(settings.WEATHER_POLL_SHARDS if shards is None else shards)
+        self.min_interval = settings.WEATHER_POLL_MIN_INTERVAL_SECONDS
+        self.max_interval = settings.WEATHER_POLL_MAX_INTERVAL_SECONDS
+
+    def track(self, cities: list[str], now: datetime | None = None) -> int:
+        """Start tracking cities (due at once); already tracked ones are re-enabled. Returns the count."""
+        now = now or timezone.now()
+        interval = self._clamp(settings.WEATHER_POLL_INTERVAL_SECONDS)
+        tracked = {normalize_city(city): city.strip() for city in cities if city.strip()}
+        TrackedCity.objects.bulk_create(
+            [
+                TrackedCity(city_key=city_key, name=name, poll_interval=interval, next_poll_at=now)
+                for city_key, name in tracked.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["city_key"],
+            update_fields=["name", "enabled"],
+        )
+        return len(tracked)
+
+    def dispatch(self, now: datetime | None = None) -> dict[str | None, list[str]]:
+        """
+        Claim the due cities and return their names grouped by shard.
+
+        The most overdue cities go first, and no more are claimed than the
+        monthly quota affords per dispatch period. The rest stay due for the
+        next dispatch.
+        """
+        now = now or timezone.now()
+        budget = QuotaBudget(settings.WEATHER_API_MONTHLY_QUOTA, settings.WEATHER_API_CACHE_ALIAS)
+        allowance = budget.allowance(settings.WEATHER_POLL_DISPATCH_SECONDS)
+
+        with transaction.atomic():
+            due = (
+                TrackedCity.objects.select_for_update(skip_locked=True)
+                .filter(enabled=True, next_poll_at__lte=now)
+                .order_by("next_poll_at")
+            )
+            if allowance != float("inf"):
+                due = due[:max(0, int(allowance))]
+            claimed = list(due)
+            for city in claimed:
+                city.next_poll_at = now + timedelta(seconds=city.poll_interval)
+            TrackedCity.objects.bulk_update(claimed, ["next_poll_at"])
+
+        plan = {}
+        for city in claimed:
+            plan.setdefault(self.ring.shard_for(city.city_key), []).append(city.name)
+        return plan
+
+    def record(self, payloads: dict[str, dict], now: datetime | None = None) -> dict[str, int]:
+        """
+        Adapt the intervals of tracked cities to freshly fetched payloads.
+
+        Args:
+            payloads (dict[str, dict]): Requested city name -> current.json payload.
+
+        Returns:
+            dict[str, int]: The new poll interval of every tracked city updated.
+        """
+        now = now or timezone.now()
+        current = {normalize_city(city): data["current"] for city, data in payloads.items()}
+        tracked = list(TrackedCity.objects.filter(city_key__in=current))
+        for city in tracked:
+            observation = current[city.city_key]
+            observed_at = WeatherModelFactory.observed_at(observation)
+            city.last_polled_at = now
+            if city.last_observed_at is not None and observed_at <= city.last_observed_at:
+                # WeatherAPI refreshes current conditions only every ~15 minutes; an
+                # unchanged observation says nothing about the weather, so keep the interval
+                city.next_poll_at = now + timedelta(seconds=city.poll_interval)
+                continue
+            city.poll_interval = self.next_interval(city.poll_interval, self.swing(city, observation, observed_at))
+            city.next_poll_at = now + timedelta(seconds=city.poll_interval)
+            city.last_observed_at = observed_at
+            city.last_temperature = observation.get("temp_c")
+            city.last_pressure = observation.get("pressure_mb")
+        TrackedCity.objects.bulk_update(tracked, [
+            "poll_interval", "next_poll_at", "last_polled_at",
+            "last_observed_at", "last_temperature", "last_pressure",
+        ])
+        return {city.city_key: city.poll_interval for city in tracked}
+
+    @staticmethod
+    def swing(city: TrackedCity, observation: dict, observed_at: datetime) -> float:
+        """
+        Rate of change since the city's previous observation, relative to the swing settings.
+
+        1.0 means pressure or temperature is moving at its configured swing rate.
+        A first observation counts as stable.
+        """
+        if city.last_observed_at is None or observed_at <= city.last_observed_at:
+            return 0.0
+
+        hours = max((observed_at - city.last_observed_at).total_seconds() / 3600, MIN_OBSERVATION_GAP_HOURS)
+        rates = [0.0]
+        for value, previous, swing in (
+            (observation.get("pressure_mb"), city.last_pressure, settings.WEATHER_POLL_PRESSURE_SWING),
+            (observation.get("temp_c"), city.last_temperature, settings.WEATHER_POLL_TEMPERATURE_SWING),
+        ):
+            if value is not None and previous is not None and swing > 0:
+                rates.append(abs(value - previous) / hours / swing)
+        return max(rates)
+
+    def next_interval(self, interval: int, swing: float) -> int:
+        """Halve the interval during a swing, grow it by half while stable, within the bounds."""
+        if swing >= 1:
+            interval = interval / 2
+        elif swing < 0.5:
+            interval = interval * 1.5
+        return self._clamp(round(interval))
+
+    def _clamp(self, interval: int) -> int:
+        return max(self.min_interval, min(interval, self.max_interval))
@@ -0,0 +1,72 @@
+"""Load a city's readings into NumPy arrays for vectorized analysis."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+from weather.models import WeatherData, normalize_city
+from weather.services.aggregation_service import WeatherAggregationService
+
+
+@dataclass
+class WeatherSeries:
+    """
+    Column-oriented readings of one city, oldest first.
+
+    `times` holds epoch seconds; every column is a contiguous float64 array
+    of the same length, with NaN where the reading has no value.
+    """
+
+    times: np.ndarray
+    columns: dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def isoformat(self) -> list[str]:
+        """Timestamps as ISO 8601 UTC strings, the way the API renders datetimes."""
+        return np.datetime_as_string(self.times.astype("datetime64[s]"), unit="s", timezone="UTC").tolist()
+
+
+class WeatherSeriesLoader:
+    """
+    Read a city/time range in a single `values_list` pass.
+
+    No model instances are built: the query returns plain tuples, which are
+    transposed once and converted column by column into NumPy arrays.
+    """
+
+    # Every numeric reading column, the same ones the aggregate endpoint summarizes
+    FIELDS = WeatherAggregationService.METRICS
+
+    def load(self, city: str, start: datetime, end: datetime, fields=FIELDS) -> WeatherSeries:
+        """
+        Load a city's readings in [start, end).
+
+        Args:
+            city (str): City name (case-insensitive).
+            start (datetime): Inclusive range start.
+            end (datetime): Exclusive range end.
+            fields (tuple[str, ...]): Numeric WeatherData columns to load.
+
+        Returns:
+            WeatherSeries: The readings ordered by timestamp.
+        """
+        rows = list(
+            WeatherData.objects.observations()
+            .filter(city_key=normalize_city(city))
+            .between(start, end)
+            .order_by("timestamp")
+            .values_list("timestamp", *fields)
+        )
+        if not rows:
+            return WeatherSeries(np.empty(0), {field: np.empty(0) for field in fields})
+
+        timestamps, *values = zip(*rows)
+        times = np.fromiter((timestamp.timestamp() for timestamp in timestamps), dtype=np.float64, count=len(rows))
+        # float64 conversion turns None into NaN
+        columns = {field: np.array(column, dtype=np.float64) for field, column in zip(fields, values)}
+        return WeatherSeries(times, columns)
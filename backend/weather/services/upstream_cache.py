@@ -0,0 +1,92 @@
+"""TTL cache and request coalescing for WeatherAPI calls."""
+
+import hashlib
+import json
+import threading
+from concurrent.futures import Future
+
+from django.core.cache import caches
+from weather.metrics import UPSTREAM_CACHE_LOOKUPS
+
+
+class UpstreamCache:
+    """
+    Cache upstream responses per endpoint and normalized params.
+
+    Responses are stored in a Django cache (shared between workers when it is
+    Redis) for a per-endpoint TTL. Identical requests that arrive while one is
+    already in flight in this process wait for it instead of calling out again.
+    The API key is never part of the cache key.
+    """
+
+    EXCLUDED_PARAMS = ("key",)
+
+    def __init__(self, alias: str, ttls: dict[str, int]):
+        self.cache = caches[alias]
+        self.ttls = ttls
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, Future] = {}
+        self._stats = {"hits": 0, "misses": 0, "coalesced": 0}
+
+    def get_or_fetch(self, endpoint: str, params: dict, fetch) -> dict:
+        """Return a cached response, join an identical in-flight call, or call `fetch`."""
+        ttl = self.ttls.get(endpoint, 0)
+        if ttl <= 0:
+            return fetch()
+
+        key = self.key_for(endpoint, params)
+        data = self.cache.get(key)
+        if data is not None:
+            self._count(endpoint, "hits")
+            return data
+
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+
+        if not leader:
+            self._count(endpoint, "coalesced")
+            return future.result()
+
+        try:
+            # Another leader may have finished between our miss and taking the lead
+            data = self.cache.get(key)
+            if data is None:
+                self._count(endpoint, "misses")
+                data = fetch()
+                self.cache.set(key, data, timeout=ttl)
+            else:
+                self._count(endpoint, "hits")
+            future.set_result(data)
+            return data
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def key_for(self, endpoint: str, params: dict) -> str:
+        """Build the cache key from the endpoint and case/whitespace-normalized params."""
+        normalized = sorted(
+            (name, " ".join(str(value).split()).lower())
+            for name, value in params.items()
+            if name not in self.EXCLUDED_PARAMS
+        )
+        digest = hashlib.sha1(json.dumps(normalized).encode(), usedforsecurity=False).hexdigest()
+        return f"weatherapi:{endpoint}:{digest}"
+
+    def stats(self) -> dict:
+        """Return hit/miss/coalesced counters of this process."""
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"] + stats["coalesced"]
+        stats["hit_ratio"] = round((stats["hits"] + stats["coalesced"]) / lookups, 4) if lookups else 0.0
+        return stats
+
+    def _count(self, endpoint: str, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+        UPSTREAM_CACHE_LOOKUPS.labels(endpoint, name).inc()
@@ -1,8 +1,16 @@
 import logging
+import random
+import threading
+import time
 
 import requests
 from django.conf import settings
-from weather.services.exceptions import WeatherAPIError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from weather.metrics import UPSTREAM_REQUEST_SECONDS
+from weather.services.exceptions import RateLimitExceeded, WeatherAPIError
+from weather.services.rate_limiter import QuotaBudget, build_rate_limiter
+from weather.services.upstream_cache import UpstreamCache
 
 logger = logging.getLogger(__name__)
 
@@ -16,21 +24,173 @@ class WeatherAPIClient:
         "history": "https://api.weatherapi.com/v1/history.json",
     }
 
-    def __init__(self):
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    _session = None
+    _upstream_cache = None
+    _rate_limiter = None
+    _rate_limiter_built = False
+    _session_lock = threading.Lock()
+
+    # Waits out the backoff between retries; replaceable in tests
+    sleep = staticmethod(time.sleep)
+
+    def __init__(self, wait_for_rate_limit: bool | None = None):
+        """
+        Args:
+            wait_for_rate_limit (bool | None): Block until the rate limiter allows a call
+                (True) or raise RateLimitExceeded at once (False). Defaults to
+                settings.WEATHER_API_RATE_LIMIT_WAIT.
+        """
         self.api_key = settings.WEATHER_API_KEY
+        self.timeout = (settings.WEATHER_API_CONNECT_TIMEOUT, settings.WEATHER_API_READ_TIMEOUT)
+        self.session = self.get_session()
+        self.upstream_cache = self.get_upstream_cache()
+        self.rate_limiter = self.get_rate_limiter()
+        self.quota = QuotaBudget(settings.WEATHER_API_MONTHLY_QUOTA, settings.WEATHER_API_CACHE_ALIAS)
+        if wait_for_rate_limit is None:
+            wait_for_rate_limit = settings.WEATHER_API_RATE_LIMIT_WAIT
+        self.wait_for_rate_limit = wait_for_rate_limit
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """Return the process-wide pooled session, creating it on first use."""
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    cls._session = cls._build_session()
+        return cls._session
+
+    @classmethod
+    def get_upstream_cache(cls) -> UpstreamCache:
+        """Return the process-wide upstream response cache."""
+        if cls._upstream_cache is None:
+            with cls._session_lock:
+                if cls._upstream_cache is None:
+                    cls._upstream_cache = UpstreamCache(
+                        settings.WEATHER_API_CACHE_ALIAS, settings.WEATHER_API_CACHE_TTL
+                    )
+        return cls._upstream_cache
+
+    @classmethod
+    def get_rate_limiter(cls):
+        """Return the process-wide rate limiter, or None when limiting is disabled."""
+        if not cls._rate_limiter_built:
+            with cls._session_lock:
+                if not cls._rate_limiter_built:
+                    cls._rate_limiter = build_rate_limiter()
+                    cls._rate_limiter_built = True
+        return cls._rate_limiter
+
+    @classmethod
+    def reset_shared_state(cls) -> None:
+        """Drop the shared session, upstream cache and rate limiter; they are rebuilt from current settings."""
+        with cls._session_lock:
+            cls._session = None
+            cls._upstream_cache = None
+            cls._rate_limiter = None
+            cls._rate_limiter_built = False
+
+    @classmethod
+    def cache_stats(cls) -> dict:
+        """Hit/miss/coalesced counters of the upstream cache in this process."""
+        return cls.get_upstream_cache().stats()
+
+    @classmethod
+    def _build_session(cls) -> requests.Session:
+        """
+        Build a keep-alive session with a connection pool.
+
+        The transport only retries failed connection attempts, which never
+        reach WeatherAPI. Error responses and read failures are retried by
+        _request, which reserves quota and a rate-limiter token per attempt.
+        """
+        retry = Retry(
+            total=None,
+            connect=settings.WEATHER_API_MAX_RETRIES,
+            read=0,
+            redirect=0,
+            status=0,
+            other=0,
+            backoff_factor=settings.WEATHER_API_BACKOFF_FACTOR,
+            backoff_jitter=settings.WEATHER_API_BACKOFF_JITTER,
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=settings.WEATHER_API_POOL_CONNECTIONS,
+            pool_maxsize=settings.WEATHER_API_POOL_SIZE,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.headers.update({"Accept": "application/json", "Connection": "keep-alive"})
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def fetch_data(self, endpoint: str, params: dict) -> dict:
         """Public method to fetch data from WeatherAPI."""
         url, full_params = self._prepare_request(endpoint, params)
+        return self.upstream_cache.get_or_fetch(
+            endpoint, full_params, lambda: self._request(endpoint, url, full_params)
+        )
+
+    def _request(self, endpoint: str, url: str, full_params: dict) -> dict:
+        """
+        Call WeatherAPI and return the parsed response.
 
+        429/5xx responses and read failures are retried up to
+        WEATHER_API_MAX_RETRIES times with exponential backoff (or the
+        response's Retry-After). Every attempt is a real upstream call, so
+        each one reserves quota and a rate-limiter token first.
+        """
+        status = "error"
+        started = time.perf_counter()
         try:
-            response = requests.get(url, params=full_params, timeout=5)
-            response.raise_for_status()
-            return self._handle_response(response)
+            for attempt in range(settings.WEATHER_API_MAX_RETRIES + 1):
+                last = attempt == settings.WEATHER_API_MAX_RETRIES
+                self._reserve_call()
+                try:
+                    response = self.session.get(url, params=full_params, timeout=self.timeout)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                    if last:
+                        raise
+                    self.sleep(self._backoff(attempt))
+                    continue
+                status = str(response.status_code)
+                if response.status_code in self.RETRY_STATUSES and not last:
+                    self.sleep(self._backoff(attempt, response))
+                    continue
+                response.raise_for_status()
+                return self._handle_response(response)
         except requests.exceptions.RequestException as e:
             msg = f"Request failed: {str(e)}"
             logger.error(f"Request to WeatherAPI failed: {msg}")
             raise WeatherAPIError(msg) from e
+        finally:
+            UPSTREAM_REQUEST_SECONDS.labels(endpoint, status).observe(time.perf_counter() - started)
+
+    @staticmethod
+    def _backoff(attempt: int, response: requests.Response | None = None) -> float:
+        """Seconds to wait before retry `attempt + 1`: Retry-After if given, else exponential with jitter."""
+        retry_after = response.headers.get("Retry-After", "") if response is not None else ""
+        if retry_after.isdigit():
+            return float(retry_after)
+        jitter = random.uniform(0, settings.WEATHER_API_BACKOFF_JITTER)
+        return settings.WEATHER_API_BACKOFF_FACTOR * 2 ** attempt + jitter
+
+    def _reserve_call(self) -> None:
+        """Reserve one call of the monthly quota and take a rate-limiter token before calling out."""
+        self.quota.reserve()
+        if self.rate_limiter is None:
+            return
+        try:
+            self.rate_limiter.acquire(
+                wait=self.wait_for_rate_limit, timeout=settings.WEATHER_API_RATE_LIMIT_TIMEOUT
+            )
+        except RateLimitExceeded:
+            self.quota.release()
+            raise
 
     def _prepare_request(self, endpoint: str, params: dict) -> tuple[str, dict]:
         """Validate and build URL + params for the request."""
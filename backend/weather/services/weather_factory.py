@@ -1,63 +1,99 @@
 """Factory class for creating weather models from API input."""
 
-from weather.models import WeatherCondition, WeatherData, WindData
+from datetime import datetime
+from datetime import timezone as dt_timezone
+
+from django.db import transaction
+from django.utils import timezone
+from weather.metrics import DB_WRITE_SECONDS, OBSERVATIONS_SKIPPED, record_ingested
+from weather.models import LatestWeather, WeatherData
+from weather.services.alert_service import AlertEngine
+from weather.services.event_service import WeatherEventPublisher
+from weather.services.observation_ledger import ObservationLedger
+from weather.services.response_cache import WeatherResponseCache
 
 
 class WeatherModelFactory:
     """Factory for creating instances of weather-related models."""
+
+    # Reading columns refreshed when a reading for an already stored (city, hour) arrives
+    UPSERT_FIELDS = [
+        "timestamp", "city", "country", "lat", "lon",
+        "temperature", "feels_like", "humidity", "pressure", "precipitation", "dew_point",
+        "wind_speed", "wind_gust", "wind_direction", "wind_degree",
+        "weather_condition", "weather_icon", "cloudiness", "visibility", "uv_index",
+    ]
+
+    @staticmethod
+    def observed_at(data: dict) -> datetime:
+        """
+        Return the observation time of an API record.
+
+        Args:
+            data (dict): A current or hourly weather record.
+
+        Returns:
+            datetime: The hour of an hourly record (`time_epoch`), the upstream
+                update time of a current record (`last_updated_epoch`), otherwise now.
+        """
+        for field in ("time_epoch", "last_updated_epoch"):
+            if data.get(field) is not None:
+                return datetime.fromtimestamp(data[field], tz=dt_timezone.utc)
+        return timezone.now()
+
     @staticmethod
-    def create_wind(data: dict) -> WindData:
+    def wind_fields(data: dict) -> dict:
         """
-        Create a WindData instance from API data.
+        Map API wind data to WeatherData wind columns.
 
         Args:
             data (dict): A dictionary containing wind information.
 
         Returns:
-            WindData: A saved WindData instance.
+            dict: Keyword arguments for the wind columns.
         """
-        return WindData.objects.create(
-            wind_speed=data.get("wind_kph"),
-            wind_gust=data.get("gust_kph"),
-            wind_direction=data.get("wind_dir"),
-            wind_degree=data.get("wind_degree")
-        )
+        return {
+            "wind_speed": data.get("wind_kph"),
+            "wind_gust": data.get("gust_kph"),
+            "wind_direction": data.get("wind_dir"),
+            "wind_degree": data.get("wind_degree"),
+        }
 
     @staticmethod
-    def create_condition(data: dict) -> WeatherCondition:
+    def condition_fields(data: dict) -> dict:
         """
-        Create a WeatherCondition instance from API data.
+        Map API condition data to WeatherData condition columns.
 
         Args:
             data (dict): A dictionary containing weather condition information.
 
         Returns:
-            WeatherCondition: A saved WeatherCondition instance.
+            dict: Keyword arguments for the condition columns.
         """
         condition_data = data.get("condition", {})
-        return WeatherCondition.objects.create(
-            weather_condition=condition_data.get("text", "Unknown"),
-            weather_icon=f"https:{condition_data.get('icon', '')}" if condition_data else None,
-            cloudiness=data.get("cloud"),
-            visibility=data.get("vis_km"),
-            uv_index=data.get("uv")
-        )
+        return {
+            "weather_condition": condition_data.get("text", "Unknown"),
+            "weather_icon": f"https:{condition_data.get('icon', '')}" if condition_data else None,
+            "cloudiness": data.get("cloud"),
+            "visibility": data.get("vis_km"),
+            "uv_index": data.get("uv"),
+        }
 
     @staticmethod
-    def create_weather(city: str, data: dict, wind: WindData, condition: WeatherCondition) -> WeatherData:
+    def build_weather(city: str, data: dict, forecast: bool = False) -> WeatherData:
         """
-        Create a WeatherData instance from full weather information.
+        Build an unsaved WeatherData instance from full weather information.
 
         Args:
             city (str): Name of the city.
             data (dict): A dictionary containing weather data.
-            wind (WindData): Related WindData instance.
-            condition (WeatherCondition): Related WeatherCondition instance.
+            forecast (bool): Whether the record is a forecast hour.
 
         Returns:
-            WeatherData: A saved WeatherData instance.
+            WeatherData: An unsaved WeatherData instance.
         """
-        return WeatherData.objects.create(
+        weather = WeatherData(
+            timestamp=WeatherModelFactory.observed_at(data),
             city=city,
             country=data.get("country", "Unknown"),
             lat=data.get("lat", 0.0),
@@ -68,6 +104,135 @@ class WeatherModelFactory:
             pressure=data.get("pressure_mb"),
             precipitation=data.get("precip_mm"),
             dew_point=data.get("dewpoint_c") if "dewpoint_c" in data else None,
-            wind=wind,
-            condition=condition
+            **WeatherModelFactory.wind_fields(data),
+            **WeatherModelFactory.condition_fields(data),
+            is_forecast=forecast,
+        )
+        weather.fill_keys()
+        return weather
+
+    @staticmethod
+    def create_weather(city: str, data: dict) -> WeatherData | None:
+        """
+        Create or refresh the WeatherData row for the hour of the city's observation.
+
+        Args:
+            city (str): Name of the city.
+            data (dict): A dictionary containing weather data.
+
+        Returns:
+            WeatherData | None: The saved instance, or None when this observation
+                was already stored.
+        """
+        saved = WeatherModelFactory.bulk_create_weather([(city, data)])
+        return saved[0] if saved else None
+
+    @staticmethod
+    def bulk_create_weather(readings: list[tuple[str, dict]], forecast: bool = False) -> list[WeatherData]:
+        """
+        Persist many readings with a single bulk upsert.
+
+        A reading for a (city, hour) that is already stored replaces the stored
+        values instead of adding a row, so no existence check is needed.
+        Current observations that are not newer than the city's stored one
+        (same `last_updated_epoch` polled again) are skipped without any write.
+        The cities' LatestWeather rows are refreshed and the alert rules are
+        evaluated in the same transaction, and readings that became a city's
+        latest are published as live events once it commits.
+
+        Args:
+            readings (list[tuple[str, dict]]): (city, data) pairs, where data holds
+                the merged location and weather fields of one API payload.
+            forecast (bool): Whether the readings are forecast hours. They are
+                stored flagged and never become a city's latest reading; an
+                observation of the same hour later replaces them.
+
+        Returns:
+            list[WeatherData]: The saved instances, one per distinct (city, hour).
+        """
+        ledger = ObservationLedger()
+        readings, skipped = ledger.filter_new(readings)
+        if skipped:
+            OBSERVATIONS_SKIPPED.inc(skipped)
+        if not readings:
+            return []
+
+        weathers = {}
+        observations = []
+        for city, data in readings:
+            weather = WeatherModelFactory.build_weather(city, data, forecast)
+            # A batch may not touch the same conflict key twice; the last reading wins
+            weathers[(weather.city_key, weather.hour)] = weather
+            if ledger.is_current(data):
+                observations.append(weather)
+
+        with transaction.atomic():
+            with DB_WRITE_SECONDS.labels("weather_upsert").time():
+                saved = WeatherData.objects.bulk_create(
+                    list(weathers.values()),
+                    update_conflicts=True,
+                    unique_fields=["city_key", "hour"],
+                    update_fields=[*WeatherModelFactory.UPSERT_FIELDS, "is_forecast"],
+                )
+            with DB_WRITE_SECONDS.labels("latest_upsert").time():
+                advanced = WeatherModelFactory.update_latest(saved)
+            with DB_WRITE_SECONDS.labels("alert_evaluation").time():
+                AlertEngine().evaluate(saved)
+
+        ingested = [city_key for city_key, _ in weathers]
+        transaction.on_commit(lambda: record_ingested(ingested))
+        city_keys = set(ingested)
+        transaction.on_commit(lambda: WeatherResponseCache().invalidate(city_keys))
+        transaction.on_commit(lambda: ledger.remember(observations))
+        if advanced:
+            transaction.on_commit(lambda: WeatherEventPublisher().publish(advanced))
+        return saved
+
+    @staticmethod
+    def update_latest(weathers: list[WeatherData]) -> list[WeatherData]:
+        """
+        Upsert LatestWeather for every city whose newest observation moved forward.
+
+        Forecast hours and readings in the future are not observations and are
+        ignored, as are readings older than the city's stored latest one.
+
+        Args:
+            weathers (list[WeatherData]): Saved readings.
+
+        Returns:
+            list[WeatherData]: The readings that became their city's latest.
+        """
+        now = timezone.now()
+        newest = {}
+        for weather in weathers:
+            if weather.is_forecast or weather.timestamp > now:
+                continue
+            current = newest.get(weather.city_key)
+            if current is None or weather.timestamp >= current.timestamp:
+                newest[weather.city_key] = weather
+        if not newest:
+            return []
+
+        stored = dict(
+            LatestWeather.objects.select_for_update()
+            .filter(city_key__in=newest)
+            .values_list("city_key", "timestamp")
+        )
+        advanced = [
+            weather for city_key, weather in newest.items()
+            if city_key not in stored or stored[city_key] <= weather.timestamp
+        ]
+        LatestWeather.objects.bulk_create(
+            [
+                LatestWeather(
+                    city_key=weather.city_key,
+                    reading_id=weather.pk,
+                    **{field: getattr(weather, field) for field in WeatherModelFactory.UPSERT_FIELDS},
+                )
+                for weather in advanced
+            ],
+            update_conflicts=True,
+            unique_fields=["city_key"],
+            update_fields=[*WeatherModelFactory.UPSERT_FIELDS, "reading_id", "updated_at"],
         )
+        return advanced
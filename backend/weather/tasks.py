@@ -1,12 +1,21 @@
 """Celery tasks for retrieving and displaying current weather data."""
 
 import datetime
-from datetime import datetime
+from datetime import date, datetime
 
 from celery import shared_task
+from django.conf import settings
 
 # from .models import WeatherData
+from .services.backfill_service import BackfillService
 from .services.current_weather_service import CurrentWeatherService
+from .services.forecast_weather_service import ForecastWeatherService
+from .services.ingestion_service import MultiCityIngestionService
+from .services.partition_service import WeatherPartitionManager
+from .services.rate_limiter import QuotaBudget
+from .services.retention_service import WeatherRetentionService
+from .services.scheduler_service import AdaptivePollScheduler
+from .services.weather_api_client import WeatherAPIClient
 
 
 @shared_task
@@ -29,4 +38,106 @@ def get_current_weather_data():
     """
     service = CurrentWeatherService()
     weather = service.get_weather("Boryspil")
-    print(f"In Boryspil now {weather}")
+    if weather is None:
+        print("Boryspil: observation unchanged since the last poll, nothing stored")
+    else:
+        print(f"In Boryspil now {weather}")
+
+
+@shared_task
+def poll_cities_weather(cities=None):
+    """
+    Celery task that fetches current weather for many cities concurrently.
+
+    Polls `cities` (defaults to settings.WEATHER_CITIES) in one round and
+    persists all readings at once. Returns the round's timing stats.
+    """
+    service = MultiCityIngestionService()
+    ingestion_round = service.poll(cities or settings.WEATHER_CITIES)
+    # Tracked cities get their next poll time from how much their weather moved
+    AdaptivePollScheduler().record(ingestion_round.payloads)
+    stats = ingestion_round.as_dict()
+    stats["upstream_cache"] = WeatherAPIClient.cache_stats()
+    print(f"Polled {stats['cities']} cities in {stats['total_seconds']}s: {stats}")
+    return stats
+
+
+@shared_task
+def schedule_city_polls(cities=None, interval_seconds=None):
+    """
+    Celery task that spreads one interval's polls evenly within the API quota.
+
+    Splits `cities` (defaults to settings.WEATHER_CITIES) into batches and
+    schedules a poll_cities_weather task per batch with staggered countdowns.
+    Meant to be run once per interval by celery beat.
+    """
+    interval_seconds = interval_seconds or settings.WEATHER_POLL_INTERVAL_SECONDS
+    budget = QuotaBudget(settings.WEATHER_API_MONTHLY_QUOTA, settings.WEATHER_API_CACHE_ALIAS)
+    plan = budget.plan(cities or settings.WEATHER_CITIES, interval_seconds, settings.WEATHER_POLL_BATCH_SIZE)
+    for delay, batch in plan:
+        poll_cities_weather.apply_async(args=[batch], countdown=delay)
+    return [[delay, len(batch)] for delay, batch in plan]
+
+
+@shared_task
+def dispatch_city_polls():
+    """
+    Celery task that sends every due TrackedCity to its shard's queue.
+
+    Meant to run every WEATHER_POLL_DISPATCH_SECONDS from celery beat (see
+    `manage.py track_cities`). Each city has its own adaptive interval; cities
+    are routed to the queues in WEATHER_POLL_SHARDS by consistent hashing,
+    in batches of WEATHER_POLL_BATCH_SIZE.
+    """
+    plan = AdaptivePollScheduler().dispatch()
+    batch_size = settings.WEATHER_POLL_BATCH_SIZE
+    for shard, cities in plan.items():
+        options = {"queue": shard} if shard else {}
+        for start in range(0, len(cities), batch_size):
+            poll_cities_weather.apply_async(args=[cities[start:start + batch_size]], **options)
+    return {shard or "default": len(cities) for shard, cities in plan.items()}
+
+
+@shared_task
+def get_forecast_weather_data(cities=None, days=3):
+    """
+    Celery task that stores the hourly forecast for each city.
+
+    Hours already stored for a city are skipped; returns hours written per city.
+    """
+    service = ForecastWeatherService()
+    written = {}
+    for city in cities or settings.WEATHER_CITIES:
+        saved = service.get_forecast(city, days)
+        written[city] = len(saved) if isinstance(saved, list) else 0
+    return written
+
+
+@shared_task
+def backfill_weather_chunk(city, days):
+    """
+    Celery task that backfills a chunk of days (ISO dates) for one city.
+
+    Units are checkpointed one by one, so a retried chunk only fetches the
+    days that are still missing. Returns the chunk's throughput stats.
+    """
+    service = BackfillService()
+    day_list = [date.fromisoformat(day) for day in days]
+    units = service.pending_units([city], min(day_list), max(day_list))
+    wanted = set(day_list)
+    units = [(unit_city, day) for unit_city, day in units if day in wanted]
+    return service.run(units, workers=1).as_dict()
+
+
+@shared_task
+def maintain_weather_partitions():
+    """
+    Celery task that keeps WeatherData partitions ahead and applies retention.
+
+    Meant to run daily from celery beat; equivalent to `manage.py manage_partitions`.
+    """
+    created = WeatherPartitionManager().ensure_future(settings.WEATHER_PARTITION_MONTHS_AHEAD)
+    stats = WeatherRetentionService().apply().as_dict()
+    stats["created_partitions"] = created
+    print(f"Weather partitions maintained: {stats}")
+    return stats
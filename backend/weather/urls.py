@@ -1,9 +1,22 @@
 """URL configuration for weather-related API endpoints."""
 
+from django.urls import path
 from rest_framework.routers import DefaultRouter
-from .views import WeatherDataViewSet
+from .async_views import (
+    AsyncWeatherAggregateView,
+    AsyncWeatherLatestView,
+    AsyncWeatherListView,
+    WeatherStreamView,
+)
+from .views import WeatherDataViewSet, WeatherExportView
 
 router = DefaultRouter()
 router.register(r'weather', WeatherDataViewSet, basename='weather')
 
-urlpatterns = router.urls
+urlpatterns = [
+    path('weather/export/', WeatherExportView.as_view(), name='weather-export'),
+    path('async/weather/', AsyncWeatherListView.as_view(), name='weather-async-list'),
+    path('async/weather/latest/', AsyncWeatherLatestView.as_view(), name='weather-async-latest'),
+    path('async/weather/aggregate/', AsyncWeatherAggregateView.as_view(), name='weather-async-aggregate'),
+    path('async/weather/stream/', WeatherStreamView.as_view(), name='weather-stream'),
+] + router.urls
@@ -1,18 +1,235 @@
 """API views for listing and creating weather data entries."""
 
-from rest_framework import viewsets
-from .models import WeatherData
-from .serializers import WeatherDataSerializer
+import numpy as np
+from django.db.models import F
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.text import slugify
+from django.views import View
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from . import metrics
+from .models import LatestWeather, WeatherData, normalize_city
+from .pagination import WeatherKeysetPagination, WeatherPageNumberPagination
+from .serializers import (
+    WeatherAggregateQuerySerializer,
+    WeatherDataRowSerializer,
+    WeatherDataSerializer,
+    WeatherDerivedQuerySerializer,
+    WeatherExportQuerySerializer,
+)
+from .services.aggregation_service import WeatherAggregationService
+from .services.derived_metrics import DerivedMetricsService
+from .services.export_service import ExportFormatUnavailable, WeatherExportService
+from .services.response_cache import WeatherResponseCache
+from .services.timeseries import WeatherSeriesLoader
 
 
 class WeatherDataViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = WeatherDataSerializer
 
+    @property
+    def pagination_class(self):
+        """Page numbers by default; keyset pages with `?cursor=` or `?pagination=keyset`."""
+        params = self.request.query_params
+        if WeatherKeysetPagination.cursor_query_param in params or params.get("pagination") == "keyset":
+            return WeatherKeysetPagination
+        return WeatherPageNumberPagination
+
     def get_queryset(self):
-        queryset = WeatherData.objects.select_related("wind", "condition").all()
+        return self.readings(self.request.query_params.get("city"))
+
+    @staticmethod
+    def readings(city: str | None = None):
+        """Observed readings (no forecast hours), optionally of one city, newest first."""
+        queryset = WeatherData.objects.observations()
+        if city:
+            queryset = queryset.filter(city_key=normalize_city(city))
+        return queryset.order_by("-timestamp", "-id")
 
-        city = self.request.query_params.get("city")
+    @staticmethod
+    def latest_rows(city: str | None = None):
+        """LatestWeather as `.values()` rows for WeatherDataRowSerializer, one per city."""
+        queryset = LatestWeather.objects.order_by("city_key")
         if city:
-            queryset = queryset.filter(city__iexact=city)
+            queryset = queryset.filter(city_key=normalize_city(city))
+        fields = [field for field in WeatherDataRowSerializer.fields if field != "id"]
+        return queryset.values(*fields, id=F("reading_id"))
+
+    def list(self, request, *args, **kwargs):
+        return self._cached(request, lambda: self._list(request))
+
+    def _list(self, request):
+        """List rows via `.values()` and WeatherDataRowSerializer instead of model instances."""
+        queryset = self.filter_queryset(self.get_queryset()).values(*WeatherDataRowSerializer.fields)
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return Response(WeatherDataRowSerializer(queryset).data)
+        return self.get_paginated_response(WeatherDataRowSerializer(page).data)
+
+    @action(detail=False, methods=["get"], url_path="latest")
+    def latest(self, request):
+        """
+        Newest observed reading of every city, or of `?city=` only.
+
+        Served from LatestWeather with one primary-key-ordered read; each entry
+        has the list endpoint's shape and the id of the WeatherData row.
+        """
+        return self._cached(request, lambda: self._latest(request))
+
+    def _latest(self, request):
+        rows = self.latest_rows(request.query_params.get("city"))
+        return Response({"results": WeatherDataRowSerializer(rows).data})
+
+    @action(detail=False, methods=["get"], url_path="aggregate")
+    def aggregate(self, request):
+        """
+        Min/mean/max per metric per hour/day/week bucket for one city.
+
+        Query params: city (required), start, end (ISO 8601), bucket, and
+        optionally points + metric to LTTB-downsample to a target point count.
+        """
+        vary = WeatherAggregateQuerySerializer.cache_vary(request.query_params)
+        return self._cached(request, lambda: self._aggregate(request), vary)
+
+    def _aggregate(self, request):
+        query = WeatherAggregateQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        service = WeatherAggregationService()
+        results = service.aggregate(params["city"], params["start"], params["end"], params["bucket"])
+        return Response(self.aggregate_data(request, params, results))
+
+    @classmethod
+    def aggregate_data(cls, request, params: dict, results) -> dict:
+        """Aggregate response body: optional downsampling plus links to the adjacent ranges."""
+        if "points" in params:
+            results = WeatherAggregationService().downsample(results, params["points"], params["metric"])
+
+        span = params["end"] - params["start"]
+        return {
+            "city": params["city"],
+            "bucket": params["bucket"],
+            "start": params["start"],
+            "end": params["end"],
+            "previous": cls._range_link(request, params["start"] - span, params["start"]),
+            "next": cls._range_link(request, params["end"], params["end"] + span),
+            "results": results,
+        }
+
+    @action(detail=False, methods=["get"], url_path="derived")
+    def derived(self, request):
+        """
+        Heat index, wind chill, dew-point spread and rolling mean/stddev per reading of one city.
+
+        Query params: city (required), start, end (ISO 8601) and window_hours
+        (rolling window length, default 24). The body is columnar: one
+        `timestamps` list and one equally long list per metric.
+        """
+        vary = WeatherDerivedQuerySerializer.cache_vary(request.query_params)
+        return self._cached(request, lambda: self._derived(request), vary)
+
+    def _derived(self, request):
+        query = WeatherDerivedQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        series = WeatherSeriesLoader().load(params["city"], params["start"], params["end"])
+        derived = DerivedMetricsService().compute(series, params["window_hours"])
+        return Response({
+            "city": params["city"],
+            "start": params["start"],
+            "end": params["end"],
+            "window_hours": params["window_hours"],
+            "timestamps": series.isoformat(),
+            "series": {name: self._column(values) for name, values in derived.items()},
+        })
+
+    @staticmethod
+    def _column(values: np.ndarray) -> list:
+        """A metric array as a JSON list: rounded to 2 decimals, NaN as null."""
+        rounded = np.round(values, 2).astype(object)
+        rounded[np.isnan(values)] = None
+        return rounded.tolist()
+
+    @staticmethod
+    def _range_link(request, start, end) -> str:
+        url = replace_query_param(request.build_absolute_uri(), "start", start.isoformat())
+        return replace_query_param(url, "end", end.isoformat())
+
+    def _cached(self, request, build_response, vary=None):
+        """
+        Serve a GET from the response cache, or build and cache it.
+
+        A matching If-None-Match gets 304 without touching the database.
+        `vary` goes into the cache key next to the query string.
+        """
+        city = request.query_params.get("city")
+        response_cache = WeatherResponseCache()
+        key, etag = response_cache.lookup(request, normalize_city(city) if city else None, vary)
+
+        if etag in request.headers.get("If-None-Match", ""):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            data = response_cache.get(key)
+            if data is None:
+                response = build_response()
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+                response_cache.set(key, response.data)
+            else:
+                response = Response(data)
+
+        response["ETag"] = etag
+        response["Cache-Control"] = "no-cache"
+        return response
+
+
+class WeatherExportView(View):
+    """
+    Stream weather history as CSV, NDJSON or Parquet.
+
+    A plain Django view: the body is a generator over a server-side cursor,
+    so it bypasses DRF serializers, renderers and content negotiation.
+    Query params: format (csv|ndjson|parquet), city, start, end.
+    """
+
+    def get(self, request):
+        """Validate the query and stream the matching observations as an attachment."""
+        query = WeatherExportQuerySerializer(data=request.GET)
+        if not query.is_valid():
+            return JsonResponse(query.errors, status=400)
+        params = query.validated_data
+
+        queryset = WeatherData.objects.observations().order_by("timestamp", "id")
+        if params.get("city"):
+            queryset = queryset.filter(city_key=normalize_city(params["city"]))
+        queryset = queryset.between(params.get("start"), params.get("end"))
+
+        export_format = params["format"]
+        try:
+            body = WeatherExportService().stream(queryset, export_format)
+        except ExportFormatUnavailable as e:
+            return JsonResponse({"format": [str(e)]}, status=406)
+
+        content_type, extension = WeatherExportService.FORMATS[export_format]
+        # Slug of the normalized city: raw query text may carry quotes or newlines
+        city = slugify(normalize_city(params["city"])) if params.get("city") else ""
+        filename = f"weather-{city or 'all'}-{timezone.now():%Y%m%d%H%M%S}.{extension}"
+        response = StreamingHttpResponse(body, content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+
+class MetricsView(View):
+    """Prometheus scrape endpoint (GET /metrics)."""
+
+    http_method_names = ["get"]
 
-        return queryset.order_by("-timestamp")
\ No newline at end of file
+    def get(self, request):
+        """Render every registered metric in the Prometheus text format."""
+        body, content_type = metrics.render()
+        return HttpResponse(body, content_type=content_type)
@@ -1,7 +1,15 @@
+// Charts currently on screen, so live readings can be appended without a redraw
+const charts = [];
+
+function formatLabel(timestamp) {
+    return new Date(timestamp).toLocaleString([], { month: "2-digit", day: "2-digit", hour: "2-digit", minute: "2-digit" });
+}
+
 export function renderCharts(entries) {
+    charts.splice(0).forEach(({ chart }) => chart.destroy());
     document.getElementById("charts").innerHTML = "";
   
-    const labels = entries.map(e => new Date(e.timestamp).toLocaleTimeString().slice(0, 5));
+    const labels = entries.map(e => formatLabel(e.timestamp));
   
     const getData = key => entries.map(e => e[key] ?? null);
   
@@ -20,10 +28,10 @@ export function renderCharts(entries) {
       container.innerHTML = `<canvas id="${metric.id}"></canvas>`;
       document.getElementById("charts").appendChild(container);
   
-      new Chart(document.getElementById(metric.id), {
+      const chart = new Chart(document.getElementById(metric.id), {
         type: 'line',
         data: {
-          labels,
+          labels: [...labels],
           datasets: [{
             label: metric.label,
             data: getData(metric.key),
@@ -40,6 +48,26 @@ export function renderCharts(entries) {
           }
         }
       });
+      charts.push({ chart, key: metric.key });
+    }
+  }
+
+// Add a pushed reading to every chart: it updates the point of its hour or starts a new one
+export function appendEntry(entry) {
+    const hour = new Date(entry.timestamp);
+    hour.setUTCMinutes(0, 0, 0);
+    const label = formatLabel(hour);
+
+    for (const { chart, key } of charts) {
+      const labels = chart.data.labels;
+      const values = chart.data.datasets[0].data;
+      if (labels[labels.length - 1] === label) {
+        values[values.length - 1] = entry[key] ?? null;
+      } else {
+        labels.push(label);
+        values.push(entry[key] ?? null);
+      }
+      chart.update("none");
     }
   }
   
\ No newline at end of file
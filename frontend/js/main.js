@@ -1,14 +1,48 @@
 import { fetchWeatherPage } from './api.js';
-import { renderCharts } from './chartRenderer.js';
+import { appendEntry, renderCharts } from './chartRenderer.js';
 import { renderPagination } from './pagination.js';
 
-let currentUrl = "http://localhost:8000/api/weather?city=boryspil";
+// Hourly min/mean/max buckets, downsampled server-side to at most 200 points per chart
+let currentUrl = "http://localhost:8000/api/weather/aggregate/?city=boryspil&bucket=hour&points=200";
+
+// New readings pushed as Server-Sent Events by the ASGI server (web-asgi in docker compose)
+const streamUrl = "http://localhost:8001/api/async/weather/stream/?city=boryspil";
+let stream = null;
+
+function toEntries(buckets) {
+  return buckets.map(bucket => {
+    const entry = { timestamp: bucket.bucket };
+    for (const [key, value] of Object.entries(bucket)) {
+      if (value && typeof value === "object") entry[key] = value.mean;
+    }
+    return entry;
+  });
+}
+
+// Only the range that ends now grows; older ranges stay static
+function followLive(data) {
+  const live = new Date(data.end) >= new Date(Date.now() - 60 * 60 * 1000);
+  if (!live) {
+    stream?.close();
+    stream = null;
+    return;
+  }
+  if (stream) return;
+
+  stream = new EventSource(streamUrl);
+  stream.addEventListener("reading", event => appendEntry(JSON.parse(event.data)));
+  // A 503 (no ASGI server or no Redis) closes the stream for good; the charts stay static
+  stream.addEventListener("error", () => {
+    if (stream?.readyState === EventSource.CLOSED) stream = null;
+  });
+}
 
 async function initDashboard(url) {
   try {
     const data = await fetchWeatherPage(url);
-    renderCharts(data.results);
+    renderCharts(toEntries(data.results));
     renderPagination(data.previous, data.next, initDashboard);
+    followLive(data);
   } catch (err) {
     console.error("Dashboard error:", err);
     document.body.innerHTML += `<p style="color:red;">${err.message}</p>`;